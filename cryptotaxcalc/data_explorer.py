@@ -8,17 +8,92 @@ to support Phase 2 FMV fetching strategy.
 import pandas as pd
 import numpy as np
 from datetime import datetime, date
-from typing import Dict, List, Optional, Tuple, Any
+from typing import Callable, Dict, List, Optional, Tuple, Any
+import io
 import logging
-from pathlib import Path
-import matplotlib.pyplot as plt
-import seaborn as sns
-from collections import Counter
+import textwrap
+import copy
+import weakref
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+from .parser import _write_frame
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Categorical columns summarized per FMV status: analysis key -> (column, top-N)
+FREQUENCY_COLUMNS: Dict[str, Tuple[str, Optional[int]]] = {
+    "transaction_types": ("Type", None),
+    "buy_currencies": ("BuyCurrency", 10),
+    "sell_currencies": ("SellCurrency", 10),
+    "exchanges": ("Exchange", 10),
+}
+
+# Row count from which the per-column frequency tables are built concurrently
+PARALLEL_COUNT_MIN_ROWS = 100_000
+
+# Reductions computed per numeric column: pandas name -> report label
+SUMMARY_STATISTICS: Dict[str, str] = {
+    "sum": "total",
+    "mean": "mean",
+    "median": "median",
+    "min": "min",
+    "max": "max",
+}
+
+# Amount columns summarized in value patterns: column -> report label
+AMOUNT_COLUMNS: Dict[str, str] = {
+    "BuyAmount": "buy_amount",
+    "SellAmount": "sell_amount",
+    "FeeAmount": "fee_amount",
+}
+
+# Recent analyses keyed by a cheap DataFrame signature, evicted least recently
+# used first. Values are (weak reference to the analyzed frame, analysis,
+# missing-FMV frequency Series).
+ANALYSIS_CACHE_SIZE = 50
+_ANALYSIS_CACHE: OrderedDict = OrderedDict()
+
+
+def _missing_value_mask(values: pd.Series) -> np.ndarray:
+    """Boolean NaN mask of a column, using np.isnan directly on float arrays."""
+    array = values.to_numpy()
+    if array.dtype.kind == "f":
+        return np.isnan(array)
+    return pd.isna(array)
+
+
+def _top_counts(
+    categories: pd.Index, counts: np.ndarray, limit: Optional[int], name: Any
+) -> pd.Series:
+    """
+    Turn per-category counts into a value_counts-style Series.
+
+    Unobserved categories are dropped and the rest ordered by descending count.
+    With a limit, the top entries are picked with ``argpartition`` so only
+    those need sorting.
+    """
+    observed = np.flatnonzero(counts)
+    if limit is not None and len(observed) > limit:
+        top = np.argpartition(-counts[observed], limit - 1)[:limit]
+        observed = observed[top]
+    order = observed[np.argsort(-counts[observed], kind="stable")]
+    return pd.Series(counts[order], index=categories[order].rename(name), name="count")
+
+
+def _analysis_cache_key(df: pd.DataFrame, missing_count: int) -> Tuple[Any, ...]:
+    """
+    Key a DataFrame by identity and structure instead of hashing its contents.
+
+    Object id, length, columns and missing-FMV count are all O(1) given the
+    count the analysis needs anyway. Cache hits additionally require the
+    entry's weak reference to still point at this frame, so a recycled id
+    can never match.
+    """
+    return (id(df), len(df), tuple(df.columns), missing_count)
+
 
 class DataExplorer:
     """
@@ -31,20 +106,68 @@ class DataExplorer:
     def __init__(self):
         """Initialize the data explorer."""
         self.analysis_results: Dict[str, Any] = {}
-        self.missing_fmv_data: pd.DataFrame = None
-        self.available_fmv_data: pd.DataFrame = None
+        self._analysis_source: Optional[pd.DataFrame] = None
+        self._analyzed_data: Optional[pd.DataFrame] = None
+        self._missing_mask: Optional[np.ndarray] = None
+        self._row_selections: Dict[bool, pd.DataFrame] = {}
+        self._missing_frequencies: Dict[str, pd.Series] = {}
+
+    @property
+    def missing_fmv_data(self) -> Optional[pd.DataFrame]:
+        """Analyzed transactions whose FMV (USDEquivalent) is missing."""
+        return self._select_rows(missing=True)
+
+    @property
+    def available_fmv_data(self) -> Optional[pd.DataFrame]:
+        """Analyzed transactions that already have an FMV (USDEquivalent)."""
+        return self._select_rows(missing=False)
+
+    def _select_rows(self, missing: bool) -> Optional[pd.DataFrame]:
+        """
+        Select the missing or available FMV rows on first access.
+
+        The analysis itself only reads the columns it needs, so the full row
+        slices are materialized only when a caller asks for them.
+        """
+        self._prepare_analyzed_data()
+        if self._analyzed_data is None:
+            return None
+
+        if missing not in self._row_selections:
+            mask = self._missing_mask if missing else ~self._missing_mask
+            self._row_selections[missing] = self._analyzed_data.loc[mask]
+        return self._row_selections[missing]
+
+    def _prepare_analyzed_data(self) -> None:
+        """
+        Coerce the analyzed frame and mask its missing FMV rows, once.
+
+        A cached analysis needs neither, so after a cache hit this only runs
+        when the analyzed rows are actually requested.
+        """
+        if self._analyzed_data is None and self._analysis_source is not None:
+            self._analyzed_data = self._coerce_dtypes(self._analysis_source)
+            self._missing_mask = _missing_value_mask(
+                self._analyzed_data["USDEquivalent"]
+            )
 
     def analyze_missing_fmv(self, df: pd.DataFrame) -> Dict[str, Any]:
         """
         Analyze missing FMV data patterns.
 
+        Results are memoized per DataFrame object, so re-analyzing the same,
+        unmodified frame (e.g. report and export runs over one frame) returns
+        the cached analysis, including its original timestamp. In-place edits
+        that keep the row count, columns and missing-FMV count are not
+        detected; pass a new frame after such edits.
+
         Args:
             df: DataFrame from Phase 1A parser output
 
         Returns:
             Dictionary with comprehensive missing FMV analysis
         """
-        logger.info(f"Starting missing FMV analysis for {len(df)} transactions")
+        logger.info("Starting missing FMV analysis for %d transactions", len(df))
 
         # Handle empty DataFrame
         if df.empty:
@@ -77,24 +200,46 @@ class DataExplorer:
                 "recommendations": {"error": "USDEquivalent column not found"},
             }
 
-        # Split data into missing and available FMV
-        missing_mask = df["USDEquivalent"].isna()
-        self.missing_fmv_data = df[missing_mask].copy()
-        self.available_fmv_data = df[~missing_mask].copy()
+        # The coerced frame and missing-FMV mask are only built if needed
+        self._analysis_source = df
+        self._analyzed_data = None
+        self._missing_mask = None
+        self._row_selections = {}
 
         # Calculate basic statistics
         total_transactions = len(df)
-        missing_count = len(self.missing_fmv_data)
-        available_count = len(self.available_fmv_data)
+        missing_count = int(df["USDEquivalent"].isna().sum())
+        available_count = total_transactions - missing_count
         missing_percentage = (missing_count / total_transactions) * 100
 
         logger.info(
-            f"Missing FMV: {missing_count}/{total_transactions} ({missing_percentage:.1f}%)"
+            "Missing FMV: %d/%d (%.1f%%)",
+            missing_count,
+            total_transactions,
+            missing_percentage,
         )
 
+        # The same frame was analyzed recently: reuse that analysis
+        cache_key = _analysis_cache_key(df, missing_count)
+        cached = _ANALYSIS_CACHE.get(cache_key)
+        if cached is not None and cached[0]() is df:
+            _ANALYSIS_CACHE.move_to_end(cache_key)
+            self._missing_frequencies = cached[2]
+            self.analysis_results = copy.deepcopy(cached[1])
+            return self.analysis_results
+
+        # Encode low-cardinality string columns once for all downstream
+        # counting and mask the missing FMV rows; the row slices themselves
+        # are only selected if missing/available_fmv_data is read
+        self._prepare_analyzed_data()
+        df = self._analyzed_data
+
+        # Frequency tables for both slices in one grouped pass per column
+        frequencies = self._count_by_fmv_status(df, self._missing_mask)
+
         # Perform detailed analysis
-        missing_analysis = self._analyze_missing_patterns()
-        available_analysis = self._analyze_available_patterns()
+        missing_analysis = self._analyze_missing_patterns(frequencies[True])
+        available_analysis = self._analyze_available_patterns(frequencies[False])
 
         analysis = {
             "summary": {
@@ -106,30 +251,128 @@ class DataExplorer:
             },
             "missing_fmv_analysis": missing_analysis,
             "available_fmv_analysis": available_analysis,
-            "recommendations": self._generate_recommendations_with_data(
-                missing_analysis, total_transactions, missing_count
+            "recommendations": self._generate_recommendations(
+                missing_analysis, total_transactions, missing_count, frequencies[True]
             ),
         }
 
+        # Keep the raw frequency Series next to their dict form for the report
+        self._missing_frequencies = frequencies[True]
+        _ANALYSIS_CACHE[cache_key] = (
+            weakref.ref(self._analysis_source),
+            copy.deepcopy(analysis),
+            self._missing_frequencies,
+        )
+        if len(_ANALYSIS_CACHE) > ANALYSIS_CACHE_SIZE:
+            _ANALYSIS_CACHE.popitem(last=False)
+
         self.analysis_results = analysis
         return analysis
 
-    def _analyze_missing_patterns(self) -> Dict[str, Any]:
-        """Analyze patterns in missing FMV data."""
-        if self.missing_fmv_data.empty:
-            return {"error": "No missing FMV data to analyze"}
+    def _coerce_dtypes(self, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Convert the low-cardinality string columns to ``category`` dtype.
 
-        df = self.missing_fmv_data
+        Counting and grouping then run on small integer codes instead of
+        hashing Python strings. The caller's DataFrame is left untouched: the
+        result is a shallow copy with only the converted columns replaced.
+        Amount columns keep float64 so USD totals are not rounded.
+
+        Args:
+            df: Transaction DataFrame
+
+        Returns:
+            DataFrame with categorical Type/currency/exchange columns
+        """
+        columns = [
+            column
+            for column, _ in FREQUENCY_COLUMNS.values()
+            if column in df.columns
+            and not isinstance(df[column].dtype, pd.CategoricalDtype)
+        ]
+        if not columns:
+            return df
+
+        coerced = df.copy(deep=False)
+        for column in columns:
+            coerced[column] = df[column].astype("category")
+        return coerced
+
+    def _count_by_fmv_status(
+        self, df: pd.DataFrame, missing_mask: np.ndarray
+    ) -> Dict[bool, Dict[str, pd.Series]]:
+        """
+        Build the categorical frequency tables for missing and available FMV rows.
+
+        Each column is scanned once, cross-tabulated against the missing-FMV mask,
+        instead of running separate ``value_counts`` over two slices. The columns are
+        independent, so large frames count them concurrently on a thread pool
+        (the pandas hashing/sorting kernels release the GIL).
+
+        Args:
+            df: Full transaction DataFrame
+            missing_mask: Boolean array, True where USDEquivalent is missing
+
+        Returns:
+            Mapping of mask value (True = missing) to analysis key -> counts
+        """
+        jobs = FREQUENCY_COLUMNS.values()
+
+        def count(job: Tuple[str, Optional[int]]) -> Dict[bool, pd.Series]:
+            column, limit = job
+            return self._count_column(df[column], missing_mask, limit)
+
+        if len(df) >= PARALLEL_COUNT_MIN_ROWS:
+            with ThreadPoolExecutor(max_workers=len(FREQUENCY_COLUMNS)) as executor:
+                results = list(executor.map(count, jobs))
+        else:
+            results = [count(job) for job in jobs]
+
+        frequencies: Dict[bool, Dict[str, pd.Series]] = {True: {}, False: {}}
+        for key, column_counts in zip(FREQUENCY_COLUMNS, results):
+            for flag in (True, False):
+                frequencies[flag][key] = column_counts[flag]
+
+        return frequencies
+
+    @staticmethod
+    def _count_column(
+        values: pd.Series, missing_mask: np.ndarray, limit: Optional[int]
+    ) -> Dict[bool, pd.Series]:
+        """Count one column's values separately for missing and available FMV rows."""
+        if not isinstance(values.dtype, pd.CategoricalDtype):
+            values = values.astype("category")
+        categories = values.cat.categories
+        codes = values.cat.codes.to_numpy()
+
+        # Count (category code, missing flag) pairs in a single bincount over
+        # the integer codes; code -1 marks a missing value and is skipped
+        valid = codes >= 0
+        paired = codes[valid].astype(np.int64) * 2 + missing_mask[valid]
+        table = np.bincount(paired, minlength=2 * len(categories)).reshape(-1, 2)
+
+        column_counts: Dict[bool, pd.Series] = {}
+        for flag in (True, False):
+            column_counts[flag] = _top_counts(
+                categories, table[:, int(flag)], limit, values.name
+            )
 
-        # Analyze by transaction type
-        type_analysis = df["Type"].value_counts().to_dict()
+        return column_counts
 
-        # Analyze by currency
-        buy_currency_analysis = df["BuyCurrency"].value_counts().head(10).to_dict()
-        sell_currency_analysis = df["SellCurrency"].value_counts().head(10).to_dict()
+    def _analyze_missing_patterns(
+        self, frequencies: Dict[str, pd.Series]
+    ) -> Dict[str, Any]:
+        """Analyze patterns in missing FMV data."""
+        if not self._missing_mask.any():
+            return {"error": "No missing FMV data to analyze"}
 
-        # Analyze by exchange
-        exchange_analysis = df["Exchange"].value_counts().head(10).to_dict()
+        # Only the date and amount columns of the missing rows are needed
+        columns = [
+            column
+            for column in ("Date", "UpdatedAt", *AMOUNT_COLUMNS)
+            if column in self._analyzed_data.columns
+        ]
+        df = self._analyzed_data.loc[self._missing_mask, columns]
 
         # Analyze by date patterns
         date_analysis = self._analyze_date_patterns(df)
@@ -138,162 +381,103 @@ class DataExplorer:
         value_analysis = self._analyze_value_patterns(df)
 
         return {
-            "transaction_types": type_analysis,
-            "buy_currencies": buy_currency_analysis,
-            "sell_currencies": sell_currency_analysis,
-            "exchanges": exchange_analysis,
+            **{key: counts.to_dict() for key, counts in frequencies.items()},
             "date_patterns": date_analysis,
             "value_patterns": value_analysis,
         }
 
-    def _analyze_available_patterns(self) -> Dict[str, Any]:
+    def _analyze_available_patterns(
+        self, frequencies: Dict[str, pd.Series]
+    ) -> Dict[str, Any]:
         """Analyze patterns in available FMV data for comparison."""
-        if self.available_fmv_data.empty:
+        if self._missing_mask.all():
             return {"error": "No available FMV data to analyze"}
 
-        df = self.available_fmv_data
-
-        # Analyze by transaction type
-        type_analysis = df["Type"].value_counts().to_dict()
-
-        # Analyze by currency
-        buy_currency_analysis = df["BuyCurrency"].value_counts().head(10).to_dict()
-        sell_currency_analysis = df["SellCurrency"].value_counts().head(10).to_dict()
+        usd_values = self._analyzed_data["USDEquivalent"][~self._missing_mask]
 
-        # Analyze by exchange
-        exchange_analysis = df["Exchange"].value_counts().head(10).to_dict()
-
-        # Analyze USD equivalent values
+        # Analyze USD equivalent values (all reductions in one .agg() call)
+        usd_reductions = usd_values.agg([*SUMMARY_STATISTICS, "std"])
         usd_stats = {
-            "total_value": df["USDEquivalent"].sum(),
-            "mean_value": df["USDEquivalent"].mean(),
-            "median_value": df["USDEquivalent"].median(),
-            "min_value": df["USDEquivalent"].min(),
-            "max_value": df["USDEquivalent"].max(),
-            "std_value": df["USDEquivalent"].std(),
+            f"{SUMMARY_STATISTICS.get(stat, stat)}_value": value
+            for stat, value in usd_reductions.items()
         }
 
         return {
-            "transaction_types": type_analysis,
-            "buy_currencies": buy_currency_analysis,
-            "sell_currencies": sell_currency_analysis,
-            "exchanges": exchange_analysis,
+            **{key: counts.to_dict() for key, counts in frequencies.items()},
             "usd_value_stats": usd_stats,
         }
 
     def _analyze_date_patterns(self, df: pd.DataFrame) -> Dict[str, Any]:
         """Analyze date patterns in missing FMV data."""
-        if df.empty or df["Date"].isna().all():
-            return {"error": "No valid dates to analyze"}
+        # Work on the date Series directly; no filtered frame or helper columns
+        has_date = df["Date"].notna()
+        dates = df["Date"][has_date]
 
-        # Remove rows with missing dates
-        df_with_dates = df.dropna(subset=["Date"])
-
-        if df_with_dates.empty:
-            return {"error": "No valid dates after filtering"}
+        if dates.empty:
+            return {"error": "No valid dates to analyze"}
 
         # Analyze by month
-        df_with_dates["Month"] = df_with_dates["Date"].dt.to_period("M")
-        monthly_counts = df_with_dates["Month"].value_counts().sort_index()
+        monthly_counts = dates.dt.to_period("M").value_counts().sort_index()
 
         # Analyze by day of week
-        df_with_dates["DayOfWeek"] = df_with_dates["Date"].dt.day_name()
-        day_of_week_counts = df_with_dates["DayOfWeek"].value_counts()
+        day_of_week_counts = dates.dt.day_name().value_counts()
 
         # Analyze by hour (if available)
         hour_analysis = {}
-        if (
-            "UpdatedAt" in df_with_dates.columns
-            and not df_with_dates["UpdatedAt"].isna().all()
-        ):
-            df_with_dates["Hour"] = df_with_dates["UpdatedAt"].dt.hour
-            hour_analysis = df_with_dates["Hour"].value_counts().sort_index().to_dict()
+        if "UpdatedAt" in df.columns:
+            updated_at = df["UpdatedAt"][has_date].dropna()
+            if not updated_at.empty:
+                hour_analysis = updated_at.dt.hour.value_counts().sort_index().to_dict()
 
         return {
             "monthly_distribution": monthly_counts.to_dict(),
             "day_of_week_distribution": day_of_week_counts.to_dict(),
             "hour_distribution": hour_analysis,
             "date_range": {
-                "start": df_with_dates["Date"].min().strftime("%Y-%m-%d"),
-                "end": df_with_dates["Date"].max().strftime("%Y-%m-%d"),
+                "start": dates.min().strftime("%Y-%m-%d"),
+                "end": dates.max().strftime("%Y-%m-%d"),
             },
         }
 
     def _analyze_value_patterns(self, df: pd.DataFrame) -> Dict[str, Any]:
         """Analyze value patterns in missing FMV data."""
-        # Analyze BuyAmount patterns
-        buy_amount_stats = {}
-        if "BuyAmount" in df.columns and not df["BuyAmount"].isna().all():
-            buy_amount_stats = {
-                "total_buy_amount": df["BuyAmount"].sum(),
-                "mean_buy_amount": df["BuyAmount"].mean(),
-                "median_buy_amount": df["BuyAmount"].median(),
-                "min_buy_amount": df["BuyAmount"].min(),
-                "max_buy_amount": df["BuyAmount"].max(),
-                "zero_buy_amount_count": (df["BuyAmount"] == 0).sum(),
-            }
-
-        # Analyze SellAmount patterns
-        sell_amount_stats = {}
-        if "SellAmount" in df.columns and not df["SellAmount"].isna().all():
-            sell_amount_stats = {
-                "total_sell_amount": df["SellAmount"].sum(),
-                "mean_sell_amount": df["SellAmount"].mean(),
-                "median_sell_amount": df["SellAmount"].median(),
-                "min_sell_amount": df["SellAmount"].min(),
-                "max_sell_amount": df["SellAmount"].max(),
-                "zero_sell_amount_count": (df["SellAmount"] == 0).sum(),
-            }
-
-        # Analyze FeeAmount patterns
-        fee_amount_stats = {}
-        if "FeeAmount" in df.columns and not df["FeeAmount"].isna().all():
-            fee_amount_stats = {
-                "total_fee_amount": df["FeeAmount"].sum(),
-                "mean_fee_amount": df["FeeAmount"].mean(),
-                "median_fee_amount": df["FeeAmount"].median(),
-                "min_fee_amount": df["FeeAmount"].min(),
-                "max_fee_amount": df["FeeAmount"].max(),
-                "zero_fee_amount_count": (df["FeeAmount"] == 0).sum(),
-            }
-
-        return {
-            "buy_amount_stats": buy_amount_stats,
-            "sell_amount_stats": sell_amount_stats,
-            "fee_amount_stats": fee_amount_stats,
+        value_stats: Dict[str, Any] = {
+            f"{label}_stats": {} for label in AMOUNT_COLUMNS.values()
         }
 
-    def _generate_recommendations(self) -> Dict[str, Any]:
-        """Generate recommendations for Phase 2 FMV fetching strategy."""
-        if not self.analysis_results:
-            return {"error": "No analysis results available"}
-
-        summary = self.analysis_results["summary"]
-        missing_analysis = self.analysis_results["missing_fmv_analysis"]
-
-        # Check if missing analysis has an error
-        if "error" in missing_analysis:
-            return {"error": f"Missing FMV analysis error: {missing_analysis['error']}"}
-
-        # Check if we have valid missing FMV data
-        if self.missing_fmv_data is None or self.missing_fmv_data.empty:
-            return {"error": "No missing FMV data to analyze"}
+        # Only summarize amount columns that exist and hold at least one value
+        columns = [
+            column
+            for column in AMOUNT_COLUMNS
+            if column in df.columns and df[column].notna().any()
+        ]
+        if not columns:
+            return value_stats
+
+        # One .agg() call covers every reduction for every amount column
+        reductions = df[columns].agg(list(SUMMARY_STATISTICS))
+
+        # Zero counts for all columns in one pass over the raw 2-D array
+        # (NaN compares unequal to 0, so missing amounts are not counted)
+        zero_counts = np.count_nonzero(df[columns].to_numpy() == 0, axis=0)
+
+        for column, zero_count in zip(columns, zero_counts):
+            label = AMOUNT_COLUMNS[column]
+            column_stats = {
+                f"{SUMMARY_STATISTICS[stat]}_{label}": reductions.at[stat, column]
+                for stat in SUMMARY_STATISTICS
+            }
+            column_stats[f"zero_{label}_count"] = int(zero_count)
+            value_stats[f"{label}_stats"] = column_stats
 
-        recommendations = {
-            "priority_currencies": self._identify_priority_currencies(),
-            "priority_exchanges": self._identify_priority_exchanges(),
-            "priority_transaction_types": self._identify_priority_transaction_types(),
-            "fmv_fetching_strategy": self._generate_fmv_strategy(),
-            "estimated_effort": self._estimate_effort(),
-        }
+        return value_stats
 
-        return recommendations
-
-    def _generate_recommendations_with_data(
+    def _generate_recommendations(
         self,
         missing_analysis: Dict[str, Any],
         total_transactions: int,
         missing_count: int,
+        missing_counts: Dict[str, pd.Series],
     ) -> Dict[str, Any]:
         """Generate recommendations for Phase 2 FMV fetching strategy."""
         if not missing_analysis:
@@ -304,32 +488,24 @@ class DataExplorer:
             return {"error": f"Missing FMV analysis error: {missing_analysis['error']}"}
 
         # Check if we have valid missing FMV data
-        if self.missing_fmv_data is None or self.missing_fmv_data.empty:
+        if missing_count == 0:
             return {"error": "No missing FMV data to analyze"}
 
         missing_percentage = (missing_count / total_transactions) * 100
 
         recommendations = {
-            "priority_currencies": self._identify_priority_currencies_with_data(
-                missing_analysis
-            ),
-            "priority_exchanges": self._identify_priority_exchanges_with_data(
-                missing_analysis
-            ),
-            "priority_transaction_types": self._identify_priority_transaction_types_with_data(
+            "priority_currencies": self._identify_priority_currencies(missing_counts),
+            "priority_exchanges": self._identify_priority_exchanges(missing_analysis),
+            "priority_transaction_types": self._identify_priority_transaction_types(
                 missing_analysis
             ),
-            "fmv_fetching_strategy": self._generate_fmv_strategy_with_data(
-                missing_percentage
-            ),
-            "estimated_effort": self._estimate_effort_with_data(missing_count),
+            "fmv_fetching_strategy": self._generate_fmv_strategy(missing_percentage),
+            "estimated_effort": self._estimate_effort(missing_count),
         }
 
         return recommendations
 
-    def _generate_fmv_strategy_with_data(
-        self, missing_percentage: float
-    ) -> Dict[str, Any]:
+    def _generate_fmv_strategy(self, missing_percentage: float) -> Dict[str, Any]:
         """Generate FMV fetching strategy recommendations."""
         strategy = {
             "overall_approach": "Multi-source FMV fetching with caching",
@@ -347,7 +523,7 @@ class DataExplorer:
 
         return strategy
 
-    def _estimate_effort_with_data(self, missing_count: int) -> Dict[str, Any]:
+    def _estimate_effort(self, missing_count: int) -> Dict[str, Any]:
         """Estimate effort required for Phase 2 FMV implementation."""
         # Rough estimates based on missing transaction count
         api_calls_needed = missing_count * 1.2  # 20% buffer for retries
@@ -365,25 +541,22 @@ class DataExplorer:
             "complexity": "MEDIUM" if missing_count < 5000 else "HIGH",
         }
 
-    def _identify_priority_currencies_with_data(
-        self, missing_analysis: Dict[str, Any]
+    def _identify_priority_currencies(
+        self, missing_counts: Dict[str, pd.Series]
     ) -> List[str]:
         """Identify priority currencies for FMV fetching."""
-        if "buy_currencies" not in missing_analysis:
+        if "buy_currencies" not in missing_counts:
             return []
 
-        buy_currencies = missing_analysis["buy_currencies"]
-        sell_currencies = missing_analysis["sell_currencies"]
-
-        # Combine and count all currencies
-        all_currencies = Counter()
-        all_currencies.update(buy_currencies)
-        all_currencies.update(sell_currencies)
+        # Combine buy and sell counts per currency (index-aligned add)
+        all_currencies = missing_counts["buy_currencies"].add(
+            missing_counts["sell_currencies"], fill_value=0
+        )
 
         # Return top 10 currencies by frequency
-        return [currency for currency, count in all_currencies.most_common(10)]
+        return all_currencies.nlargest(10).index.tolist()
 
-    def _identify_priority_exchanges_with_data(
+    def _identify_priority_exchanges(
         self, missing_analysis: Dict[str, Any]
     ) -> List[str]:
         """Identify priority exchanges for FMV fetching."""
@@ -393,7 +566,7 @@ class DataExplorer:
         exchanges = missing_analysis["exchanges"]
         return [exchange for exchange, count in exchanges.items() if count > 0]
 
-    def _identify_priority_transaction_types_with_data(
+    def _identify_priority_transaction_types(
         self, missing_analysis: Dict[str, Any]
     ) -> List[str]:
         """Identify priority transaction types for FMV fetching."""
@@ -403,50 +576,14 @@ class DataExplorer:
         transaction_types = missing_analysis["transaction_types"]
         return [tx_type for tx_type, count in transaction_types.items() if count > 0]
 
-    def _generate_fmv_strategy(self) -> Dict[str, Any]:
-        """Generate FMV fetching strategy recommendations."""
-        missing_percentage = self.analysis_results["summary"]["missing_fmv_percentage"]
-
-        strategy = {
-            "overall_approach": "Multi-source FMV fetching with caching",
-            "priority_level": "HIGH" if missing_percentage > 30 else "MEDIUM",
-            "recommended_sources": [
-                "CoinGecko API (primary)",
-                "CoinMarketCap API (secondary)",
-                "Etherscan API (for Ethereum tokens)",
-                "Local cache database",
-            ],
-            "caching_strategy": "SQLite database with daily updates",
-            "rate_limiting": "Implement exponential backoff for API calls",
-            "fallback_strategy": "Use nearest available date FMV",
-        }
-
-        return strategy
-
-    def _estimate_effort(self) -> Dict[str, Any]:
-        """Estimate effort required for Phase 2 FMV implementation."""
-        missing_count = self.analysis_results["summary"]["missing_fmv_count"]
-
-        # Rough estimates based on missing transaction count
-        api_calls_needed = missing_count * 1.2  # 20% buffer for retries
-        estimated_time_hours = max(
-            1, missing_count / 1000
-        )  # 1000 transactions per hour
-        estimated_cost_usd = max(
-            0, (api_calls_needed - 10000) * 0.0001
-        )  # Free tier + paid
-
-        return {
-            "estimated_api_calls": int(api_calls_needed),
-            "estimated_time_hours": round(estimated_time_hours, 1),
-            "estimated_cost_usd": round(estimated_cost_usd, 2),
-            "complexity": "MEDIUM" if missing_count < 5000 else "HIGH",
-        }
-
     def generate_report(self, output_path: Optional[str] = None) -> str:
         """
         Generate a comprehensive analysis report.
 
+        When ``output_path`` is given each line is streamed into the file as
+        it is written, rather than the file being written from the finished
+        report.
+
         Args:
             output_path: Optional path to save report
 
@@ -456,137 +593,147 @@ class DataExplorer:
         if not self.analysis_results:
             return "No analysis results available. Run analyze_missing_fmv() first."
 
-        report_lines = []
-        report_lines.append("=" * 60)
-        report_lines.append("CRYPTOTAXCALC - MISSING FMV DATA ANALYSIS REPORT")
-        report_lines.append("=" * 60)
-        report_lines.append(
-            f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}"
-        )
-        report_lines.append("")
+        # Save to file if path provided
+        if output_path:
+            buffer = io.StringIO()
+            try:
+                with open(output_path, "w") as f:
+
+                    def write(text: str) -> None:
+                        f.write(text)
+                        buffer.write(text)
+
+                    self._write_report(write)
+                logger.info(f"Report saved to {output_path}")
+                return buffer.getvalue()
+            except Exception as e:
+                logger.error(f"Error saving report: {str(e)}")
+
+        buffer = io.StringIO()
+        self._write_report(buffer.write)
+        return buffer.getvalue()
+
+    def _missing_frequency(self, key: str) -> pd.Series:
+        """Missing-FMV frequency table as a Series, rebuilt from the dict if needed."""
+        if key in self._missing_frequencies:
+            return self._missing_frequencies[key]
+        counts = self.analysis_results["missing_fmv_analysis"][key]
+        return pd.Series(counts, dtype="int64")
+
+    def _write_report(self, write: Callable[[str], Any]) -> None:
+        """
+        Write the analysis report line by line.
+
+        Args:
+            write: Text sink, e.g. a file handle's or StringIO's ``write``
+        """
+
+        def line(text: str = "") -> None:
+            write(text + "\n")
+
+        line("=" * 60)
+        line("CRYPTOTAXCALC - MISSING FMV DATA ANALYSIS REPORT")
+        line("=" * 60)
+        line(f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+        line()
 
         # Summary section
         summary = self.analysis_results["summary"]
-        report_lines.append("SUMMARY")
-        report_lines.append("-" * 20)
-        report_lines.append(f"Total Transactions: {summary['total_transactions']:,}")
-        report_lines.append(
-            f"Missing FMV: {summary['missing_fmv_count']:,} ({summary['missing_fmv_percentage']:.1f}%)"
+        line("SUMMARY")
+        line("-" * 20)
+        line(f"Total Transactions: {summary['total_transactions']:,}")
+        line(
+            f"Missing FMV: {summary['missing_fmv_count']:,} "
+            f"({summary['missing_fmv_percentage']:.1f}%)"
         )
-        report_lines.append(f"Available FMV: {summary['available_fmv_count']:,}")
-        report_lines.append("")
+        line(f"Available FMV: {summary['available_fmv_count']:,}")
+        line()
 
         # Missing FMV Analysis
         missing_analysis = self.analysis_results["missing_fmv_analysis"]
         if "error" not in missing_analysis:
-            report_lines.append("MISSING FMV ANALYSIS")
-            report_lines.append("-" * 25)
-
-            # Transaction types
-            if "transaction_types" in missing_analysis:
-                report_lines.append("Top Transaction Types (Missing FMV):")
-                for tx_type, count in list(
-                    missing_analysis["transaction_types"].items()
-                )[:5]:
-                    report_lines.append(f"  {tx_type}: {count:,}")
-                report_lines.append("")
-
-            # Currencies
-            if "buy_currencies" in missing_analysis:
-                report_lines.append("Top Buy Currencies (Missing FMV):")
-                for currency, count in list(missing_analysis["buy_currencies"].items())[
-                    :5
-                ]:
-                    report_lines.append(f"  {currency}: {count:,}")
-                report_lines.append("")
-
-            # Exchanges
-            if "exchanges" in missing_analysis:
-                report_lines.append("Top Exchanges (Missing FMV):")
-                for exchange, count in list(missing_analysis["exchanges"].items())[:5]:
-                    report_lines.append(f"  {exchange}: {count:,}")
-                report_lines.append("")
+            line("MISSING FMV ANALYSIS")
+            line("-" * 25)
+
+            sections = (
+                ("transaction_types", "Top Transaction Types (Missing FMV):"),
+                ("buy_currencies", "Top Buy Currencies (Missing FMV):"),
+                ("exchanges", "Top Exchanges (Missing FMV):"),
+            )
+            for key, title in sections:
+                if key in missing_analysis:
+                    line(title)
+                    top_counts = self._missing_frequency(key).head(5)
+                    if not top_counts.empty:
+                        # One aligned pandas render instead of a line per entry
+                        formatted = top_counts.map("{:,}".format).rename_axis(None)
+                        line(textwrap.indent(formatted.to_string(), "  "))
+                    line()
 
         # Recommendations
         recommendations = self.analysis_results["recommendations"]
         if "error" not in recommendations:
-            report_lines.append("RECOMMENDATIONS FOR PHASE 2")
-            report_lines.append("-" * 30)
+            line("RECOMMENDATIONS FOR PHASE 2")
+            line("-" * 30)
 
             # Priority currencies
             if "priority_currencies" in recommendations:
-                report_lines.append("Priority Currencies for FMV Fetching:")
+                line("Priority Currencies for FMV Fetching:")
                 for currency in recommendations["priority_currencies"][:5]:
-                    report_lines.append(f"  - {currency}")
-                report_lines.append("")
+                    line(f"  - {currency}")
+                line()
 
             # FMV Strategy
             if "fmv_fetching_strategy" in recommendations:
                 strategy = recommendations["fmv_fetching_strategy"]
-                report_lines.append("Recommended FMV Fetching Strategy:")
-                report_lines.append(f"  Approach: {strategy['overall_approach']}")
-                report_lines.append(f"  Priority: {strategy['priority_level']}")
-                report_lines.append("  Sources:")
+                line("Recommended FMV Fetching Strategy:")
+                line(f"  Approach: {strategy['overall_approach']}")
+                line(f"  Priority: {strategy['priority_level']}")
+                line("  Sources:")
                 for source in strategy["recommended_sources"]:
-                    report_lines.append(f"    - {source}")
-                report_lines.append("")
+                    line(f"    - {source}")
+                line()
 
             # Effort estimation
             if "estimated_effort" in recommendations:
                 effort = recommendations["estimated_effort"]
-                report_lines.append("Effort Estimation:")
-                report_lines.append(
-                    f"  API Calls Needed: {effort['estimated_api_calls']:,}"
-                )
-                report_lines.append(
-                    f"  Estimated Time: {effort['estimated_time_hours']} hours"
-                )
-                report_lines.append(
-                    f"  Estimated Cost: ${effort['estimated_cost_usd']}"
-                )
-                report_lines.append(f"  Complexity: {effort['complexity']}")
-                report_lines.append("")
+                line("Effort Estimation:")
+                line(f"  API Calls Needed: {effort['estimated_api_calls']:,}")
+                line(f"  Estimated Time: {effort['estimated_time_hours']} hours")
+                line(f"  Estimated Cost: ${effort['estimated_cost_usd']}")
+                line(f"  Complexity: {effort['complexity']}")
+                line()
 
-        report_lines.append("=" * 60)
-        report_content = "\n".join(report_lines)
-
-        # Save to file if path provided
-        if output_path:
-            try:
-                with open(output_path, "w") as f:
-                    f.write(report_content)
-                logger.info(f"Report saved to {output_path}")
-            except Exception as e:
-                logger.error(f"Error saving report: {str(e)}")
-
-        return report_content
+        write("=" * 60)
 
     def save_missing_data(self, output_path: str) -> None:
         """
-        Save missing FMV data to CSV for further analysis.
+        Save missing FMV data for further analysis.
+
+        The format follows the file suffix: ``.parquet`` (snappy-compressed)
+        and ``.feather`` are written through PyArrow, anything else as CSV.
 
         Args:
-            output_path: Path for output CSV file
+            output_path: Path for output file
         """
-        if self.missing_fmv_data is None or self.missing_fmv_data.empty:
+        self._prepare_analyzed_data()
+        if self._analyzed_data is None or not self._missing_mask.any():
             logger.warning("No missing FMV data to save")
-            # Create empty CSV file with headers
+            # Create empty file with the analyzed columns and dtypes
             try:
-                empty_df = pd.DataFrame(
-                    columns=(
-                        self.available_fmv_data.columns
-                        if self.available_fmv_data is not None
-                        else []
-                    )
+                empty_df = (
+                    self._analyzed_data.iloc[:0]
+                    if self._analyzed_data is not None
+                    else pd.DataFrame()
                 )
-                empty_df.to_csv(output_path, index=False)
+                _write_frame(empty_df, output_path)
                 logger.info(f"Empty missing FMV data file created at {output_path}")
             except Exception as e:
                 logger.error(f"Error creating empty missing FMV data file: {str(e)}")
             return
 
         try:
-            self.missing_fmv_data.to_csv(output_path, index=False)
+            _write_frame(self.missing_fmv_data, output_path)
             logger.info(f"Missing FMV data saved to {output_path}")
         except Exception as e:
             logger.error(f"Error saving missing FMV data: {str(e)}")
@@ -601,6 +748,10 @@ def analyze_transaction_data(
     """
     Convenience function to analyze transaction data for missing FMV.
 
+    Both outputs are produced from the explorer's single analysis pass: the
+    missing FMV rows are written straight from the analyzed frame and mask,
+    keeping its categorical columns (preserved as such in Parquet/Feather).
+
     Args:
         df: DataFrame from Phase 1A parser output
         output_report_path: Optional path to save analysis report
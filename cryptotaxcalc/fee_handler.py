@@ -8,10 +8,24 @@ fee adjustments to cost basis and proceeds, and integration with FIFO manager.
 import pandas as pd
 import numpy as np
 from datetime import datetime, date
-from typing import Dict, List, Optional, Tuple, Any, NamedTuple
+from typing import (
+    Dict,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Tuple,
+    Any,
+    NamedTuple,
+    Union,
+)
 from enum import Enum
 import logging
+import os
+from collections import abc
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
+from types import MappingProxyType
 
 from .fifo_manager import FIFOManager, DisposalResult, Lot
 
@@ -19,6 +33,149 @@ from .fifo_manager import FIFOManager, DisposalResult, Lot
 logger = logging.getLogger(__name__)
 
 
+# Common cryptocurrency USD rates (approximate, will be replaced by Phase 2 FMV)
+ESTIMATED_USD_RATES: Dict[str, float] = {
+    "BTC": 45000.0,
+    "ETH": 3000.0,
+    "BNB": 300.0,
+    "ADA": 0.5,
+    "DOT": 7.0,
+    "LINK": 15.0,
+    "LTC": 70.0,
+    "BCH": 250.0,
+    "XRP": 0.6,
+    "SOL": 100.0,
+    "MATIC": 0.8,
+    "AVAX": 25.0,
+    "UNI": 7.0,
+    "ATOM": 10.0,
+    "FTM": 0.4,
+    "NEAR": 3.0,
+    "ALGO": 0.2,
+    "VET": 0.03,
+    "ICP": 12.0,
+    "FIL": 5.0,
+}
+
+# Rate assumed for currencies without an estimate (1:1 with USD)
+DEFAULT_USD_RATE = 1.0
+
+# USD and USD-pegged currencies, valued at face amount
+STABLECOIN_CURRENCIES = frozenset({"USD", "USDT", "USDC", "BUSD", "DAI"})
+
+# Row count from which fee columns are calculated in concurrent chunks, and
+# the number of rows per chunk
+PARALLEL_FEE_MIN_ROWS = 200_000
+FEE_CHUNK_ROWS = 100_000
+
+# The same rates as a Series, for mapping whole currency columns at once
+_ESTIMATED_USD_RATE_SERIES = pd.Series(ESTIMATED_USD_RATES, dtype=np.float64)
+
+
+# Marks a row without a Date, so the current time is only taken when needed
+_NO_DATE = object()
+
+
+# Column contract of the column-wise fee calculation. Missing amounts count
+# as 0.0 and missing currencies as ""; USDEquivalent keeps NaN for unpriced
+# rows. Type and FeeCurrency are categorical so their mappings are resolved
+# once per distinct value.
+REQUIRED_DTYPES: Dict[str, str] = {
+    "FeeAmount": "float64",
+    "BuyAmount": "float64",
+    "SellAmount": "float64",
+    "USDEquivalent": "float64",
+    "FeeCurrency": "category",
+    "BuyCurrency": "object",
+    "SellCurrency": "object",
+    "Type": "category",
+}
+
+# Fill values for missing entries (and absent columns); None keeps them missing
+_REQUIRED_DEFAULTS: Dict[str, Any] = {
+    "FeeAmount": 0.0,
+    "BuyAmount": 0.0,
+    "SellAmount": 0.0,
+    "USDEquivalent": None,
+    "FeeCurrency": "",
+    "BuyCurrency": "",
+    "SellCurrency": "",
+    "Type": None,
+}
+
+
+def conform_fee_columns(transactions_df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Coerce the fee-relevant columns of a transaction DataFrame to REQUIRED_DTYPES.
+
+    Args:
+        transactions_df: DataFrame with transaction data
+
+    Returns:
+        New DataFrame with exactly the REQUIRED_DTYPES columns, defaults filled
+    """
+    columns = {}
+    for column, dtype in REQUIRED_DTYPES.items():
+        default = _REQUIRED_DEFAULTS[column]
+        if column not in transactions_df:
+            # An absent column reads like a row.get default: amounts (and
+            # USDEquivalent) as 0.0, strings as "", Type as missing
+            absent = 0.0 if dtype == "float64" else default
+            values = pd.Series(absent, index=transactions_df.index, dtype=object)
+        elif dtype == "float64":
+            values = pd.to_numeric(transactions_df[column], errors="coerce")
+        else:
+            values = transactions_df[column].astype(object)
+        if default is not None:
+            values = values.where(values.notna(), default)
+        columns[column] = values.astype(dtype)
+    return pd.DataFrame(columns, index=transactions_df.index)
+
+
+def _object_array(values: Any) -> np.ndarray:
+    """Return values as an object array, keeping datetimes as Timestamps."""
+    return pd.Series(values).to_numpy(dtype=object)
+
+
+def _transaction_date(row: pd.Series) -> Any:
+    """Return the row's Date, reading the clock only when the row has none."""
+    transaction_date = row.get("Date", _NO_DATE)
+    if transaction_date is _NO_DATE:
+        return datetime.now()
+    return transaction_date
+
+
+def _fee_usd_equivalents(
+    fee_amount: np.ndarray,
+    stable: np.ndarray,
+    sell_amount: np.ndarray,
+    buy_amount: np.ndarray,
+    transaction_usd: np.ndarray,
+    estimated_rate: np.ndarray,
+) -> np.ndarray:
+    """
+    Value fees in USD with the rules of ``_calculate_fee_usd_equivalent``.
+
+    Starts from the rate estimate and overwrites, in place, the rows a
+    higher-priority rule covers, so the price division only runs on priced
+    rows and no per-branch result arrays are built.
+
+    Returns:
+        USD equivalent of each fee
+    """
+    fee_usd = fee_amount * estimated_rate
+
+    # Transaction price per unit, taken from the sell side when there is one
+    priced_amount = np.where(sell_amount > 0, sell_amount, buy_amount)
+    priced = np.flatnonzero((transaction_usd > 0) & (priced_amount > 0))
+    fee_usd[priced] = fee_amount[priced] * (
+        transaction_usd[priced] / priced_amount[priced]
+    )
+
+    fee_usd[stable] = fee_amount[stable]
+    return fee_usd
+
+
 class FeeType(Enum):
     """Types of fees that can be processed."""
 
@@ -67,61 +224,310 @@ class FeeAdjustment:
     notes: str = ""
 
 
-class FeeProcessor:
-    """
-    Processes transaction fees and calculates USD equivalents.
-
-    Handles fee extraction, classification, USD conversion, and
-    integration with FIFO manager for basis/proceeds adjustments.
-    """
-
-    def __init__(self):
-        """Initialize the fee processor."""
-        self._initialize_fee_mappings()
-        self.processed_fees: List[FeeInfo] = []
-        self.fee_statistics: Dict[str, Any] = {}
-
-    def _initialize_fee_mappings(self):
-        """Initialize fee type and treatment mappings."""
-
-        # Fee type mappings based on transaction context
-        self.fee_type_mappings = {
-            # Trading fees
-            "Trade": {
+# Member order used for the int8 fee type / treatment codes in FeeInfoTable
+_FEE_TYPES: Tuple[FeeType, ...] = tuple(FeeType)
+_FEE_TREATMENTS: Tuple[FeeTreatment, ...] = tuple(FeeTreatment)
+_FEE_TYPE_CODES: Dict[FeeType, int] = {t: i for i, t in enumerate(_FEE_TYPES)}
+_FEE_TREATMENT_CODES: Dict[FeeTreatment, int] = {
+    t: i for i, t in enumerate(_FEE_TREATMENTS)
+}
+
+# Enum values in code order, for reporting without per-row enum attribute access
+FEE_TYPE_VALUES: Tuple[str, ...] = tuple(fee_type.value for fee_type in FeeType)
+FEE_TREATMENT_VALUES: Tuple[str, ...] = tuple(
+    treatment.value for treatment in FeeTreatment
+)
+
+# Direction in which each treatment code moves the transaction's USD value;
+# deductible and non-deductible fees leave it unchanged
+_TREATMENT_SIGNS = np.zeros(len(_FEE_TREATMENTS))
+_TREATMENT_SIGNS[_FEE_TREATMENT_CODES[FeeTreatment.ADD_TO_BASIS]] = 1.0
+_TREATMENT_SIGNS[_FEE_TREATMENT_CODES[FeeTreatment.REDUCE_PROCEEDS]] = -1.0
+
+
+# Fee type and treatment by transaction type; "default" covers every other
+# type. Shared, read-only, by all FeeProcessor instances.
+_FEE_TYPE_MAPPINGS: Mapping[str, Mapping[str, Enum]] = MappingProxyType(
+    {
+        # Trading fees
+        "Trade": MappingProxyType(
+            {
                 "default_type": FeeType.TRADING_FEE,
                 "default_treatment": FeeTreatment.ADD_TO_BASIS,  # For buys
                 "disposal_treatment": FeeTreatment.REDUCE_PROCEEDS,  # For sells
-            },
-            # Spending fees
-            "Spend": {
+            }
+        ),
+        # Spending fees
+        "Spend": MappingProxyType(
+            {
                 "default_type": FeeType.NETWORK_FEE,
                 "default_treatment": FeeTreatment.REDUCE_PROCEEDS,
                 "disposal_treatment": FeeTreatment.REDUCE_PROCEEDS,
-            },
-            # Transfer fees
-            "Deposit": {
+            }
+        ),
+        # Transfer fees
+        "Deposit": MappingProxyType(
+            {
                 "default_type": FeeType.DEPOSIT_FEE,
                 "default_treatment": FeeTreatment.NON_DEDUCTIBLE,
                 "disposal_treatment": FeeTreatment.NON_DEDUCTIBLE,
-            },
-            "Withdrawal": {
+            }
+        ),
+        "Withdrawal": MappingProxyType(
+            {
                 "default_type": FeeType.WITHDRAWAL_FEE,
                 "default_treatment": FeeTreatment.NON_DEDUCTIBLE,
                 "disposal_treatment": FeeTreatment.NON_DEDUCTIBLE,
-            },
-            # Income fees
-            "Staking": {
+            }
+        ),
+        # Income fees
+        "Staking": MappingProxyType(
+            {
                 "default_type": FeeType.STAKING_FEE,
                 "default_treatment": FeeTreatment.DEDUCTIBLE_EXPENSE,
                 "disposal_treatment": FeeTreatment.DEDUCTIBLE_EXPENSE,
-            },
-            # Default for other transaction types
-            "default": {
+            }
+        ),
+        # Default for other transaction types
+        "default": MappingProxyType(
+            {
                 "default_type": FeeType.UNKNOWN_FEE,
                 "default_treatment": FeeTreatment.NON_DEDUCTIBLE,
                 "disposal_treatment": FeeTreatment.NON_DEDUCTIBLE,
-            },
+            }
+        ),
+    }
+)
+
+
+class FeeInfoTable(abc.Sequence):
+    """
+    Column-oriented store of processed fees.
+
+    Keeps one array per FeeInfo field instead of one dataclass per fee, with
+    fee types and treatments stored as int8 codes. FeeInfo objects are only
+    built when the table is indexed or iterated. Column arrays are never
+    modified in place, which is what lets ``snapshot`` share them.
+
+    Totals and counts used for fee statistics are kept up to date as fees
+    are added, so reading them does not rescan the columns.
+    """
+
+    COLUMN_DTYPES: Dict[str, Any] = {
+        "amount": np.float64,
+        "currency": object,
+        "usd_equivalent": np.float64,
+        "fee_type": np.int8,
+        "treatment": np.int8,
+        "transaction_date": object,
+        "asset": object,
+    }
+
+    def __init__(self):
+        """Initialize an empty fee table."""
+        self._chunks: List[Dict[str, np.ndarray]] = []
+        self._pending: List[FeeInfo] = []
+        self._length = 0
+        self._reset_aggregates()
+
+    def _reset_aggregates(self) -> None:
+        """Zero the running totals and counts."""
+        self._total_usd = 0.0
+        self._fee_type_counts = np.zeros(len(_FEE_TYPES), dtype=np.int64)
+        self._treatment_counts = np.zeros(len(_FEE_TREATMENTS), dtype=np.int64)
+        self._asset_counts: Dict[str, int] = {}
+
+    def append(self, fee_info: FeeInfo) -> None:
+        """
+        Add a single fee.
+
+        Args:
+            fee_info: The fee to add
+        """
+        self._pending.append(fee_info)
+        self._length += 1
+
+    def extend(self, columns: Dict[str, np.ndarray]) -> None:
+        """
+        Add a batch of fees given as row-aligned column arrays.
+
+        Args:
+            columns: Arrays keyed by the names in ``COLUMN_DTYPES``; fee types
+                and treatments given as codes
+        """
+        self._flush_pending()
+        chunk = {
+            name: np.asarray(columns[name], dtype=dtype)
+            for name, dtype in self.COLUMN_DTYPES.items()
         }
+        if not len(chunk["amount"]):
+            return
+        self._chunks.append(chunk)
+        self._length += len(chunk["amount"])
+
+        self._total_usd += float(chunk["usd_equivalent"].sum())
+        self._fee_type_counts += np.bincount(
+            chunk["fee_type"], minlength=len(_FEE_TYPES)
+        )
+        self._treatment_counts += np.bincount(
+            chunk["treatment"], minlength=len(_FEE_TREATMENTS)
+        )
+        assets = pd.Series(chunk["asset"])
+        for asset, count in (
+            assets[assets != ""].value_counts(sort=False, dropna=False).items()
+        ):
+            self._asset_counts[asset] = self._asset_counts.get(asset, 0) + int(count)
+
+    @property
+    def total_usd_equivalent(self) -> float:
+        """Sum of the USD equivalents of all fees."""
+        self._flush_pending()
+        return self._total_usd
+
+    @property
+    def fee_type_counts(self) -> np.ndarray:
+        """Number of fees per fee type code."""
+        self._flush_pending()
+        return self._fee_type_counts.copy()
+
+    @property
+    def treatment_counts(self) -> np.ndarray:
+        """Number of fees per treatment code."""
+        self._flush_pending()
+        return self._treatment_counts.copy()
+
+    @property
+    def asset_counts(self) -> Mapping[str, int]:
+        """Number of fees per non-empty asset, in order of first appearance."""
+        self._flush_pending()
+        return MappingProxyType(self._asset_counts)
+
+    def column(self, name: str) -> np.ndarray:
+        """
+        Get one field of all fees as an array.
+
+        Args:
+            name: Column name from ``COLUMN_DTYPES``
+
+        Returns:
+            Array with one entry per fee, in insertion order
+        """
+        self._flush_pending()
+        if not self._chunks:
+            return np.empty(0, dtype=self.COLUMN_DTYPES[name])
+        if len(self._chunks) > 1:
+            self._chunks = [
+                {
+                    column: np.concatenate([chunk[column] for chunk in self._chunks])
+                    for column in self.COLUMN_DTYPES
+                }
+            ]
+        return self._chunks[0][name]
+
+    def snapshot(self) -> "FeeInfoTable":
+        """
+        Get a copy of the table that later additions do not affect.
+
+        Shares the column arrays instead of copying them.
+
+        Returns:
+            New FeeInfoTable with the current fees
+        """
+        self._flush_pending()
+        copy = FeeInfoTable()
+        copy._chunks = list(self._chunks)
+        copy._length = self._length
+        copy._total_usd = self._total_usd
+        copy._fee_type_counts = self._fee_type_counts.copy()
+        copy._treatment_counts = self._treatment_counts.copy()
+        copy._asset_counts = dict(self._asset_counts)
+        return copy
+
+    def clear(self) -> None:
+        """Remove all fees."""
+        self._chunks.clear()
+        self._pending.clear()
+        self._length = 0
+        self._reset_aggregates()
+
+    def _flush_pending(self) -> None:
+        """Move individually appended fees into a column chunk."""
+        if not self._pending:
+            return
+        pending, self._pending = self._pending, []
+        self._length -= len(pending)
+        self.extend(
+            {
+                "amount": [fee.amount for fee in pending],
+                "currency": [fee.currency for fee in pending],
+                "usd_equivalent": [fee.usd_equivalent for fee in pending],
+                "fee_type": [_FEE_TYPE_CODES[fee.fee_type] for fee in pending],
+                "treatment": [_FEE_TREATMENT_CODES[fee.treatment] for fee in pending],
+                "transaction_date": _object_array(
+                    [fee.transaction_date for fee in pending]
+                ),
+                "asset": [fee.asset for fee in pending],
+            }
+        )
+
+    @staticmethod
+    def _fee_info(
+        amount, currency, usd_equivalent, fee_type, treatment, transaction_date, asset
+    ) -> FeeInfo:
+        """Build a FeeInfo from one row of column values."""
+        return FeeInfo(
+            amount=float(amount),
+            currency=currency,
+            usd_equivalent=float(usd_equivalent),
+            fee_type=_FEE_TYPES[fee_type],
+            treatment=_FEE_TREATMENTS[treatment],
+            transaction_date=transaction_date,
+            asset=asset,
+        )
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __getitem__(self, i: Union[int, slice]) -> Union[FeeInfo, List[FeeInfo]]:
+        if isinstance(i, slice):
+            return [self[j] for j in range(*i.indices(len(self)))]
+        if i < 0:
+            i += self._length
+        if not 0 <= i < self._length:
+            raise IndexError("fee table index out of range")
+        return self._fee_info(*(self.column(name)[i] for name in self.COLUMN_DTYPES))
+
+    def __iter__(self):
+        columns = [self.column(name) for name in self.COLUMN_DTYPES]
+        for values in zip(*columns):
+            yield self._fee_info(*values)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, abc.Sequence):
+            return NotImplemented
+        return len(self) == len(other) and all(a == b for a, b in zip(self, other))
+
+    def __repr__(self) -> str:
+        return f"FeeInfoTable(fees={self._length})"
+
+
+class FeeProcessor:
+    """
+    Processes transaction fees and calculates USD equivalents.
+
+    Handles fee extraction, classification, USD conversion, and
+    integration with FIFO manager for basis/proceeds adjustments.
+    """
+
+    def __init__(self):
+        """Initialize the fee processor."""
+        self._initialize_fee_mappings()
+        self.processed_fees = FeeInfoTable()
+        self.fee_statistics: Dict[str, Any] = {}
+
+    def _initialize_fee_mappings(self):
+        """Initialize fee type and treatment mappings."""
+        self.fee_type_mappings = _FEE_TYPE_MAPPINGS
 
     def extract_fees_from_transaction(self, row: pd.Series) -> Optional[FeeInfo]:
         """
@@ -171,13 +577,32 @@ class FeeProcessor:
             usd_equivalent=usd_equivalent,
             fee_type=fee_type,
             treatment=treatment,
-            transaction_date=row.get("Date", datetime.now()),
+            transaction_date=_transaction_date(row),
             asset=asset,
         )
 
         self.processed_fees.append(fee_info)
         return fee_info
 
+    def _record_fee_columns(self, fees: Dict[str, np.ndarray]) -> None:
+        """
+        Record every fee found by ``calculate_fee_columns``.
+
+        Args:
+            fees: Output of ``calculate_fee_columns``
+        """
+        self.processed_fees.extend(
+            {
+                "amount": fees["fee_amount"],
+                "currency": fees["fee_currency"],
+                "usd_equivalent": fees["fee_usd"],
+                "fee_type": fees["fee_type"],
+                "treatment": fees["treatment"],
+                "transaction_date": _object_array(fees["date"]),
+                "asset": fees["asset"],
+            }
+        )
+
     def _calculate_fee_usd_equivalent(
         self, row: pd.Series, fee_amount: float, fee_currency: str
     ) -> float:
@@ -196,7 +621,7 @@ class FeeProcessor:
             return 0.0
 
         # If fee currency is USD or USD-pegged, return the amount directly
-        if fee_currency.upper() in ["USD", "USDT", "USDC", "BUSD", "DAI"]:
+        if fee_currency.upper() in STABLECOIN_CURRENCIES:
             return fee_amount
 
         # If fee currency matches the transaction currency, use transaction USD value
@@ -229,31 +654,152 @@ class FeeProcessor:
         Returns:
             Estimated USD rate
         """
-        # Common cryptocurrency USD rates (approximate, will be replaced by Phase 2 FMV)
-        rate_estimates = {
-            "BTC": 45000.0,
-            "ETH": 3000.0,
-            "BNB": 300.0,
-            "ADA": 0.5,
-            "DOT": 7.0,
-            "LINK": 15.0,
-            "LTC": 70.0,
-            "BCH": 250.0,
-            "XRP": 0.6,
-            "SOL": 100.0,
-            "MATIC": 0.8,
-            "AVAX": 25.0,
-            "UNI": 7.0,
-            "ATOM": 10.0,
-            "FTM": 0.4,
-            "NEAR": 3.0,
-            "ALGO": 0.2,
-            "VET": 0.03,
-            "ICP": 12.0,
-            "FIL": 5.0,
+        return ESTIMATED_USD_RATES.get(currency.upper(), DEFAULT_USD_RATE)
+
+    def calculate_fee_columns(
+        self, transactions_df: pd.DataFrame
+    ) -> Dict[str, np.ndarray]:
+        """
+        Calculate fee information for all fee-bearing rows of a DataFrame.
+
+        Column-wise counterpart of ``extract_fees_from_transaction`` and
+        ``calculate_fee_adjustment``: the same rules are applied with NumPy
+        array operations instead of one Python call per row.
+
+        Args:
+            transactions_df: DataFrame with transaction data
+
+        Returns:
+            Dictionary of arrays with one entry per row that has a fee:
+            ``row`` (position in ``transactions_df``), ``fee_amount``,
+            ``fee_currency``, ``fee_usd``, ``fee_type`` and ``treatment``
+            (as codes into the FeeType / FeeTreatment member order),
+            ``date``, ``is_buy``, ``is_sell``, ``amount``, ``fifo_asset``,
+            ``asset``, ``original_usd`` and ``adjusted_usd``
+        """
+        if len(transactions_df) >= PARALLEL_FEE_MIN_ROWS:
+            return self._calculate_fee_columns_chunked(transactions_df)
+
+        conformed = conform_fee_columns(transactions_df)
+
+        # Most transactions carry no fee; drop them before any further work
+        rows = np.flatnonzero(
+            (conformed["FeeAmount"].to_numpy() > 0)
+            & (conformed["FeeCurrency"] != "").to_numpy()
+        )
+        fee_df = conformed.iloc[rows]
+
+        fee_amount = fee_df["FeeAmount"].to_numpy()
+        buy_amount = fee_df["BuyAmount"].to_numpy()
+        sell_amount = fee_df["SellAmount"].to_numpy()
+        buy_currency = fee_df["BuyCurrency"].to_numpy()
+        sell_currency = fee_df["SellCurrency"].to_numpy()
+        # Unpriced rows stay NaN, exactly as the per-row path passes them on
+        transaction_usd = fee_df["USDEquivalent"].to_numpy()
+
+        if "Date" in transactions_df:
+            dates = transactions_df["Date"].to_numpy()[rows]
+        else:
+            dates = np.full(len(fee_df), datetime.now(), dtype=object)
+
+        is_disposal = sell_amount > 0
+
+        # Fee type and treatment: look up each distinct transaction type once,
+        # then gather per row by category code. The extra last entry holds the
+        # "default" mapping and is what missing types (code -1) pick up.
+        types = fee_df["Type"]
+        default_mapping = self.fee_type_mappings["default"]
+        mappings = [
+            self.fee_type_mappings.get(category, default_mapping)
+            for category in types.cat.categories
+        ] + [default_mapping]
+        # One row per category: fee type, default and disposal treatment codes
+        mapping_table = np.array(
+            [
+                (
+                    _FEE_TYPE_CODES[m["default_type"]],
+                    _FEE_TREATMENT_CODES[m["default_treatment"]],
+                    _FEE_TREATMENT_CODES[m["disposal_treatment"]],
+                )
+                for m in mappings
+            ],
+            dtype=np.int8,
+        )
+        row_mappings = mapping_table[types.cat.codes.to_numpy()]
+        fee_type = row_mappings[:, 0]
+        treatment = np.where(is_disposal, row_mappings[:, 2], row_mappings[:, 1])
+
+        # USD equivalent: stablecoins at face value, then the transaction's own
+        # price (sell side first), then the fallback rate estimate. Currency
+        # properties are resolved per distinct currency and gathered by code.
+        currencies = fee_df["FeeCurrency"]
+        currency_codes = currencies.cat.codes.to_numpy()
+        currency_upper = currencies.cat.categories.str.upper()
+        stable = currency_upper.isin(STABLECOIN_CURRENCIES)[currency_codes]
+        estimated_rate = (
+            currency_upper.map(_ESTIMATED_USD_RATE_SERIES)
+            .fillna(DEFAULT_USD_RATE)
+            .to_numpy(dtype=np.float64)[currency_codes]
+        )
+        fee_usd = _fee_usd_equivalents(
+            fee_amount, stable, sell_amount, buy_amount, transaction_usd, estimated_rate
+        )
+
+        # Acquisitions take precedence over disposals when applying to FIFO
+        is_buy = (buy_amount > 0) & (buy_currency != "")
+        is_sell = ~is_buy & is_disposal & (sell_currency != "")
+
+        return {
+            "row": rows,
+            "fee_amount": fee_amount,
+            "fee_currency": currencies.to_numpy(dtype=object),
+            "fee_usd": fee_usd,
+            "fee_type": fee_type,
+            "treatment": treatment,
+            "date": dates,
+            "is_buy": is_buy,
+            "is_sell": is_sell,
+            "amount": np.where(is_buy, buy_amount, sell_amount),
+            "fifo_asset": np.where(is_buy, buy_currency, sell_currency),
+            "asset": np.where(is_disposal, sell_currency, buy_currency),
+            "original_usd": transaction_usd,
+            "adjusted_usd": transaction_usd + _TREATMENT_SIGNS[treatment] * fee_usd,
         }
 
-        return rate_estimates.get(currency.upper(), 1.0)  # Default to 1:1 if unknown
+    def _calculate_fee_columns_chunked(
+        self, transactions_df: pd.DataFrame
+    ) -> Dict[str, np.ndarray]:
+        """
+        Calculate fee columns for contiguous row chunks concurrently.
+
+        Rows are independent until fees are applied to the FIFO manager, so
+        the chunks can be computed in any order; the results are joined back
+        in row order.
+
+        Args:
+            transactions_df: DataFrame with transaction data
+
+        Returns:
+            Same dictionary as ``calculate_fee_columns``
+        """
+        starts = range(0, len(transactions_df), FEE_CHUNK_ROWS)
+        chunks = [
+            transactions_df.iloc[start : start + FEE_CHUNK_ROWS] for start in starts
+        ]
+
+        with ThreadPoolExecutor(
+            max_workers=min(len(chunks), os.cpu_count() or 1)
+        ) as executor:
+            results = list(executor.map(self.calculate_fee_columns, chunks))
+
+        # Chunk-local row positions become positions in the whole frame
+        for start, result in zip(starts, results):
+            result["row"] = result["row"] + start
+
+        return {
+            key: np.concatenate([result[key] for result in results])
+            for key in results[0]
+        }
 
     def calculate_fee_adjustment(
         self, original_amount: float, original_usd: float, fee_info: FeeInfo
@@ -313,7 +859,7 @@ class FeeProcessor:
             return None
 
         transaction_type = row.get("Type", "")
-        date = row.get("Date", datetime.now())
+        date = fee_info.transaction_date
 
         # Handle acquisitions (buys)
         if row.get("BuyAmount", 0.0) > 0 and row.get("BuyCurrency"):
@@ -361,44 +907,39 @@ class FeeProcessor:
 
         return None
 
-    def get_fee_statistics(self) -> Dict[str, Any]:
+    def get_fee_statistics(self) -> Mapping[str, Any]:
         """
         Get comprehensive fee processing statistics.
 
         Returns:
-            Dictionary with fee statistics
+            Read-only mapping with fee statistics
         """
         if not self.processed_fees:
-            return {
-                "total_fees": 0,
-                "total_fee_usd": 0.0,
-                "fee_types": {},
-                "treatments": {},
-                "assets": {},
-                "average_fee_usd": 0.0,
-            }
+            return MappingProxyType(
+                {
+                    "total_fees": 0,
+                    "total_fee_usd": 0.0,
+                    "fee_types": {},
+                    "treatments": {},
+                    "assets": {},
+                    "average_fee_usd": 0.0,
+                }
+            )
 
+        # Totals and counts are maintained by the fee table as fees are added
         total_fees = len(self.processed_fees)
-        total_fee_usd = sum(fee.usd_equivalent for fee in self.processed_fees)
-
-        # Count by fee type
-        fee_types = {}
-        for fee in self.processed_fees:
-            fee_type = fee.fee_type.value
-            fee_types[fee_type] = fee_types.get(fee_type, 0) + 1
-
-        # Count by treatment
-        treatments = {}
-        for fee in self.processed_fees:
-            treatment = fee.treatment.value
-            treatments[treatment] = treatments.get(treatment, 0) + 1
-
-        # Count by asset
-        assets = {}
-        for fee in self.processed_fees:
-            asset = fee.asset
-            if asset:
-                assets[asset] = assets.get(asset, 0) + 1
+        total_fee_usd = self.processed_fees.total_usd_equivalent
+        type_counts = self.processed_fees.fee_type_counts
+        fee_types = {
+            FEE_TYPE_VALUES[code]: int(type_counts[code])
+            for code in np.flatnonzero(type_counts)
+        }
+        treatment_counts = self.processed_fees.treatment_counts
+        treatments = {
+            FEE_TREATMENT_VALUES[code]: int(treatment_counts[code])
+            for code in np.flatnonzero(treatment_counts)
+        }
+        assets = dict(self.processed_fees.asset_counts)
 
         self.fee_statistics = {
             "total_fees": total_fees,
@@ -409,16 +950,17 @@ class FeeProcessor:
             "average_fee_usd": total_fee_usd / total_fees if total_fees > 0 else 0.0,
         }
 
-        return self.fee_statistics.copy()
+        return MappingProxyType(self.fee_statistics)
 
-    def get_processed_fees(self) -> List[FeeInfo]:
-        """Get list of all processed fees."""
-        return self.processed_fees.copy()
+    def get_processed_fees(self) -> Sequence[FeeInfo]:
+        """Get a snapshot of all processed fees."""
+        return self.processed_fees.snapshot()
 
     def reset(self) -> None:
         """Reset the fee processor state."""
         self.processed_fees.clear()
-        self.fee_statistics.clear()
+        # Rebind rather than clear: earlier get_fee_statistics views keep theirs
+        self.fee_statistics = {}
 
 
 class FeeHandler:
@@ -460,35 +1002,91 @@ class FeeHandler:
         return fee_adjustment
 
     def process_transactions_dataframe(
-        self, transactions_df: pd.DataFrame
+        self, transactions_df: pd.DataFrame, presorted: bool = False
     ) -> List[FeeAdjustment]:
         """
         Process a DataFrame of transactions with fee handling.
 
         Args:
             transactions_df: DataFrame with transaction data
+            presorted: Set when the rows are already in chronological order
+                to skip sorting
 
         Returns:
             List of FeeAdjustment objects for all fee adjustments
         """
-        fee_adjustments = []
+        # Sort transactions by date to ensure chronological processing; the
+        # stable sort keeps same-date rows in their original order. The frame
+        # is only read, so neither path takes a copy.
+        if presorted:
+            sorted_df = transactions_df
+        else:
+            sorted_df = transactions_df.sort_values(
+                "Date", kind="mergesort", ignore_index=True
+            )
+
+        # Fee arithmetic is done column-wise; only the FIFO updates, which
+        # depend on the queue state left by earlier rows, run per row
+        fees = self.fee_processor.calculate_fee_columns(sorted_df)
+        self.fee_processor._record_fee_columns(fees)
+
+        fifo_fees = pd.DataFrame(fees)[fees["is_buy"] | fees["is_sell"]]
 
-        # Sort transactions by date to ensure chronological processing
-        sorted_df = transactions_df.sort_values("Date").copy()
+        # At most one adjustment per FIFO row: fill a preallocated list and
+        # trim the slots left by rows that failed
+        fee_adjustments: List[Optional[FeeAdjustment]] = [None] * len(fifo_fees)
+        applied = 0
 
-        for _, row in sorted_df.iterrows():
+        for record in fifo_fees.itertuples(index=False):
             try:
-                fee_adjustment = self.process_transaction_with_fees(row)
-                if fee_adjustment:
-                    fee_adjustments.append(fee_adjustment)
+                fee_adjustment = FeeAdjustment(
+                    original_amount=record.amount,
+                    original_usd=record.original_usd,
+                    fee_amount=record.fee_amount,
+                    fee_usd=record.fee_usd,
+                    adjusted_amount=record.amount,
+                    adjusted_usd=record.adjusted_usd,
+                    adjustment_type=_FEE_TREATMENTS[record.treatment],
+                    notes=f"Fee adjustment: {FEE_TYPE_VALUES[record.fee_type]}",
+                )
+
+                if record.is_buy:
+                    # Add acquisition with fee-adjusted basis
+                    self.fifo_manager.add_acquisition(
+                        asset=record.fifo_asset,
+                        amount=fee_adjustment.adjusted_amount,
+                        basis=fee_adjustment.adjusted_usd,
+                        acquisition_date=record.date,
+                    )
+                else:
+                    # Process disposal with fee-adjusted proceeds
+                    self.fifo_manager.process_disposal(
+                        asset=record.fifo_asset,
+                        amount=fee_adjustment.adjusted_amount,
+                        proceeds=fee_adjustment.adjusted_usd,
+                        disposal_date=record.date,
+                    )
+
+                fee_adjustments[applied] = fee_adjustment
+                applied += 1
 
             except Exception as e:
                 logger.error(
-                    f"Error processing fees for transaction on {row.get('Date')}: {str(e)}"
+                    "Error processing fees for transaction on %s: %s", record.date, e
                 )
                 # Continue processing other transactions
                 continue
 
+        failed = len(fifo_fees) - applied
+        if failed:
+            logger.warning(
+                "Fee processing failed for %d of %d transactions",
+                failed,
+                len(fifo_fees),
+            )
+
+        del fee_adjustments[applied:]
+        self.fee_adjustments.extend(fee_adjustments)
         return fee_adjustments
 
     def get_fee_summary(self) -> Dict[str, Any]:
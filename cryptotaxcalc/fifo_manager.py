@@ -8,16 +8,87 @@ including lot matching, basis tracking, and capital gains/loss calculations.
 import pandas as pd
 import numpy as np
 from datetime import datetime, date, timedelta
-from typing import Dict, List, Optional, Tuple, Any, NamedTuple
-from collections import deque
+from typing import Dict, List, Optional, Sequence, Tuple, Any, NamedTuple
+from collections import abc
 import logging
+import math
 from dataclasses import dataclass
 
 # Configure logging
 logger = logging.getLogger(__name__)
 
+# Number of lot slots a new FIFO queue starts with; a full queue doubles it
+INITIAL_LOT_CAPACITY = 16
 
-@dataclass
+# Disposals after which a queue recomputes its running totals from the lots,
+# bounding the float drift of repeated subtraction
+TOTALS_RESYNC_INTERVAL = 10_000
+
+# DisposalResult fields kept column-wise in the disposal history, and the
+# number of disposals its columns start with (doubled when full)
+DISPOSAL_VALUE_FIELDS = (
+    'total_proceeds',
+    'total_basis',
+    'total_gain_loss',
+    'short_term_gain_loss',
+    'long_term_gain_loss',
+)
+INITIAL_DISPOSAL_CAPACITY = 64
+
+# Names of the DISPOSAL_VALUE_FIELDS columns in FIFOManager.to_arrow
+ARROW_VALUE_COLUMNS = (
+    'proceeds',
+    'basis',
+    'total_gain_loss',
+    'short_term_gl',
+    'long_term_gl',
+)
+
+# Whole days a lot must be held before its gain or loss is long-term
+LONG_TERM_HOLDING_DAYS = 365
+
+# Transaction types that dispose of SellCurrency and acquire BuyCurrency at
+# the transaction's USD value
+DISPOSAL_TYPES = ('Trade', 'Spend')
+
+# Transaction types whose BuyCurrency is ordinary income, acquired at $0 basis
+INCOME_TYPES = ('Income', 'Staking', 'Airdrop')
+
+
+def _to_datetime64(value: Any) -> np.datetime64:
+    """Convert a date or timestamp to naive ``datetime64[us]`` (UTC if tz-aware)."""
+    return pd.Timestamp(value).to_datetime64().astype("datetime64[us]")
+
+
+def _to_datetime64_array(values: pd.Series) -> np.ndarray:
+    """Column-wise ``_to_datetime64``: naive ``datetime64[us]``, UTC if tz-aware."""
+    dates = pd.to_datetime(values)
+    if dates.dt.tz is not None:
+        dates = dates.dt.tz_convert(None)
+    return dates.to_numpy().astype("datetime64[us]")
+
+
+def _default_lot_id(asset: str, acquisition_date: datetime, amount: float) -> str:
+    """Build the lot id used when none is given."""
+    return f"{asset}_{acquisition_date.strftime('%Y%m%d_%H%M%S')}_{amount}"
+
+
+def _sum_in_order(values: np.ndarray, start: float = 0.0) -> float:
+    """
+    Add ``values`` to ``start`` strictly left to right.
+
+    ``np.sum`` sums pairwise; accumulating keeps the float result identical
+    to adding the values one at a time, as lot-by-lot processing did.
+    """
+    return float(np.add.accumulate(np.concatenate(([start], values)))[-1])
+
+
+def _subtract_in_order(start: float, values: np.ndarray) -> float:
+    """Subtract ``values`` from ``start`` one at a time, left to right."""
+    return float(np.subtract.reduce(np.concatenate(([start], values))))
+
+
+@dataclass(slots=True)
 class Lot:
     """
     Represents a lot of cryptocurrency with acquisition details.
@@ -42,10 +113,12 @@ class Lot:
         
         # Generate lot_id if not provided
         if self.lot_id is None:
-            self.lot_id = f"{self.asset}_{self.acquisition_date.strftime('%Y%m%d_%H%M%S')}_{self.amount}"
+            self.lot_id = _default_lot_id(
+                self.asset, self.acquisition_date, self.amount
+            )
 
 
-@dataclass
+@dataclass(slots=True)
 class DisposalResult:
     """
     Result of a disposal operation with matched lots and tax calculations.
@@ -62,11 +135,170 @@ class DisposalResult:
     remaining_amount: float  # Amount that couldn't be matched
 
 
+def _match_gains(uses: np.ndarray, lot_amounts: np.ndarray, lot_bases: np.ndarray,
+                 acquired_at: np.ndarray, amount: float, proceeds: float,
+                 short_term_cutoff: int) -> Tuple[np.ndarray, float, float, float]:
+    """
+    Basis and gain/loss of a disposal matched against FIFO lots.
+
+    Works on plain float64/int64 arrays and scalars only, so the whole
+    matching arithmetic stays in NumPy.
+
+    Args:
+        uses: Amount used from each matched lot, oldest first
+        lot_amounts: Amount held in each matched lot
+        lot_bases: Cost basis of each matched lot
+        acquired_at: Acquisition time of each matched lot (int64 microseconds)
+        amount: Total quantity disposed
+        proceeds: Total proceeds in USD
+        short_term_cutoff: Lots acquired after this time (int64 microseconds)
+            are short-term
+
+    Returns:
+        Tuple of (basis used per lot, total basis, short-term gain/loss,
+        long-term gain/loss)
+    """
+    basis_used = (uses / lot_amounts) * lot_bases
+    gain_loss = (uses / amount) * proceeds - basis_used
+    is_short_term = acquired_at > short_term_cutoff
+    return (
+        basis_used,
+        _sum_in_order(basis_used),
+        _sum_in_order(gain_loss[is_short_term]),
+        _sum_in_order(gain_loss[~is_short_term]),
+    )
+
+
+def _match_batch_gains(lot_amounts: np.ndarray, lot_bases: np.ndarray,
+                       acquired_at: np.ndarray, amounts: np.ndarray,
+                       proceeds: np.ndarray,
+                       short_term_cutoffs: np.ndarray) -> Tuple[np.ndarray, ...]:
+    """
+    Match consecutive disposals against FIFO lots and total their gains.
+
+    Batch counterpart of ``_match_gains``, likewise on plain float64/int64
+    arrays only. The lots are walked disposal by disposal, as
+    ``FIFOQueue._match`` does, each disposal starting from what the ones
+    before it left of a lot; cutting one combined amount at lot and
+    disposal boundaries instead compares cumulative sums that differ in
+    the last bit, leaving sliver pieces. Every piece, and so every gain,
+    is the same as with one ``process_disposal`` call per disposal. Only
+    the walk is a loop; the gain arithmetic stays in NumPy.
+
+    Args:
+        lot_amounts: Amount held in each lot, oldest first
+        lot_bases: Cost basis of each lot
+        acquired_at: Acquisition time of each lot (int64 microseconds)
+        amounts: Quantity of each disposal, in order
+        proceeds: Total proceeds in USD of each disposal
+        short_term_cutoffs: Per disposal, lots acquired after this time
+            (int64 microseconds) are short-term
+
+    Returns:
+        Tuple of (amount of each piece, lot of each piece, disposal of each
+        piece, amount and basis held in the lot of each piece when it was
+        used, basis used by each piece, then per disposal: amount left
+        unmatched, total basis, short-term gain/loss, long-term gain/loss)
+    """
+    count = len(amounts)
+    lot_count = len(lot_amounts)
+    pieces, piece_lot, piece_disposal, held_amounts, held_bases = [], [], [], [], []
+    unmatched = np.zeros(count)
+    lot = 0
+    held, held_basis = float(lot_amounts[0]), float(lot_bases[0])
+    for disposal, remaining in enumerate(amounts.tolist()):
+        # Lots the amount still to match covers are used up whole
+        while lot < lot_count and remaining >= held:
+            pieces.append(held)
+            piece_lot.append(lot)
+            piece_disposal.append(disposal)
+            held_amounts.append(held)
+            held_bases.append(held_basis)
+            remaining -= held
+            lot += 1
+            if lot < lot_count:
+                held, held_basis = float(lot_amounts[lot]), float(lot_bases[lot])
+        if remaining > 0 and lot < lot_count:
+            # The next lot supplies the rest and keeps what is left of it
+            pieces.append(remaining)
+            piece_lot.append(lot)
+            piece_disposal.append(disposal)
+            held_amounts.append(held)
+            held_bases.append(held_basis)
+            held_basis -= (remaining / held) * held_basis
+            held -= remaining
+        elif remaining > 0:
+            unmatched[disposal] = remaining
+
+    pieces = np.array(pieces, dtype=np.float64)
+    piece_lot = np.array(piece_lot, dtype=np.int64)
+    piece_disposal = np.array(piece_disposal, dtype=np.int64)
+    held_amounts = np.array(held_amounts, dtype=np.float64)
+    held_bases = np.array(held_bases, dtype=np.float64)
+
+    basis_used = (pieces / held_amounts) * held_bases
+    gain_loss = (
+        (pieces / amounts[piece_disposal]) * proceeds[piece_disposal] - basis_used
+    )
+    is_short_term = acquired_at[piece_lot] > short_term_cutoffs[piece_disposal]
+
+    # bincount adds each disposal's pieces in order, as _sum_in_order does
+    return (
+        pieces,
+        piece_lot,
+        piece_disposal,
+        held_amounts,
+        held_bases,
+        basis_used,
+        unmatched,
+        np.bincount(piece_disposal, weights=basis_used, minlength=count),
+        np.bincount(
+            piece_disposal,
+            weights=np.where(is_short_term, gain_loss, 0.0),
+            minlength=count,
+        ),
+        np.bincount(
+            piece_disposal,
+            weights=np.where(is_short_term, 0.0, gain_loss),
+            minlength=count,
+        ),
+    )
+
+
+class _LotView(abc.Sequence):
+    """
+    Read-only sequence over the lots of a FIFO queue, oldest first.
+
+    Lots are stored column-wise by the queue; each item is materialized as a
+    ``Lot`` when accessed.
+    """
+
+    def __init__(self, queue: "FIFOQueue"):
+        self._queue = queue
+
+    def __len__(self) -> int:
+        return len(self._queue)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("lot index out of range")
+        return self._queue._lot(self._queue._head + index)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({list(self)!r})"
+
+
 class FIFOQueue:
     """
     FIFO queue for a specific cryptocurrency asset.
     
-    Manages lots of a single asset using a deque for efficient FIFO operations.
+    Stores lots as parallel NumPy columns (amount, basis, acquisition date,
+    lot id). Live lots occupy ``[_head, _tail)``: new lots are written at the
+    tail and consumed lots are dropped by advancing the head.
     """
     
     def __init__(self, asset: str):
@@ -77,9 +309,20 @@ class FIFOQueue:
             asset: The cryptocurrency asset symbol (e.g., 'BTC', 'ETH')
         """
         self.asset = asset
-        self.lots: deque[Lot] = deque()
+        self._amount = np.empty(INITIAL_LOT_CAPACITY, dtype=np.float64)
+        self._basis = np.empty(INITIAL_LOT_CAPACITY, dtype=np.float64)
+        self._acq_date = np.empty(INITIAL_LOT_CAPACITY, dtype="datetime64[us]")
+        self._lot_id = np.empty(INITIAL_LOT_CAPACITY, dtype=object)
+        self._head = 0
+        self._tail = 0
+        self._disposals_since_resync = 0
         self.total_amount: float = 0.0
         self.total_basis: float = 0.0
+
+    @property
+    def lots(self) -> Sequence[Lot]:
+        """Lots in the queue, oldest first."""
+        return _LotView(self)
         
     def add_lot(self, lot: Lot) -> None:
         """
@@ -91,11 +334,219 @@ class FIFOQueue:
         if lot.asset != self.asset:
             raise ValueError(f"Lot asset {lot.asset} doesn't match queue asset {self.asset}")
         
-        self.lots.append(lot)
-        self.total_amount += lot.amount
-        self.total_basis += lot.basis
-        
-        logger.debug(f"Added lot to {self.asset} queue: {lot.amount} @ ${lot.basis:.2f}")
+        self._append_lot(lot.amount, lot.basis, lot.acquisition_date, lot.lot_id)
+
+        logger.debug(
+            "Added lot to %s queue: %s @ $%.2f", self.asset, lot.amount, lot.basis
+        )
+
+    def add_lots_bulk(self, amounts: Any, bases: Any, acquisition_dates: Any,
+                      lot_ids: Optional[Sequence[str]] = None) -> None:
+        """
+        Add several lots, oldest first, validating them as one batch.
+
+        Args:
+            amounts: Quantity of each lot
+            bases: Cost basis of each lot in USD
+            acquisition_dates: Acquisition date of each lot
+            lot_ids: Optional identifier of each lot; default ids otherwise
+
+        Raises:
+            ValueError: If the columns differ in length, any amount is not
+                positive, any basis is negative or any date is missing; no
+                lot is added in that case
+        """
+        amounts = np.asarray(amounts, dtype=np.float64)
+        bases = np.asarray(bases, dtype=np.float64)
+        dates = _to_datetime64_array(pd.Series(acquisition_dates))
+        if lot_ids is not None:
+            lot_ids = list(lot_ids)
+
+        lengths = {len(amounts), len(bases), len(dates)}
+        if lot_ids is not None:
+            lengths.add(len(lot_ids))
+        if len(lengths) > 1:
+            raise ValueError(
+                f"Lot columns must have the same length, got {sorted(lengths)}"
+            )
+        not_positive = ~(amounts > 0)
+        if not_positive.any():
+            raise ValueError(
+                "Acquisition amount must be positive, "
+                f"got {amounts[not_positive.argmax()]}"
+            )
+        negative = bases < 0
+        if negative.any():
+            raise ValueError(
+                f"Acquisition basis cannot be negative, got {bases[negative.argmax()]}"
+            )
+        if np.isnat(dates).any():
+            raise ValueError("Acquisition date cannot be missing")
+
+        self._append_lots(amounts, bases, dates, lot_ids)
+
+        logger.debug("Added %d lots to %s queue", len(amounts), self.asset)
+
+    def _append_lot(self, amount: float, basis: float, acquisition_date: datetime,
+                    lot_id: Optional[str] = None) -> None:
+        """
+        Append one already validated lot.
+
+        Without a ``lot_id`` the default id is only formatted once the lot is
+        read back or partially used (see ``_lot_id_at``).
+        """
+        self._reserve(1)
+        index = self._tail
+        self._amount[index] = amount
+        self._basis[index] = basis
+        self._acq_date[index] = _to_datetime64(acquisition_date)
+        self._lot_id[index] = lot_id
+        self._tail += 1
+        self.total_amount += amount
+        self.total_basis += basis
+
+    def _append_lots(self, amounts: np.ndarray, bases: np.ndarray,
+                     acquisition_dates: np.ndarray,
+                     lot_ids: Optional[List[str]] = None) -> None:
+        """
+        Append already validated lots, oldest first, in one block.
+
+        Args:
+            amounts: Quantity of each lot
+            bases: Cost basis of each lot in USD
+            acquisition_dates: Acquisition dates as ``datetime64[us]``
+            lot_ids: Identifier of each lot; None to use default ids
+        """
+        count = len(amounts)
+        self._reserve(count)
+        block = slice(self._tail, self._tail + count)
+        self._amount[block] = amounts
+        self._basis[block] = bases
+        self._acq_date[block] = acquisition_dates
+        self._lot_id[block] = lot_ids
+        self._tail += count
+        self.total_amount = _sum_in_order(amounts, self.total_amount)
+        self.total_basis = _sum_in_order(bases, self.total_basis)
+
+    def _reserve(self, count: int) -> None:
+        """
+        Make room for ``count`` more lots after the tail.
+
+        Consumed slots before the head are reclaimed first; the columns only
+        grow when the live lots still would not fit. They then double, or
+        take the exact size needed when a single block needs more than that
+        (such as a bulk import into a new queue).
+
+        Args:
+            count: Number of lots about to be added
+        """
+        capacity = len(self._amount)
+        if self._tail + count <= capacity:
+            return
+
+        live = self._tail - self._head
+        if live + count > capacity:
+            capacity = max(2 * capacity, live + count)
+
+        for name in ("_amount", "_basis", "_acq_date", "_lot_id"):
+            column = getattr(self, name)
+            resized = np.empty(capacity, dtype=column.dtype)
+            resized[:live] = column[self._head:self._tail]
+            setattr(self, name, resized)
+
+        self._head = 0
+        self._tail = live
+
+    def _lot(self, index: int) -> Lot:
+        """Materialize the lot stored at column position ``index``."""
+        return Lot(
+            amount=float(self._amount[index]),
+            basis=float(self._basis[index]),
+            acquisition_date=self._acq_date[index].item(),
+            asset=self.asset,
+            lot_id=self._lot_id_at(index)
+        )
+
+    def _lot_id_at(self, index: int) -> str:
+        """
+        Return the id of the lot at column position ``index``.
+
+        Default ids derive from the acquired amount, so they are formatted
+        (and kept) before a lot is first partially used; until then the
+        stored amount is still the acquired one.
+        """
+        lot_id = self._lot_id[index]
+        if lot_id is None:
+            lot_id = _default_lot_id(
+                self.asset, self._acq_date[index].item(), float(self._amount[index])
+            )
+            self._lot_id[index] = lot_id
+        return lot_id
+
+    def _match(self, amount: float) -> Tuple[np.ndarray, float]:
+        """
+        Split a disposal of ``amount`` over the oldest lots.
+
+        Lots are used up whole while the amount still to match covers them;
+        the first lot it does not cover supplies the rest. The lots are
+        searched in windows that double in size, so a disposal only touches
+        about as many lots as it consumes.
+
+        Args:
+            amount: Quantity being disposed
+
+        Returns:
+            Tuple of (amount used from each matched lot, oldest first;
+            amount left unmatched when the queue runs out)
+        """
+        live = len(self)
+        window = min(live, INITIAL_LOT_CAPACITY)
+        while True:
+            amounts = self._amount[self._head:self._head + window]
+            # Amount still to match before each lot, subtracted in lot order
+            remaining = np.subtract.accumulate(np.concatenate(([amount], amounts)))
+            not_covered = remaining[:-1] < amounts
+            if not_covered.any() or window == live:
+                break
+            window = min(2 * window, live)
+
+        full_lots = int(not_covered.argmax()) if not_covered.any() else window
+        uses = amounts[:full_lots]
+        unmatched = float(remaining[full_lots])
+        if full_lots < window and unmatched > 0:
+            uses = np.append(uses, unmatched)
+            unmatched = 0.0
+        return uses, unmatched
+
+    def _reduce_totals(self, amounts: np.ndarray, bases: np.ndarray) -> None:
+        """
+        Take a disposal's used amounts and bases off the running totals.
+
+        Totals are reset to exactly zero once the queue is empty, and
+        recomputed from the remaining lots every ``TOTALS_RESYNC_INTERVAL``
+        disposals, so rounding errors cannot build up indefinitely.
+
+        Args:
+            amounts: Amount used from each lot
+            bases: Basis used from each lot
+        """
+        self._disposals_since_resync += 1
+        if self.is_empty():
+            self.total_amount = 0.0
+            self.total_basis = 0.0
+        elif self._disposals_since_resync >= TOTALS_RESYNC_INTERVAL:
+            live = slice(self._head, self._tail)
+            self.total_amount = math.fsum(self._amount[live])
+            self.total_basis = math.fsum(self._basis[live])
+            self._disposals_since_resync = 0
+        else:
+            self.total_amount = _subtract_in_order(self.total_amount, amounts)
+            self.total_basis = _subtract_in_order(self.total_basis, bases)
+
+    def _drop_head(self, count: int = 1) -> None:
+        """Remove the ``count`` oldest lots from the queue."""
+        self._lot_id[self._head:self._head + count] = None
+        self._head += count
         
     def get_available_amount(self) -> float:
         """Get total available amount in the queue."""
@@ -107,14 +558,17 @@ class FIFOQueue:
     
     def is_empty(self) -> bool:
         """Check if the queue is empty."""
-        return len(self.lots) == 0
+        return self._tail == self._head
     
     def __len__(self) -> int:
         """Get number of lots in the queue."""
-        return len(self.lots)
+        return self._tail - self._head
     
     def __repr__(self) -> str:
-        return f"FIFOQueue({self.asset}, lots={len(self.lots)}, total_amount={self.total_amount:.6f})"
+        return (
+            f"FIFOQueue({self.asset}, lots={len(self)}, "
+            f"total_amount={self.total_amount:.6f})"
+        )
 
 
 class FIFOManager:
@@ -129,6 +583,18 @@ class FIFOManager:
         """Initialize the FIFO manager."""
         self.queues: Dict[str, FIFOQueue] = {}
         self.disposal_history: List[DisposalResult] = []
+        # Column per DISPOSAL_VALUE_FIELDS entry, one row per disposal in
+        # disposal_history; Fortran order keeps each column contiguous
+        self._disposal_values = np.empty(
+            (INITIAL_DISPOSAL_CAPACITY, len(DISPOSAL_VALUE_FIELDS)), order='F'
+        )
+        self._disposal_asset_ids = np.empty(INITIAL_DISPOSAL_CAPACITY, dtype=np.int32)
+        self._disposal_dates = np.empty(
+            INITIAL_DISPOSAL_CAPACITY, dtype='datetime64[us]'
+        )
+        # Dictionary encoding of asset symbols: id -> name and name -> id
+        self._asset_names: List[str] = []
+        self._asset_ids: Dict[str, int] = {}
         
     def get_or_create_queue(self, asset: str) -> FIFOQueue:
         """
@@ -142,9 +608,27 @@ class FIFOManager:
         """
         if asset not in self.queues:
             self.queues[asset] = FIFOQueue(asset)
-            logger.info(f"Created new FIFO queue for {asset}")
+            self._intern(asset)
+            logger.info("Created new FIFO queue for %s", asset)
         
         return self.queues[asset]
+
+    def _intern(self, asset: str) -> int:
+        """
+        Get the integer id of an asset symbol, assigning the next one if new.
+
+        Args:
+            asset: The cryptocurrency asset symbol
+
+        Returns:
+            Id used for the asset in the disposal history columns
+        """
+        asset_id = self._asset_ids.get(asset)
+        if asset_id is None:
+            asset_id = len(self._asset_names)
+            self._asset_ids[asset] = asset_id
+            self._asset_names.append(asset)
+        return asset_id
     
     def add_acquisition(self, asset: str, amount: float, basis: float, 
                        acquisition_date: datetime, lot_id: Optional[str] = None) -> None:
@@ -163,18 +647,19 @@ class FIFOManager:
         if basis < 0:
             raise ValueError(f"Acquisition basis cannot be negative, got {basis}")
         
-        lot = Lot(
-            amount=amount,
-            basis=basis,
-            acquisition_date=acquisition_date,
-            asset=asset,
-            lot_id=lot_id
-        )
+        if not asset:
+            raise ValueError("Asset cannot be empty")
+        if pd.isna(acquisition_date):
+            raise ValueError("Acquisition date cannot be missing")
         
         queue = self.get_or_create_queue(asset)
-        queue.add_lot(lot)
+        queue._append_lot(amount, basis, acquisition_date, lot_id)
         
-        logger.info(f"Added acquisition: {amount} {asset} @ ${basis:.2f} on {acquisition_date.strftime('%Y-%m-%d')}")
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "Added acquisition: %s %s @ $%.2f on %s",
+                amount, asset, basis, acquisition_date.strftime('%Y-%m-%d')
+            )
     
     def process_disposal(self, asset: str, amount: float, proceeds: float, 
                         disposal_date: datetime) -> DisposalResult:
@@ -207,58 +692,46 @@ class FIFOManager:
             )
         
         # Match lots using FIFO
-        remaining_amount = amount
-        matched_lots = []
-        total_basis = 0.0
-        short_term_gain_loss = 0.0
-        long_term_gain_loss = 0.0
-        
-        # Create a copy of lots to avoid modifying the original during iteration
-        lots_to_process = list(queue.lots)
+        uses, remaining_amount = queue._match(amount)
+        head = queue._head
+        matched = slice(head, head + len(uses))
+        lot_amounts = queue._amount[matched]
+        lot_bases = queue._basis[matched]
+        matched_lots = [
+            (queue._lot(head + offset), float(used)) for offset, used in enumerate(uses)
+        ]
         
-        for lot in lots_to_process:
-            if remaining_amount <= 0:
-                break
-                
-            # Calculate how much of this lot to use
-            amount_to_use = min(lot.amount, remaining_amount)
-            basis_used = (amount_to_use / lot.amount) * lot.basis
-            
-            # Calculate gain/loss for this portion
-            proceeds_portion = (amount_to_use / amount) * proceeds
-            gain_loss = proceeds_portion - basis_used
-            
-            # Determine if short-term or long-term
-            holding_period = disposal_date - lot.acquisition_date
-            is_short_term = holding_period.days < 365
-            
-            if is_short_term:
-                short_term_gain_loss += gain_loss
-            else:
-                long_term_gain_loss += gain_loss
-            
-            matched_lots.append((lot, amount_to_use))
-            total_basis += basis_used
-            remaining_amount -= amount_to_use
-            
-            # Update the lot in the queue
-            if amount_to_use == lot.amount:
-                # Lot fully consumed, remove it
-                queue.lots.remove(lot)
-                queue.total_amount -= lot.amount
-                queue.total_basis -= lot.basis
-            else:
-                # Lot partially consumed, update it
-                lot.amount -= amount_to_use
-                lot.basis -= basis_used
-                queue.total_amount -= amount_to_use
-                queue.total_basis -= basis_used
+        # Short-term lots were held fewer than LONG_TERM_HOLDING_DAYS whole
+        # days, i.e. acquired after the disposal date less that many days
+        short_term_cutoff = (
+            _to_datetime64(disposal_date) - np.timedelta64(LONG_TERM_HOLDING_DAYS, "D")
+        ).view(np.int64)
+        basis_used, total_basis, short_term_gain_loss, long_term_gain_loss = (
+            _match_gains(
+                uses,
+                lot_amounts,
+                lot_bases,
+                queue._acq_date[matched].view(np.int64),
+                amount,
+                proceeds,
+                short_term_cutoff,
+            )
+        )
+
+        # Update the queue: drop used-up lots, shrink a partially used last lot
+        full_lots = int(np.count_nonzero(uses == lot_amounts))
+        if full_lots < len(uses):
+            queue._lot_id_at(head + full_lots)
+            queue._amount[head + full_lots] -= uses[-1]
+            queue._basis[head + full_lots] -= basis_used[-1]
+        queue._drop_head(full_lots)
+        queue._reduce_totals(uses, basis_used)
         
         # Create disposal result
         disposal_result = DisposalResult(
             disposal_amount=amount - remaining_amount,
             disposal_date=disposal_date,
-            asset=asset,
+            asset=queue.asset,
             matched_lots=matched_lots,
             total_proceeds=proceeds,
             total_basis=total_basis,
@@ -268,16 +741,168 @@ class FIFOManager:
             remaining_amount=remaining_amount
         )
         
-        self.disposal_history.append(disposal_result)
+        self._record_disposal(disposal_result)
         
         logger.info(
-            f"Processed disposal: {amount} {asset} for ${proceeds:.2f}. "
-            f"Gain/Loss: ${disposal_result.total_gain_loss:.2f} "
-            f"(ST: ${short_term_gain_loss:.2f}, LT: ${long_term_gain_loss:.2f})"
+            "Processed disposal: %s %s for $%.2f. "
+            "Gain/Loss: $%.2f (ST: $%.2f, LT: $%.2f)",
+            amount, asset, proceeds, disposal_result.total_gain_loss,
+            short_term_gain_loss, long_term_gain_loss
         )
         
         return disposal_result
     
+    def process_disposals(self, asset: str, amounts: Any, proceeds: Any,
+                          disposal_dates: Sequence[datetime]) -> List[DisposalResult]:
+        """
+        Process consecutive disposals of one asset with a single FIFO match.
+
+        Gives the same lot matching as calling ``process_disposal`` for each
+        disposal in turn, provided no acquisition of the asset falls between
+        them. The lots are walked once for all the disposals, and the queue
+        is updated once afterwards.
+
+        Args:
+            asset: The cryptocurrency asset being disposed
+            amounts: Quantity of each disposal, in order
+            proceeds: Total proceeds in USD of each disposal
+            disposal_dates: Date of each disposal
+
+        Returns:
+            DisposalResult for each disposal, in order
+
+        Raises:
+            ValueError: If any amount is not positive, any proceeds are
+                negative, or the combined amount exceeds the lots available;
+                nothing is processed in that case
+        """
+        amounts = np.asarray(amounts, dtype=np.float64)
+        proceeds = np.asarray(proceeds, dtype=np.float64)
+
+        not_positive = ~(amounts > 0)
+        if not_positive.any():
+            raise ValueError(
+                "Disposal amount must be positive, "
+                f"got {amounts[not_positive.argmax()]}"
+            )
+        negative = proceeds < 0
+        if negative.any():
+            raise ValueError(
+                "Disposal proceeds cannot be negative, "
+                f"got {proceeds[negative.argmax()]}"
+            )
+
+        queue = self.get_or_create_queue(asset)
+        disposal_ends = np.add.accumulate(amounts)
+        total_amount = float(disposal_ends[-1])
+
+        if queue.get_available_amount() < total_amount:
+            raise ValueError(
+                f"Insufficient {asset} available for disposal. "
+                f"Requested: {total_amount}, Available: {queue.get_available_amount()}"
+            )
+
+        short_term_cutoffs = (
+            _to_datetime64_array(pd.Series(disposal_dates))
+            - np.timedelta64(LONG_TERM_HOLDING_DAYS, "D")
+        ).view(np.int64)
+
+        # Match lots using FIFO, walking the live lots disposal by disposal
+        head = queue._head
+        live = slice(head, queue._tail)
+        (pieces, piece_lot, piece_disposal, held_amounts, held_bases, basis_used,
+         unmatched, total_basis, short_term_gain_loss,
+         long_term_gain_loss) = _match_batch_gains(
+            queue._amount[live],
+            queue._basis[live],
+            queue._acq_date[live].view(np.int64),
+            amounts,
+            proceeds,
+            short_term_cutoffs,
+        )
+
+        count = len(amounts)
+        first_piece = np.searchsorted(piece_disposal, np.arange(count + 1))
+        # Lots as each piece found them; default ids are formatted before
+        # the last lot is shrunk
+        last = len(pieces) - 1
+        lot_ids = [queue._lot_id_at(head + lot) for lot in range(piece_lot[last] + 1)]
+        acquired = queue._acq_date[head:head + len(lot_ids)]
+        lots = [
+            Lot(
+                amount=float(held_amounts[piece]),
+                basis=float(held_bases[piece]),
+                acquisition_date=acquired[piece_lot[piece]].item(),
+                asset=queue.asset,
+                lot_id=lot_ids[piece_lot[piece]]
+            )
+            for piece in range(len(pieces))
+        ]
+
+        # Update the queue: drop used-up lots, shrink a partially used last lot
+        full_lots = int(piece_lot[last])
+        if pieces[last] == held_amounts[last]:
+            full_lots += 1
+        else:
+            queue._amount[head + full_lots] = held_amounts[last] - pieces[last]
+            queue._basis[head + full_lots] = held_bases[last] - basis_used[last]
+        queue._drop_head(full_lots)
+        queue._reduce_totals(pieces, basis_used)
+
+        disposal_results = []
+        for index in range(count):
+            amount = float(amounts[index])
+            # Only the last disposals can be short of lots, by rounding
+            remaining = float(unmatched[index])
+            own_pieces = range(first_piece[index], first_piece[index + 1])
+            disposal_result = DisposalResult(
+                disposal_amount=amount - remaining,
+                disposal_date=disposal_dates[index],
+                asset=queue.asset,
+                matched_lots=[
+                    (lots[piece], float(pieces[piece])) for piece in own_pieces
+                ],
+                total_proceeds=float(proceeds[index]),
+                total_basis=float(total_basis[index]),
+                total_gain_loss=float(
+                    short_term_gain_loss[index] + long_term_gain_loss[index]
+                ),
+                short_term_gain_loss=float(short_term_gain_loss[index]),
+                long_term_gain_loss=float(long_term_gain_loss[index]),
+                remaining_amount=remaining
+            )
+            self._record_disposal(disposal_result)
+            disposal_results.append(disposal_result)
+
+        logger.info(
+            "Processed %d disposals of %s totalling %s for $%.2f with one FIFO match",
+            count, asset, total_amount, _sum_in_order(proceeds)
+        )
+
+        return disposal_results
+
+    def _record_disposal(self, disposal_result: DisposalResult) -> None:
+        """
+        Append a disposal to the history and its value columns.
+
+        Args:
+            disposal_result: The processed disposal
+        """
+        index = len(self.disposal_history)
+        if index == len(self._disposal_values):
+            grown = np.empty((2 * index, len(DISPOSAL_VALUE_FIELDS)), order='F')
+            grown[:index] = self._disposal_values
+            self._disposal_values = grown
+            self._disposal_asset_ids = np.resize(self._disposal_asset_ids, 2 * index)
+            self._disposal_dates = np.resize(self._disposal_dates, 2 * index)
+
+        self._disposal_values[index] = [
+            getattr(disposal_result, field) for field in DISPOSAL_VALUE_FIELDS
+        ]
+        self._disposal_asset_ids[index] = self._intern(disposal_result.asset)
+        self._disposal_dates[index] = _to_datetime64(disposal_result.disposal_date)
+        self.disposal_history.append(disposal_result)
+
     def get_queue_summary(self, asset: str) -> Dict[str, Any]:
         """
         Get summary information for a specific asset queue.
@@ -305,7 +930,7 @@ class FIFOManager:
             "asset": asset,
             "total_amount": total_amount,
             "total_basis": total_basis,
-            "lot_count": len(queue.lots),
+            "lot_count": len(queue),
             "average_basis": total_basis / total_amount if total_amount > 0 else 0.0
         }
     
@@ -339,23 +964,48 @@ class FIFOManager:
                 "assets_disposed": []
             }
         
-        total_proceeds = sum(d.total_proceeds for d in self.disposal_history)
-        total_basis = sum(d.total_basis for d in self.disposal_history)
-        total_gain_loss = sum(d.total_gain_loss for d in self.disposal_history)
-        short_term_gain_loss = sum(d.short_term_gain_loss for d in self.disposal_history)
-        long_term_gain_loss = sum(d.long_term_gain_loss for d in self.disposal_history)
-        assets_disposed = list(set(d.asset for d in self.disposal_history))
+        values = self._disposal_values[:len(self.disposal_history)]
+        summary = {"total_disposals": len(self.disposal_history)}
+        for column, field in enumerate(DISPOSAL_VALUE_FIELDS):
+            summary[field] = _sum_in_order(values[:, column])
+        # Assets in order of their first disposal
+        asset_ids = self._disposal_asset_ids[:len(self.disposal_history)]
+        first_disposals = np.sort(np.unique(asset_ids, return_index=True)[1])
+        summary["assets_disposed"] = [
+            self._asset_names[asset_id] for asset_id in asset_ids[first_disposals]
+        ]
         
-        return {
-            "total_disposals": len(self.disposal_history),
-            "total_proceeds": total_proceeds,
-            "total_basis": total_basis,
-            "total_gain_loss": total_gain_loss,
-            "short_term_gain_loss": short_term_gain_loss,
-            "long_term_gain_loss": long_term_gain_loss,
-            "assets_disposed": assets_disposed
-        }
+        return summary
     
+    def to_arrow(self) -> Any:
+        """
+        Export the disposal history as a columnar Arrow table.
+
+        Requires pyarrow (the ``arrow`` extra). Asset symbols are
+        dictionary-encoded and the value columns are passed to Arrow as
+        contiguous float64 arrays.
+
+        Returns:
+            pyarrow.Table with one row per disposal and the columns asset,
+            disposal_date, proceeds, basis, total_gain_loss, short_term_gl
+            and long_term_gl
+        """
+        import pyarrow as pa
+
+        count = len(self.disposal_history)
+        values = self._disposal_values[:count]
+        columns = {
+            "asset": pa.DictionaryArray.from_arrays(
+                self._disposal_asset_ids[:count],
+                pa.array(self._asset_names, type=pa.string())
+            ),
+            "disposal_date": pa.array(self._disposal_dates[:count], from_pandas=True),
+        }
+        for column, name in enumerate(ARROW_VALUE_COLUMNS):
+            columns[name] = pa.array(values[:, column])
+
+        return pa.table(columns)
+
     def import_2023_year_end_data(self, holdings_data: Dict[str, List[Dict[str, Any]]]) -> None:
         """
         Import pre-2024 holdings data to initialize FIFO queues.
@@ -364,23 +1014,37 @@ class FIFOManager:
             holdings_data: Dictionary mapping asset symbols to lists of holdings
                           Each holding should have 'date', 'qty', and 'basis' keys
         """
-        for asset, holdings in holdings_data.items():
-            for holding in holdings:
-                # Parse date
-                if isinstance(holding['date'], str):
-                    acquisition_date = datetime.strptime(holding['date'], '%Y-%m-%d')
-                else:
-                    acquisition_date = holding['date']
-                
-                self.add_acquisition(
-                    asset=asset,
-                    amount=holding['qty'],
-                    basis=holding['basis'],
-                    acquisition_date=acquisition_date,
-                    lot_id=f"2023_ye_{asset}_{acquisition_date.strftime('%Y%m%d')}"
+        holdings_df = pd.DataFrame(
+            [holding for holdings in holdings_data.values() for holding in holdings]
+        )
+
+        if len(holdings_df):
+            # Year-end snapshots repeat a few dates across all assets: each
+            # distinct date string is parsed and formatted once
+            day_codes, days = pd.factorize(holdings_df['date'], use_na_sentinel=False)
+            day_values = pd.to_datetime(pd.Series(days), format='%Y-%m-%d')
+            acquisition_dates = day_values.to_numpy()[day_codes]
+            day_labels = pd.Series(
+                day_values.dt.strftime('%Y%m%d').to_numpy()[day_codes]
+            )
+            amounts = holdings_df['qty'].to_numpy()
+            bases = holdings_df['basis'].to_numpy()
+
+            start = 0
+            for asset, holdings in holdings_data.items():
+                if not holdings:
+                    continue
+
+                block = slice(start, start + len(holdings))
+                start = block.stop
+                self.get_or_create_queue(asset).add_lots_bulk(
+                    amounts[block],
+                    bases[block],
+                    acquisition_dates[block],
+                    f"2023_ye_{asset}_" + day_labels[block]
                 )
         
-        logger.info(f"Imported 2023 year-end data for {len(holdings_data)} assets")
+        logger.info("Imported 2023 year-end data for %d assets", len(holdings_data))
     
     def process_transactions(self, transactions_df: pd.DataFrame) -> List[DisposalResult]:
         """
@@ -392,54 +1056,167 @@ class FIFOManager:
         Returns:
             List of DisposalResult objects for all disposals processed
         """
+        # Sort transactions by date to ensure chronological processing. The
+        # order is found once on the int64 timestamps (stable, so same-time
+        # rows keep their input order, and undated rows go last); only the
+        # columns used below are taken in that order.
+        date_values = _to_datetime64_array(transactions_df['Date'])
+        sort_key = date_values.view(np.int64)
+        sort_key = np.where(np.isnat(date_values), np.iinfo(np.int64).max, sort_key)
+        order = np.argsort(sort_key, kind='stable')
+
+        def column(name: str, dtype: Any = None) -> np.ndarray:
+            """Values of column ``name`` in date order."""
+            return transactions_df[name].to_numpy(dtype=dtype)[order]
+
+        def encoded(*names: str) -> Tuple[np.ndarray, np.ndarray]:
+            """
+            Dictionary-encode columns ``names`` over their shared values.
+
+            Returns the integer codes of each column in date order and the
+            distinct values; a missing value has code -1, which picks the
+            trailing NaN.
+            """
+            values = pd.Categorical(np.concatenate(
+                [transactions_df[name].to_numpy(dtype=object) for name in names]
+            ))
+            codes = values.codes.reshape(len(names), -1)[:, order]
+            return codes, np.append(values.categories.to_numpy(dtype=object), np.nan)
+
+        acquisition_dates = date_values[order]
+        dates = column('Date', object)
+        (type_code,), type_names = encoded('Type')
+        buy_amount = column('BuyAmount')
+        sell_amount = column('SellAmount')
+        (buy_code, sell_code), currency_names = encoded('BuyCurrency', 'SellCurrency')
+        # A zero USD value counts as $0 and a missing one stays NaN
+        usd_value = column('USDEquivalent', np.float64)
+        usd_value = np.where(usd_value == 0, 0.0, usd_value)
+
+        # Type and currency tests run once per distinct value, then by code
+        is_trade = np.isin(type_names, DISPOSAL_TYPES)[type_code]
+        is_income = np.isin(type_names, INCOME_TYPES)[type_code]
+        has_currency = currency_names.astype(bool)
+        # A missing currency counts as none, like the parser's empty string
+        has_currency[-1] = False
+        is_disposal = is_trade & (sell_amount > 0) & has_currency[sell_code]
+        is_acquisition = (
+            (is_trade | is_income) & (buy_amount > 0) & has_currency[buy_code]
+        )
+        # Income events are ordinary income with $0 basis
+        basis = np.where(is_trade, usd_value, 0.0)
+
+        # Acquisitions are queued per asset and added in blocks: those of an
+        # asset only need to be in its queue before that asset's next disposal.
+        # Other transaction types (Deposit, Withdrawal, etc.) may need special
+        # handling based on specific requirements.
+        acquisition_rows = np.flatnonzero(is_acquisition)
+        invalid = (basis[acquisition_rows] < 0) | np.isnat(
+            acquisition_dates[acquisition_rows]
+        )
+        for row in acquisition_rows[invalid]:
+            reason = (
+                f"Acquisition basis cannot be negative, got {basis[row]}"
+                if basis[row] < 0 else "Acquisition date cannot be missing"
+            )
+            logger.error("Error processing transaction on %s: %s", dates[row], reason)
+        acquisition_rows = acquisition_rows[~invalid]
+
+        # Keyed by currency code
+        pending = {
+            code: rows.to_numpy()
+            for code, rows in pd.Series(acquisition_rows).groupby(
+                buy_code[acquisition_rows], sort=False
+            )
+        }
+        added = dict.fromkeys(pending, 0)
+        # Rows whose disposal failed; their acquisition is skipped as well
+        failed_rows = set()
+
+        def add_pending(code: int, before_row: int) -> None:
+            """Add the asset's queued acquisitions from rows before ``before_row``."""
+            rows = pending[code]
+            start = added[code]
+            stop = start + int(np.searchsorted(rows[start:], before_row))
+            block = rows[start:stop]
+            added[code] = stop
+            if failed_rows:
+                block = block[[row not in failed_rows for row in block]]
+            if not len(block):
+                return
+
+            asset = currency_names[code]
+            self.get_or_create_queue(asset)._append_lots(
+                buy_amount[block].astype(np.float64),
+                basis[block],
+                acquisition_dates[block]
+            )
+            logger.info("Added %d acquisitions of %s", len(block), asset)
+
         disposal_results = []
-        
-        # Sort transactions by date to ensure chronological processing
-        sorted_df = transactions_df.sort_values('Date').copy()
-        
-        for _, row in sorted_df.iterrows():
-            try:
-                transaction_type = row['Type']
-                date = row['Date']
-                
-                if transaction_type in ['Trade', 'Spend']:
-                    # Handle disposals (sells)
-                    if row['SellAmount'] > 0 and row['SellCurrency']:
-                        disposal_result = self.process_disposal(
-                            asset=row['SellCurrency'],
-                            amount=row['SellAmount'],
-                            proceeds=row['USDEquivalent'] or 0.0,
-                            disposal_date=date
-                        )
-                        disposal_results.append(disposal_result)
-                    
-                    # Handle acquisitions (buys)
-                    if row['BuyAmount'] > 0 and row['BuyCurrency']:
-                        self.add_acquisition(
-                            asset=row['BuyCurrency'],
-                            amount=row['BuyAmount'],
-                            basis=row['USDEquivalent'] or 0.0,
-                            acquisition_date=date
-                        )
-                
-                elif transaction_type in ['Income', 'Staking', 'Airdrop']:
-                    # Handle income events (ordinary income with $0 basis)
-                    if row['BuyAmount'] > 0 and row['BuyCurrency']:
-                        self.add_acquisition(
-                            asset=row['BuyCurrency'],
-                            amount=row['BuyAmount'],
-                            basis=0.0,  # $0 basis for income events
-                            acquisition_date=date
-                        )
-                
-                # Note: Other transaction types (Deposit, Withdrawal, etc.) 
-                # may need special handling based on specific requirements
-                
-            except Exception as e:
-                logger.error(f"Error processing transaction on {date}: {str(e)}")
-                # Continue processing other transactions
+        disposal_rows = np.flatnonzero(is_disposal)
+        disposal_days = acquisition_dates[disposal_rows].astype('datetime64[D]')
+
+        def dispose(rows: np.ndarray) -> None:
+            """Process the disposals on ``rows``, one at a time."""
+            for row in rows:
+                try:
+                    disposal_result = self.process_disposal(
+                        asset=currency_names[sell_code[row]],
+                        amount=sell_amount[row],
+                        proceeds=usd_value[row],
+                        disposal_date=dates[row]
+                    )
+                    disposal_results.append(disposal_result)
+
+                except Exception as e:
+                    logger.error(
+                        "Error processing transaction on %s: %s", dates[row], e
+                    )
+                    failed_rows.add(row)
+                    # Continue processing other transactions
+                    continue
+
+        position = 0
+        while position < len(disposal_rows):
+            row = disposal_rows[position]
+            code = sell_code[row]
+            next_acquisition = len(order)
+            if code in pending:
+                add_pending(code, row)
+                if added[code] < len(pending[code]):
+                    next_acquisition = pending[code][added[code]]
+
+            # Later disposals of the same asset on the same day join this one
+            # in a single FIFO match, up to the next acquisition of the asset
+            end = position + 1
+            while (
+                end < len(disposal_rows)
+                and sell_code[disposal_rows[end]] == code
+                and disposal_days[end] == disposal_days[position]
+                and disposal_rows[end] <= next_acquisition
+            ):
+                end += 1
+            batch = disposal_rows[position:end]
+            position = end
+
+            if len(batch) == 1 or (usd_value[batch] < 0).any():
+                dispose(batch)
                 continue
+            try:
+                disposal_results.extend(self.process_disposals(
+                    currency_names[code],
+                    sell_amount[batch],
+                    usd_value[batch],
+                    dates[batch],
+                ))
+            except ValueError:
+                # Not enough lots for all of them: find out which ones fail
+                dispose(batch)
         
+        for code in pending:
+            add_pending(code, len(order))
+
         return disposal_results
 
 
@@ -7,8 +7,10 @@ with support for the enhanced 15-column format and 2024 tax year filtering.
 
 import pandas as pd
 import numpy as np
+from pandas.api.types import union_categoricals
 from datetime import datetime, date
 from typing import Dict, List, Optional, Tuple, Any
+import importlib.util
 import logging
 from pathlib import Path
 import re
@@ -36,23 +38,195 @@ EXPECTED_COLUMNS = [
     "UpdatedAt",
 ]
 
+# Expected columns as a set, for checking a file's header
+_EXPECTED_COLUMNS_SET = frozenset(EXPECTED_COLUMNS)
+
 # Valid transaction types based on ManagerAI clarifications
-VALID_TRANSACTION_TYPES = {
-    "Deposit",
-    "Withdrawal",
-    "Trade",
-    "Spend",
-    "Income",
-    "Staking",
-    "Airdrop",
-    "Lost",
-    "Borrow",
-    "Repay",
-}
+VALID_TRANSACTION_TYPES = frozenset(
+    {
+        "Deposit",
+        "Withdrawal",
+        "Trade",
+        "Spend",
+        "Income",
+        "Staking",
+        "Airdrop",
+        "Lost",
+        "Borrow",
+        "Repay",
+    }
+)
+
+# Transaction amount columns: blanks read as 0 and negatives are errors
+AMOUNT_COLUMNS = ["BuyAmount", "SellAmount", "FeeAmount"]
+
+# Low-cardinality text columns stored as pandas categoricals after cleaning
+CATEGORICAL_COLUMNS = ["Type", "BuyCurrency", "SellCurrency", "FeeCurrency", "Exchange"]
+
+# Text columns: stripped, blanks as empty strings
+TEXT_COLUMNS = CATEGORICAL_COLUMNS + ["Comment"]
+
+# Columns parsed as dates while the CSV is read
+DATE_COLUMNS = ["Date", "UpdatedAt"]
+
+# Format of dates the CSV reader leaves as text (e.g. mixed precision)
+DATE_FORMAT = "ISO8601"
+
+# Trailing UTC offset ("Z", "+02:00", "-0500") marking an offset-aware date
+_UTC_OFFSET = re.compile(r"(?:Z|[+-]\d\d:?\d\d)$")
+
+# Translation table deleting currency symbols and thousands separators from
+# amount text
+_AMOUNT_SYMBOLS = str.maketrans("", "", "$,")
 
 # Minimum USD value threshold for dust filtering
 DUST_THRESHOLD_USD = 0.01
 
+# read_csv engine: PyArrow's multithreaded reader when the optional "arrow"
+# extra is installed, pandas' C parser otherwise
+CSV_ENGINE = "pyarrow" if importlib.util.find_spec("pyarrow") else "c"
+
+
+def _to_numeric(values: pd.Series) -> pd.Series:
+    """
+    Convert a column to numbers.
+
+    Columns the CSV reader already parsed as numbers are returned as they
+    are. Others are converted from text with currency symbols and commas
+    removed; invalid values become NaN.
+
+    Args:
+        values: Column as read from the CSV
+
+    Returns:
+        Numeric column
+    """
+    if values.dtype.kind in "iuf":
+        return values
+    return pd.to_numeric(
+        values.astype(str).str.translate(_AMOUNT_SYMBOLS), errors="coerce"
+    )
+
+
+def _to_datetime(values: pd.Series) -> pd.Series:
+    """
+    Parse a date column the CSV reader could not.
+
+    Parses ISO 8601 dates of any precision (``2024-01-15``,
+    ``2024-01-15 12:00:00``, ``2024-01-15T12:00:00Z``) in compiled code,
+    rather than guessing a format from the first value and handing every
+    other value to dateutil. If any date carries a UTC offset, the whole
+    column is converted to UTC and naive dates are read as UTC. Invalid
+    values become NaT.
+
+    Args:
+        values: Date column as read from the CSV
+
+    Returns:
+        Datetime column
+    """
+    aware = values.astype(str).str.contains(_UTC_OFFSET)
+    if not aware.any():
+        return pd.to_datetime(values, format=DATE_FORMAT, errors="coerce")
+    # Parsed together, pandas would give naive dates the offset of the
+    # aware date before them, so each kind is parsed on its own
+    dates = pd.to_datetime(
+        values.where(aware), format=DATE_FORMAT, errors="coerce", utc=True
+    )
+    naive = pd.to_datetime(values.where(~aware), format=DATE_FORMAT, errors="coerce")
+    return dates.where(aware, naive.dt.tz_localize("UTC"))
+
+
+def _in_year(dates: pd.Series, year: int) -> np.ndarray:
+    """
+    Mark the dates that fall within a calendar year.
+
+    Compares against the year's first and last instant instead of taking
+    ``dt.year`` of every date. Time zone aware dates are compared in their
+    own time zone, as ``dt.year`` would; missing dates are outside any year.
+
+    Args:
+        dates: Datetime column
+        year: Calendar year
+
+    Returns:
+        Boolean array, True where the date is within the year
+    """
+    tz = dates.dt.tz
+    start = pd.Timestamp(year, 1, 1).tz_localize(tz)
+    end = pd.Timestamp(year + 1, 1, 1).tz_localize(tz)
+    return ((dates >= start) & (dates < end)).to_numpy()
+
+
+def _in_expected_order(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Put columns read with ``usecols=EXPECTED_COLUMNS`` in that order.
+
+    ``usecols`` keeps the file's column order.
+
+    Args:
+        df: DataFrame with the expected columns
+
+    Returns:
+        DataFrame with columns in ``EXPECTED_COLUMNS`` order
+    """
+    if list(df.columns) != EXPECTED_COLUMNS:
+        df = df[EXPECTED_COLUMNS]
+    return df
+
+
+def _count_negatives(*columns: np.ndarray) -> List[int]:
+    """
+    Count the negative values in each of several numeric arrays.
+
+    Works on the column arrays as they are, without stacking them into a
+    2-D copy. Only plain arrays go in and integers come out, so a compiled
+    kernel (e.g. ``numba.njit``) could stand in for it.
+
+    Args:
+        columns: One numeric array per column
+
+    Returns:
+        Number of negative values in each column
+    """
+    return [int(np.count_nonzero(values < 0)) for values in columns]
+
+
+def _count_values(values: pd.Series, limit: Optional[int] = None) -> Dict[Any, int]:
+    """
+    Count each distinct value of a column, most frequent first.
+
+    Counts the column's category codes with ``np.bincount``; text columns
+    are dictionary-encoded first, so each distinct string is hashed once.
+    Categories with no rows left (after filtering) are not reported, and
+    equal counts keep category order. Missing values are not counted.
+
+    Args:
+        values: Column to count
+        limit: Number of most frequent values to keep; None keeps all
+
+    Returns:
+        Dictionary mapping value to row count
+    """
+    values = values.astype("category").array
+    codes = values.codes
+    counts = np.bincount(codes[codes >= 0], minlength=len(values.categories))
+    observed = np.flatnonzero(counts)
+    order = observed[np.argsort(-counts[observed], kind="stable")][:limit]
+    return dict(zip(values.categories[order].tolist(), counts[order].tolist()))
+
+
+def _write_frame(df: pd.DataFrame, output_path: str) -> None:
+    """Write a DataFrame as Parquet, Feather or CSV depending on the file suffix."""
+    suffix = Path(output_path).suffix.lower()
+    if suffix == ".parquet":
+        df.to_parquet(output_path, engine="pyarrow", compression="snappy", index=False)
+    elif suffix == ".feather":
+        # Feather only stores a default RangeIndex
+        df.reset_index(drop=True).to_feather(output_path)
+    else:
+        df.to_csv(output_path, index=False)
+
 
 class TransactionParser:
     """
@@ -66,6 +240,7 @@ class TransactionParser:
         self,
         enable_2024_filter: bool = True,
         dust_threshold: float = DUST_THRESHOLD_USD,
+        chunk_size: Optional[int] = None,
     ):
         """
         Initialize the transaction parser.
@@ -73,9 +248,12 @@ class TransactionParser:
         Args:
             enable_2024_filter: Whether to filter for 2024 transactions only
             dust_threshold: Minimum USD value to avoid dust transactions
+            chunk_size: Rows to read at a time from large files (e.g.
+                200_000); None reads the whole file at once
         """
         self.enable_2024_filter = enable_2024_filter
         self.dust_threshold = dust_threshold
+        self.chunk_size = chunk_size
         self.validation_errors: List[str] = []
         self.validation_warnings: List[str] = []
 
@@ -93,14 +271,18 @@ class TransactionParser:
             ValueError: If file cannot be loaded or has invalid format
         """
         try:
-            # Load CSV file
-            df = pd.read_csv(file_path)
-            logger.info(f"Loaded {len(df)} rows from {file_path}")
-
-            # Validate and clean the data
-            df = self._validate_csv_structure(df)
-            df = self._clean_data_types(df)
-            df = self._apply_filters(df)
+            # Check the header, then parse only the expected columns
+            self._validate_csv_structure(pd.read_csv(file_path, nrows=0))
+            if self.chunk_size is None:
+                df = _in_expected_order(self._read_csv(file_path, engine=CSV_ENGINE))
+                logger.info(f"Loaded {len(df)} rows from {file_path}")
+
+                # Clean and filter the data
+                df = self._clean_data_types(df)
+                df = self._apply_filters(df)
+            else:
+                df = self._load_csv_chunks(file_path)
+
             df = self._validate_data_quality(df)
 
             logger.info(f"Processed {len(df)} valid transactions")
@@ -110,22 +292,86 @@ class TransactionParser:
             logger.error(f"Error loading CSV file {file_path}: {str(e)}")
             raise ValueError(f"Failed to load CSV: {str(e)}")
 
-    def _validate_csv_structure(self, df: pd.DataFrame) -> pd.DataFrame:
+    def _read_csv(self, file_path: str, **options: Any) -> Any:
         """
-        Validate that CSV has expected structure and columns.
+        Read the expected columns of a CSV, parsing the date columns.
 
         Args:
-            df: Raw DataFrame from CSV
+            file_path: Path to the CSV file
+            **options: Further ``pd.read_csv`` options
 
         Returns:
-            DataFrame with validated structure
+            DataFrame, or a chunk reader when ``chunksize`` is given
+        """
+        return pd.read_csv(
+            file_path, usecols=EXPECTED_COLUMNS, parse_dates=DATE_COLUMNS, **options
+        )
+
+    def _load_csv_chunks(self, file_path: str) -> pd.DataFrame:
+        """
+        Clean and filter a CSV chunk by chunk, keeping only surviving rows.
+
+        Peak memory is about one chunk of raw rows plus the rows kept so far.
+        Reads with pandas' C parser, as the PyArrow engine cannot read in
+        chunks. Invalid transaction types are reported once for the file.
+
+        Args:
+            file_path: Path to the CSV file
+
+        Returns:
+            Cleaned and filtered DataFrame
+        """
+        chunks = []
+        invalid_types = []
+        row_count = 0
+        # Text columns are read as text so that no chunk infers them as numbers
+        text_dtypes = {col: str for col in TEXT_COLUMNS}
+        with self._read_csv(
+            file_path, chunksize=self.chunk_size, dtype=text_dtypes
+        ) as reader:
+            for chunk in reader:
+                row_count += len(chunk)
+                chunk = self._clean_data_types(_in_expected_order(chunk))
+                chunk, chunk_invalid_types = self._filter_rows(chunk)
+                chunks.append(chunk)
+                invalid_types.append(chunk_invalid_types)
+        logger.info(
+            f"Loaded {row_count} rows from {file_path} "
+            f"in chunks of {self.chunk_size}"
+        )
+        self._report_invalid_types(pd.unique(np.concatenate(invalid_types)))
+
+        # Leave out chunks whose rows were all filtered; even a header-only
+        # file yields one (empty) chunk, kept so its columns survive
+        chunks = [chunk for chunk in chunks if len(chunk)] or chunks[:1]
+        df = pd.concat(chunks)
+        for col in DATE_COLUMNS:
+            # Each chunk infers its own dates; e.g. a chunk of naive dates is
+            # not time zone aware, so with UTC chunks they concatenate to
+            # objects. As in _to_datetime, naive dates are then read as UTC.
+            if not pd.api.types.is_datetime64_any_dtype(df[col]):
+                df[col] = pd.to_datetime(df[col], utc=True)
+        for col in CATEGORICAL_COLUMNS:
+            # Chunks with different categories concatenate to object columns
+            if not isinstance(df[col].dtype, pd.CategoricalDtype):
+                df[col] = union_categoricals([chunk[col] for chunk in chunks])
+        return df
+
+    def _validate_csv_structure(self, df: pd.DataFrame) -> None:
+        """
+        Validate that CSV has expected structure and columns.
+
+        Args:
+            df: DataFrame read from the CSV; only its columns are checked, so
+                the header alone is enough
 
         Raises:
             ValueError: If structure is invalid
         """
         # Check if we have the expected columns
-        missing_columns = set(EXPECTED_COLUMNS) - set(df.columns)
-        extra_columns = set(df.columns) - set(EXPECTED_COLUMNS)
+        columns = set(df.columns)
+        missing_columns = {col for col in EXPECTED_COLUMNS if col not in columns}
+        extra_columns = columns - _EXPECTED_COLUMNS_SET
 
         if missing_columns:
             raise ValueError(f"Missing required columns: {missing_columns}")
@@ -133,13 +379,7 @@ class TransactionParser:
         if extra_columns:
             logger.warning(f"Extra columns found (will be ignored): {extra_columns}")
 
-        # Select only the expected columns in the correct order
-        df = df[EXPECTED_COLUMNS].copy()
-
-        logger.info(
-            f"CSV structure validated: {len(df)} rows, {len(EXPECTED_COLUMNS)} columns"
-        )
-        return df
+        logger.info(f"CSV structure validated: {len(EXPECTED_COLUMNS)} columns")
 
     def _clean_data_types(self, df: pd.DataFrame) -> pd.DataFrame:
         """
@@ -151,48 +391,50 @@ class TransactionParser:
         Returns:
             DataFrame with cleaned data types
         """
-        df = df.copy()
+        # Columns are only ever replaced, never modified in place, so the
+        # caller's frame is left untouched without copying its data
+        df = df.copy(deep=False)
 
         # Clean numeric columns (remove currency symbols, commas)
-        numeric_columns = ["BuyAmount", "SellAmount", "FeeAmount"]
-        for col in numeric_columns:
+        for col in AMOUNT_COLUMNS:
             if col in df.columns:
-                # Convert to string first, then clean
-                df[col] = df[col].astype(str)
-                # Remove currency symbols and commas
-                df[col] = df[col].str.replace(r"[$,]", "", regex=True)
-                # Convert to numeric, invalid values become NaN
-                df[col] = pd.to_numeric(df[col], errors="coerce")
+                df[col] = _to_numeric(df[col])
                 # Fill NaN with 0 for amounts
                 df[col] = df[col].fillna(0)
 
         # Clean USDEquivalent column
         if "USDEquivalent" in df.columns:
-            df["USDEquivalent"] = df["USDEquivalent"].astype(str)
-            df["USDEquivalent"] = df["USDEquivalent"].str.replace(
-                r"[$,]", "", regex=True
-            )
-            df["USDEquivalent"] = pd.to_numeric(df["USDEquivalent"], errors="coerce")
+            df["USDEquivalent"] = _to_numeric(df["USDEquivalent"])
 
-        # Parse dates
-        df["Date"] = pd.to_datetime(df["Date"], errors="coerce")
-        df["UpdatedAt"] = pd.to_datetime(df["UpdatedAt"], errors="coerce")
+        # Parse dates the CSV reader could not, invalid values become NaT.
+        # Offset-aware dates are kept in UTC, so the 2024 filter does not
+        # depend on which offsets a file (or a chunk of it) happens to hold.
+        for col in DATE_COLUMNS:
+            if not pd.api.types.is_datetime64_any_dtype(df[col]):
+                df[col] = _to_datetime(df[col])
+            if df[col].dt.tz is not None:
+                df[col] = df[col].dt.tz_convert("UTC")
 
         # Clean string columns
-        string_columns = [
-            "Type",
-            "BuyCurrency",
-            "SellCurrency",
-            "FeeCurrency",
-            "Exchange",
-            "Comment",
-        ]
-        for col in string_columns:
+        for col in TEXT_COLUMNS:
             if col in df.columns:
-                df[col] = df[col].astype(str).str.strip()
+                values = df[col]
+                if values.dtype == object:
+                    # Text column: blank cells are NaN (C engine) or None
+                    # (PyArrow engine)
+                    values = values.fillna("")
+                else:
+                    # Read as numbers, or blank throughout
+                    values = values.astype(str)
+                df[col] = values.str.strip()
                 # Replace 'nan' string with empty string
                 df[col] = df[col].replace("nan", "")
 
+        # Few distinct values each: store them once, rows as integer codes
+        for col in CATEGORICAL_COLUMNS:
+            if col in df.columns:
+                df[col] = df[col].astype("category")
+
         logger.info("Data types cleaned and converted")
         return df
 
@@ -206,42 +448,87 @@ class TransactionParser:
         Returns:
             Filtered DataFrame
         """
+        df, invalid_types = self._filter_rows(df)
+        self._report_invalid_types(invalid_types)
+        return df
+
+    def _filter_rows(self, df: pd.DataFrame) -> Tuple[pd.DataFrame, np.ndarray]:
+        """
+        Drop the rows excluded by the configured filters.
+
+        Args:
+            df: DataFrame with cleaned data
+
+        Returns:
+            Tuple of (filtered DataFrame, invalid transaction types found)
+        """
         original_count = len(df)
+        # Rows kept by all filters so far; the frame is only sliced once
+        keep = np.ones(original_count, dtype=bool)
 
         # Filter for 2024 transactions if enabled
         if self.enable_2024_filter:
-            df = df[df["Date"].dt.year == 2024].copy()
+            keep &= _in_year(df["Date"], 2024)
             logger.info(
-                f"2024 filter applied: {len(df)} transactions (from {original_count})"
+                f"2024 filter applied: {np.count_nonzero(keep)} transactions "
+                f"(from {original_count})"
             )
 
-        # Filter out dust transactions
-        if self.dust_threshold > 0:
-            # Consider a transaction as dust if USD equivalent is below threshold
-            dust_mask = (df["USDEquivalent"].fillna(0) >= self.dust_threshold) | df[
-                "USDEquivalent"
-            ].isna()
-            dust_filtered = df[dust_mask].copy()
-            dust_count = len(df) - len(dust_filtered)
+        # Filter out dust transactions; no mask is needed when even the
+        # smallest USD equivalent (missing values skipped) is not dust
+        if self.dust_threshold > 0 and not (
+            df["USDEquivalent"].min() >= self.dust_threshold
+        ):
+            # Consider a transaction as dust if USD equivalent is below
+            # threshold; missing values compare False and are kept
+            dust = df["USDEquivalent"].to_numpy() < self.dust_threshold
+            dust &= keep
+            dust_count = np.count_nonzero(dust)
             if dust_count > 0:
                 logger.info(
                     f"Filtered out {dust_count} dust transactions (< ${self.dust_threshold})"
                 )
-            df = dust_filtered
+            keep &= ~dust
+
+        # Filter out invalid transaction types: check each category once,
+        # then look up every row by its integer code in a single pass
+        # (missing types have code -1, which picks the trailing False)
+        types = df["Type"].astype("category").array
+        category_valid = np.append(
+            types.categories.isin(VALID_TRANSACTION_TYPES), False
+        )
+        valid_type = category_valid[types.codes]
+        # Only the codes of invalid rows are searched for distinct types
+        invalid_codes = pd.unique(types.codes[keep & ~valid_type])
+        invalid_types = pd.Categorical.from_codes(
+            invalid_codes, dtype=types.dtype
+        ).to_numpy()
+        keep &= valid_type
+
+        # take() builds the filtered frame in one copy, not marked as a view
+        df = df.take(np.flatnonzero(keep))
+        if len(df) < original_count:
+            # Drop the categories only filtered-out rows used, which would
+            # otherwise show up as zero counts in value_counts() or groupby()
+            for col in CATEGORICAL_COLUMNS:
+                if col in df.columns and isinstance(df[col].dtype, pd.CategoricalDtype):
+                    df[col] = df[col].cat.remove_unused_categories()
+
+        return df, invalid_types
+
+    def _report_invalid_types(self, invalid_types: np.ndarray) -> None:
+        """
+        Warn about transaction types that were filtered out as invalid.
 
-        # Filter out invalid transaction types
-        valid_type_mask = df["Type"].isin(VALID_TRANSACTION_TYPES)
-        invalid_types = df[~valid_type_mask]["Type"].unique()
+        Args:
+            invalid_types: Distinct invalid transaction types
+        """
         if len(invalid_types) > 0:
             logger.warning(f"Found invalid transaction types: {invalid_types}")
             self.validation_warnings.append(
                 f"Invalid transaction types found: {invalid_types}"
             )
 
-        df = df[valid_type_mask].copy()
-
-        return df
-
     def _validate_data_quality(self, df: pd.DataFrame) -> pd.DataFrame:
         """
         Validate data quality and flag issues.
@@ -253,48 +540,32 @@ class TransactionParser:
             DataFrame with validation flags
         """
         # Check for negative quantities
-        negative_buy = df["BuyAmount"] < 0
-        negative_sell = df["SellAmount"] < 0
-        negative_fee = df["FeeAmount"] < 0
-
-        if negative_buy.any():
-            count = negative_buy.sum()
-            self.validation_errors.append(
-                f"Found {count} transactions with negative BuyAmount"
-            )
-            logger.error(f"CRITICAL: {count} transactions have negative BuyAmount")
-
-        if negative_sell.any():
-            count = negative_sell.sum()
-            self.validation_errors.append(
-                f"Found {count} transactions with negative SellAmount"
-            )
-            logger.error(f"CRITICAL: {count} transactions have negative SellAmount")
-
-        if negative_fee.any():
-            count = negative_fee.sum()
-            self.validation_errors.append(
-                f"Found {count} transactions with negative FeeAmount"
-            )
-            logger.error(f"CRITICAL: {count} transactions have negative FeeAmount")
+        negative_counts = _count_negatives(
+            *(df[col].to_numpy() for col in AMOUNT_COLUMNS)
+        )
+        for col, count in zip(AMOUNT_COLUMNS, negative_counts):
+            if count:
+                self.validation_errors.append(
+                    f"Found {count} transactions with negative {col}"
+                )
+                logger.error(f"CRITICAL: {count} transactions have negative {col}")
 
         # Check for missing critical data
-        missing_date = df["Date"].isna()
-        missing_type = df["Type"].isna() | (df["Type"] == "")
+        missing = df[["Date", "Type"]].isna().to_numpy()
+        missing[:, 1] |= (df["Type"] == "").to_numpy()
+        missing_date_count, missing_type_count = missing.sum(axis=0)
 
-        if missing_date.any():
-            count = missing_date.sum()
+        if missing_date_count:
             self.validation_errors.append(
-                f"Found {count} transactions with missing dates"
+                f"Found {missing_date_count} transactions with missing dates"
             )
-            logger.error(f"CRITICAL: {count} transactions missing dates")
+            logger.error(f"CRITICAL: {missing_date_count} transactions missing dates")
 
-        if missing_type.any():
-            count = missing_type.sum()
+        if missing_type_count:
             self.validation_errors.append(
-                f"Found {count} transactions with missing type"
+                f"Found {missing_type_count} transactions with missing type"
             )
-            logger.error(f"CRITICAL: {count} transactions missing type")
+            logger.error(f"CRITICAL: {missing_type_count} transactions missing type")
 
         # Check for missing USD equivalent (warning only)
         missing_usd = df["USDEquivalent"].isna()
@@ -329,37 +600,34 @@ class TransactionParser:
         if df.empty:
             return {"error": "No transactions to analyze"}
 
+        # Reduce the date array directly; missing dates are skipped
+        dates = df["Date"].array
+        first_date, last_date = dates.min(), dates.max()
+        usd_value = df["USDEquivalent"]
+        missing_usd = usd_value.isna()
+        all_usd_missing = missing_usd.all()
+
         summary = {
             "total_transactions": len(df),
             "date_range": {
                 "start": (
-                    df["Date"].min().strftime("%Y-%m-%d")
-                    if not df["Date"].min() is pd.NaT
-                    else None
+                    first_date.strftime("%Y-%m-%d") if not pd.isna(first_date) else None
                 ),
                 "end": (
-                    df["Date"].max().strftime("%Y-%m-%d")
-                    if not df["Date"].max() is pd.NaT
-                    else None
+                    last_date.strftime("%Y-%m-%d") if not pd.isna(last_date) else None
                 ),
             },
-            "transaction_types": df["Type"].value_counts().to_dict(),
-            "exchanges": df["Exchange"].value_counts().head(10).to_dict(),
+            "transaction_types": _count_values(df["Type"]),
+            "exchanges": _count_values(df["Exchange"], 10),
             "currencies": {
-                "buy_currencies": df["BuyCurrency"].value_counts().head(10).to_dict(),
-                "sell_currencies": df["SellCurrency"].value_counts().head(10).to_dict(),
+                "buy_currencies": _count_values(df["BuyCurrency"], 10),
+                "sell_currencies": _count_values(df["SellCurrency"], 10),
             },
             "value_stats": {
-                "total_usd_equivalent": (
-                    df["USDEquivalent"].sum()
-                    if not df["USDEquivalent"].isna().all()
-                    else 0
-                ),
-                "missing_usd_count": df["USDEquivalent"].isna().sum(),
+                "total_usd_equivalent": (usd_value.sum() if not all_usd_missing else 0),
+                "missing_usd_count": missing_usd.sum(),
                 "avg_transaction_value": (
-                    df["USDEquivalent"].mean()
-                    if not df["USDEquivalent"].isna().all()
-                    else 0
+                    usd_value.mean() if not all_usd_missing else 0
                 ),
             },
             "validation": {
@@ -372,14 +640,18 @@ class TransactionParser:
 
     def save_processed_data(self, df: pd.DataFrame, output_path: str) -> None:
         """
-        Save processed transaction data to CSV.
+        Save processed transaction data.
+
+        The format follows the file suffix: ``.parquet`` (snappy-compressed)
+        and ``.feather`` keep the column types and are written through
+        PyArrow, anything else is written as CSV.
 
         Args:
             df: Processed DataFrame
             output_path: Path for output file
         """
         try:
-            df.to_csv(output_path, index=False)
+            _write_frame(df, output_path)
             logger.info(f"Processed data saved to {output_path}")
         except Exception as e:
             logger.error(f"Error saving processed data: {str(e)}")
@@ -390,6 +662,7 @@ def parse_transaction_file(
     file_path: str,
     enable_2024_filter: bool = True,
     dust_threshold: float = DUST_THRESHOLD_USD,
+    chunk_size: Optional[int] = None,
 ) -> Tuple[pd.DataFrame, Dict[str, Any]]:
     """
     Convenience function to parse a transaction file.
@@ -398,12 +671,15 @@ def parse_transaction_file(
         file_path: Path to the CSV file
         enable_2024_filter: Whether to filter for 2024 only
         dust_threshold: Minimum USD value threshold
+        chunk_size: Rows to read at a time; None reads the whole file at once
 
     Returns:
         Tuple of (processed DataFrame, summary statistics)
     """
     parser = TransactionParser(
-        enable_2024_filter=enable_2024_filter, dust_threshold=dust_threshold
+        enable_2024_filter=enable_2024_filter,
+        dust_threshold=dust_threshold,
+        chunk_size=chunk_size,
     )
 
     df = parser.load_csv(file_path)
@@ -8,12 +8,33 @@ and integration with FIFO manager for cryptocurrency tax calculations.
 import pandas as pd
 import numpy as np
 from datetime import datetime, date
-from typing import Dict, List, Optional, Tuple, Any, NamedTuple
+from typing import (
+    Dict,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Tuple,
+    Any,
+    NamedTuple,
+    Union,
+)
 from enum import Enum
 import logging
+from collections import abc
 from dataclasses import dataclass
-
-from .fifo_manager import FIFOManager, DisposalResult, Lot
+from types import MappingProxyType
+
+from .fifo_manager import (
+    FIFOManager,
+    DisposalResult,
+    Lot,
+    DISPOSAL_TYPES,
+    INCOME_TYPES,
+    LONG_TERM_HOLDING_DAYS,
+    _sum_in_order,
+    _to_datetime64_array,
+)
 
 # Configure logging
 logger = logging.getLogger(__name__)
@@ -49,9 +70,41 @@ class TransactionCategory(Enum):
     EXPENSE = "expense"  # Fees, losses, etc.
 
 
-@dataclass
+# Member order used for the int8 tax treatment / category codes
+_TREATMENTS: Tuple[TaxTreatment, ...] = tuple(TaxTreatment)
+_CATEGORIES: Tuple[TransactionCategory, ...] = tuple(TransactionCategory)
+_TREATMENT_CODES: Dict[TaxTreatment, int] = {t: i for i, t in enumerate(_TREATMENTS)}
+_CATEGORY_CODES: Dict[TransactionCategory, int] = {
+    c: i for i, c in enumerate(_CATEGORIES)
+}
+# Long-term counterpart of each short-term treatment
+_LONG_TERM_TREATMENTS: Dict[TaxTreatment, TaxTreatment] = {
+    TaxTreatment.SHORT_TERM_GAIN: TaxTreatment.LONG_TERM_GAIN,
+    TaxTreatment.SHORT_TERM_LOSS: TaxTreatment.LONG_TERM_LOSS,
+}
+_SHORT_TERM_GAIN_CODE = _TREATMENT_CODES[TaxTreatment.SHORT_TERM_GAIN]
+_SHORT_TERM_LOSS_CODE = _TREATMENT_CODES[TaxTreatment.SHORT_TERM_LOSS]
+_LONG_TERM_GAIN_CODE = _TREATMENT_CODES[TaxTreatment.LONG_TERM_GAIN]
+_LONG_TERM_LOSS_CODE = _TREATMENT_CODES[TaxTreatment.LONG_TERM_LOSS]
+
+# Columns read to apply transactions to the FIFO queues
+_FIFO_COLUMNS: Tuple[str, ...] = (
+    "BuyAmount",
+    "BuyCurrency",
+    "SellAmount",
+    "SellCurrency",
+    "USDEquivalent",
+)
+
+
+@dataclass(frozen=True, slots=True)
 class TaxClassification:
-    """Tax classification result for a transaction."""
+    """
+    Tax classification result for a transaction.
+
+    Immutable, so ``TransactionTypeMapper`` can hand out one shared instance
+    per transaction type and treatment.
+    """
 
     transaction_type: str
     tax_treatment: TaxTreatment
@@ -61,90 +114,155 @@ class TaxClassification:
     notes: str = ""
 
 
-class TransactionTypeMapper:
-    """
-    Maps transaction types to IRS-compliant tax treatments.
-
-    Provides comprehensive mapping for all supported transaction types
-    according to current IRS cryptocurrency guidance.
-    """
-
-    def __init__(self):
-        """Initialize the transaction type mapper."""
-        self._initialize_mappings()
-
-    def _initialize_mappings(self):
-        """Initialize the transaction type to tax treatment mappings."""
-
-        # Core transaction type mappings
-        self.transaction_mappings = {
-            # Trades (buy/sell)
-            "Trade": {
+# Tax treatment, category and FIFO handling by transaction type. Shared,
+# read-only, by all TransactionTypeMapper instances.
+_TRANSACTION_MAPPINGS: Mapping[str, Mapping[str, Any]] = MappingProxyType(
+    {
+        # Trades (buy/sell)
+        "Trade": MappingProxyType(
+            {
                 "tax_treatment": TaxTreatment.SHORT_TERM_GAIN,  # Default, will be adjusted by holding period
                 "category": TransactionCategory.ACQUISITION,
                 "requires_fifo": True,
                 "description": "Cryptocurrency trade (buy/sell)",
-            },
-            # Spending
-            "Spend": {
+            }
+        ),
+        # Spending
+        "Spend": MappingProxyType(
+            {
                 "tax_treatment": TaxTreatment.SHORT_TERM_GAIN,  # Default, will be adjusted by holding period
                 "category": TransactionCategory.DISPOSAL,
                 "requires_fifo": True,
                 "description": "Spending cryptocurrency (disposal event)",
-            },
-            # Income events (ordinary income)
-            "Income": {
+            }
+        ),
+        # Income events (ordinary income)
+        "Income": MappingProxyType(
+            {
                 "tax_treatment": TaxTreatment.ORDINARY_INCOME,
                 "category": TransactionCategory.INCOME,
                 "requires_fifo": False,
                 "description": "Ordinary income (mining, etc.)",
-            },
-            "Staking": {
+            }
+        ),
+        "Staking": MappingProxyType(
+            {
                 "tax_treatment": TaxTreatment.ORDINARY_INCOME,
                 "category": TransactionCategory.INCOME,
                 "requires_fifo": False,
                 "description": "Staking rewards (ordinary income)",
-            },
-            "Airdrop": {
+            }
+        ),
+        "Airdrop": MappingProxyType(
+            {
                 "tax_treatment": TaxTreatment.ORDINARY_INCOME,
                 "category": TransactionCategory.INCOME,
                 "requires_fifo": False,
                 "description": "Airdrop (ordinary income at FMV)",
-            },
-            # Transfers (non-taxable)
-            "Deposit": {
+            }
+        ),
+        # Transfers (non-taxable)
+        "Deposit": MappingProxyType(
+            {
                 "tax_treatment": TaxTreatment.NON_TAXABLE,
                 "category": TransactionCategory.TRANSFER,
                 "requires_fifo": False,
                 "description": "Deposit to exchange (non-taxable transfer)",
-            },
-            "Withdrawal": {
+            }
+        ),
+        "Withdrawal": MappingProxyType(
+            {
                 "tax_treatment": TaxTreatment.NON_TAXABLE,
                 "category": TransactionCategory.TRANSFER,
                 "requires_fifo": False,
                 "description": "Withdrawal from exchange (non-taxable transfer)",
-            },
-            # Loss events
-            "Lost": {
+            }
+        ),
+        # Loss events
+        "Lost": MappingProxyType(
+            {
                 "tax_treatment": TaxTreatment.SHORT_TERM_LOSS,  # Default, will be adjusted by holding period
                 "category": TransactionCategory.EXPENSE,
                 "requires_fifo": True,
                 "description": "Lost cryptocurrency (theft/loss)",
-            },
-            # DeFi events
-            "Borrow": {
+            }
+        ),
+        # DeFi events
+        "Borrow": MappingProxyType(
+            {
                 "tax_treatment": TaxTreatment.NON_TAXABLE,
                 "category": TransactionCategory.TRANSFER,
                 "requires_fifo": False,
                 "description": "Borrowing against collateral (non-taxable)",
-            },
-            "Repay": {
+            }
+        ),
+        "Repay": MappingProxyType(
+            {
                 "tax_treatment": TaxTreatment.NON_TAXABLE,
                 "category": TransactionCategory.TRANSFER,
                 "requires_fifo": False,
                 "description": "Repaying borrowed amount (non-taxable)",
-            },
+            }
+        ),
+    }
+)
+
+# Per-type tables in type code order, for classifying whole columns. The
+# extra last entry is what unsupported types (code -1) pick up.
+_TYPE_DTYPE = pd.CategoricalDtype(list(_TRANSACTION_MAPPINGS))
+_TYPE_TREATMENT_CODES = np.array(
+    [_TREATMENT_CODES[m["tax_treatment"]] for m in _TRANSACTION_MAPPINGS.values()]
+    + [-1],
+    dtype=np.int8,
+)
+_TYPE_CATEGORY_CODES = np.array(
+    [_CATEGORY_CODES[m["category"]] for m in _TRANSACTION_MAPPINGS.values()] + [-1],
+    dtype=np.int8,
+)
+_TYPE_FIFO_REQUIRED = np.array(
+    [m["requires_fifo"] for m in _TRANSACTION_MAPPINGS.values()] + [False],
+    dtype=bool,
+)
+
+# One classification per type and each treatment it can end up with after
+# the holding period adjustment, returned by every classify call
+_CLASSIFICATIONS: Mapping[Tuple[str, TaxTreatment], TaxClassification] = (
+    MappingProxyType(
+        {
+            (transaction_type, treatment): TaxClassification(
+                transaction_type=transaction_type,
+                tax_treatment=treatment,
+                category=mapping["category"],
+                requires_fifo_processing=mapping["requires_fifo"],
+                notes=mapping["description"],
+            )
+            for transaction_type, mapping in _TRANSACTION_MAPPINGS.items()
+            for treatment in (
+                mapping["tax_treatment"],
+                _LONG_TERM_TREATMENTS.get(
+                    mapping["tax_treatment"], mapping["tax_treatment"]
+                ),
+            )
         }
+    )
+)
+
+
+class TransactionTypeMapper:
+    """
+    Maps transaction types to IRS-compliant tax treatments.
+
+    Provides comprehensive mapping for all supported transaction types
+    according to current IRS cryptocurrency guidance.
+    """
+
+    def __init__(self):
+        """Initialize the transaction type mapper."""
+        self._initialize_mappings()
+
+    def _initialize_mappings(self):
+        """Initialize the transaction type to tax treatment mappings."""
+        self.transaction_mappings = _TRANSACTION_MAPPINGS
 
     def classify_transaction(
         self,
@@ -179,7 +297,7 @@ class TransactionTypeMapper:
         ]:
             if acquisition_date and transaction_date:
                 holding_period = (transaction_date - acquisition_date).days
-                if holding_period >= 365:
+                if holding_period >= LONG_TERM_HOLDING_DAYS:
                     # Convert to long-term
                     if base_treatment == TaxTreatment.SHORT_TERM_GAIN:
                         adjusted_treatment = TaxTreatment.LONG_TERM_GAIN
@@ -192,13 +310,62 @@ class TransactionTypeMapper:
         else:
             adjusted_treatment = base_treatment
 
-        return TaxClassification(
-            transaction_type=transaction_type,
-            tax_treatment=adjusted_treatment,
-            category=mapping["category"],
-            requires_fifo_processing=mapping["requires_fifo"],
-            notes=mapping["description"],
-        )
+        return _CLASSIFICATIONS[(transaction_type, adjusted_treatment)]
+
+    def classify_batch(
+        self,
+        transaction_types: Any,
+        transaction_dates: Any = None,
+        acquisition_dates: Any = None,
+    ) -> Dict[str, np.ndarray]:
+        """
+        Classify a whole column of transactions.
+
+        Column-wise counterpart of ``classify_transaction``: the types are
+        encoded as categorical codes over the supported types, and each
+        field is gathered from a per-type table instead of one dict lookup
+        per row. The holding-period adjustment is one array select.
+
+        Args:
+            transaction_types: Transaction type of each row
+            transaction_dates: Optional date of each transaction
+            acquisition_dates: Optional acquisition date of each row (for the
+                holding period calculation); a missing date leaves the row's
+                treatment unadjusted
+
+        Returns:
+            Dictionary of arrays with one entry per row: ``type_code``
+            (position in ``get_supported_types()``), ``tax_treatment`` and
+            ``category`` (as codes into the TaxTreatment / TransactionCategory
+            member order) and ``requires_fifo``. Codes are -1 for a missing or
+            unsupported type.
+        """
+        codes = pd.Categorical(transaction_types, dtype=_TYPE_DTYPE).codes
+        treatments = _TYPE_TREATMENT_CODES[codes]
+
+        # Short-term gains/losses held at least LONG_TERM_HOLDING_DAYS whole
+        # days are long-term
+        if transaction_dates is not None and acquisition_dates is not None:
+            transaction_dates = _to_datetime64_array(pd.Series(transaction_dates))
+            acquisition_dates = _to_datetime64_array(pd.Series(acquisition_dates))
+            held = transaction_dates - acquisition_dates
+            is_long = held >= np.timedelta64(LONG_TERM_HOLDING_DAYS, "D")
+            treatments = np.where(
+                is_long & (treatments == _SHORT_TERM_GAIN_CODE),
+                _LONG_TERM_GAIN_CODE,
+                np.where(
+                    is_long & (treatments == _SHORT_TERM_LOSS_CODE),
+                    _LONG_TERM_LOSS_CODE,
+                    treatments,
+                ),
+            ).astype(np.int8)
+
+        return {
+            "type_code": codes,
+            "tax_treatment": treatments,
+            "category": _TYPE_CATEGORY_CODES[codes],
+            "requires_fifo": _TYPE_FIFO_REQUIRED[codes],
+        }
 
     def get_supported_types(self) -> List[str]:
         """Get list of supported transaction types."""
@@ -209,6 +376,152 @@ class TransactionTypeMapper:
         return transaction_type in self.transaction_mappings
 
 
+class ProcessedTransactionTable(abc.Sequence):
+    """
+    Column-oriented store of processed transactions.
+
+    Keeps the processed rows in the DataFrames they were taken from, next to
+    one array per derived field, instead of one dict (holding a dict of the
+    row) per transaction. Tax treatments are stored as int8 codes. The
+    transaction dicts are only built when the table is indexed or iterated.
+    """
+
+    COLUMN_DTYPES: Dict[str, Any] = {
+        "classification": object,
+        "treatment": np.int8,
+        "usd_equivalent": np.float64,
+    }
+
+    def __init__(self):
+        """Initialize an empty transaction table."""
+        self._frames: List[pd.DataFrame] = []
+        self._columns: List[Dict[str, np.ndarray]] = []
+        self._length = 0
+
+    def extend(
+        self,
+        frame: pd.DataFrame,
+        classifications: Any,
+        treatments: Optional[np.ndarray] = None,
+    ) -> None:
+        """
+        Add a batch of processed transactions.
+
+        Args:
+            frame: The transaction rows, in processing order
+            classifications: TaxClassification of each row
+            treatments: Optional tax treatment code of each row, as returned
+                by ``TransactionTypeMapper.classify_batch``; looked up from
+                the classifications if not given
+        """
+        if not len(frame):
+            return
+        classifications = np.asarray(classifications, dtype=object)
+        if treatments is None:
+            treatments = [
+                _TREATMENT_CODES[classification.tax_treatment]
+                for classification in classifications
+            ]
+        # A falsy USD value, e.g. None, counts as $0
+        usd_value = frame.get("USDEquivalent")
+        if usd_value is None:
+            usd_value = np.zeros(len(frame))
+        elif usd_value.dtype == object:
+            usd_value = usd_value.map(lambda value: value or 0.0)
+
+        self._frames.append(frame)
+        self._columns.append(
+            {
+                "classification": classifications,
+                "treatment": np.asarray(treatments, dtype=np.int8),
+                "usd_equivalent": np.asarray(usd_value, dtype=np.float64),
+            }
+        )
+        self._length += len(frame)
+
+    def column(self, name: str) -> np.ndarray:
+        """
+        Get one derived field of all transactions as an array.
+
+        Args:
+            name: Column name from ``COLUMN_DTYPES``
+
+        Returns:
+            Array with one entry per transaction, in processing order
+        """
+        if not self._columns:
+            return np.empty(0, dtype=self.COLUMN_DTYPES[name])
+        return np.concatenate([columns[name] for columns in self._columns])
+
+    def snapshot(self) -> "ProcessedTransactionTable":
+        """
+        Get a copy of the table that later additions do not affect.
+
+        Shares the frames and column arrays instead of copying them.
+
+        Returns:
+            New ProcessedTransactionTable with the current transactions
+        """
+        copy = ProcessedTransactionTable()
+        copy._frames = list(self._frames)
+        copy._columns = list(self._columns)
+        copy._length = self._length
+        return copy
+
+    def clear(self) -> None:
+        """Remove all transactions."""
+        self._frames.clear()
+        self._columns.clear()
+        self._length = 0
+
+    @staticmethod
+    def _transaction(
+        label: Any, row: pd.Series, classification: TaxClassification
+    ) -> Dict[str, Any]:
+        """Build the dict of one processed transaction."""
+        return {
+            "index": label,
+            "transaction_type": row["Type"],
+            "date": row["Date"],
+            "classification": classification,
+            "row_data": row.to_dict(),
+        }
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __getitem__(
+        self, i: Union[int, slice]
+    ) -> Union[Dict[str, Any], List[Dict[str, Any]]]:
+        if isinstance(i, slice):
+            return [self[j] for j in range(*i.indices(len(self)))]
+        if i < 0:
+            i += self._length
+        if not 0 <= i < self._length:
+            raise IndexError("transaction table index out of range")
+        for frame, columns in zip(self._frames, self._columns):
+            if i < len(frame):
+                return self._transaction(
+                    frame.index[i], frame.iloc[i], columns["classification"][i]
+                )
+            i -= len(frame)
+
+    def __iter__(self):
+        for frame, columns in zip(self._frames, self._columns):
+            for (label, row), classification in zip(
+                frame.iterrows(), columns["classification"]
+            ):
+                yield self._transaction(label, row, classification)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, abc.Sequence):
+            return NotImplemented
+        return len(self) == len(other) and all(a == b for a, b in zip(self, other))
+
+    def __repr__(self) -> str:
+        return f"ProcessedTransactionTable(transactions={self._length})"
+
+
 class TaxProcessor:
     """
     Main tax processing engine that integrates transaction mapping with FIFO manager.
@@ -225,7 +538,7 @@ class TaxProcessor:
         """
         self.fifo_manager = fifo_manager or FIFOManager()
         self.type_mapper = TransactionTypeMapper()
-        self.processed_transactions: List[Dict[str, Any]] = []
+        self.processed_transactions = ProcessedTransactionTable()
         self.tax_summary: Dict[str, Any] = {}
 
     def process_transactions(
@@ -240,124 +553,241 @@ class TaxProcessor:
         Returns:
             List of DisposalResult objects for all disposals processed
         """
-        disposal_results = []
-
-        # Sort transactions by date to ensure chronological processing
-        sorted_df = transactions_df.sort_values("Date").copy()
-
-        for idx, row in sorted_df.iterrows():
-            try:
-                transaction_type = row["Type"]
-                date = row["Date"]
-
-                # Classify the transaction
-                classification = self.type_mapper.classify_transaction(
-                    transaction_type=transaction_type, transaction_date=date
-                )
-
-                # Process based on classification
-                if classification.requires_fifo_processing:
-                    result = self._process_fifo_transaction(row, classification)
-                    if result:
-                        disposal_results.append(result)
-                else:
-                    self._process_non_fifo_transaction(row, classification)
-
-                # Store processed transaction
-                self.processed_transactions.append(
-                    {
-                        "index": idx,
-                        "transaction_type": transaction_type,
-                        "date": date,
-                        "classification": classification,
-                        "row_data": row.to_dict(),
-                    }
-                )
-
-            except Exception as e:
-                logger.error(f"Error processing transaction on {date}: {str(e)}")
-                # Continue processing other transactions
-                continue
+        # Sort transactions by date to ensure chronological processing. The
+        # sort is stable, so same-time rows keep their input order (a buy
+        # listed before a sell of the same moment is matched first). It
+        # already returns a new frame, and the frame is only read.
+        sorted_df = transactions_df.sort_values("Date", kind="mergesort")
+        dates = sorted_df["Date"].to_numpy(dtype=object)
+
+        # Without an acquisition date the classification depends on the type
+        # only: classify each supported type once, then gather by type code.
+        # Code -1 (a missing or unsupported type) picks the trailing None.
+        batch = self.type_mapper.classify_batch(sorted_df["Type"])
+        type_codes = batch["type_code"]
+        supported_types = self.type_mapper.get_supported_types()
+        by_type = np.empty(len(supported_types) + 1, dtype=object)
+        by_type[:-1] = [
+            self.type_mapper.classify_transaction(
+                transaction_type=transaction_type, transaction_date=None
+            )
+            for transaction_type in supported_types
+        ]
+        classifications = by_type[type_codes]
+        classified = type_codes >= 0
+        if not classified.all():
+            types = sorted_df["Type"].to_numpy(dtype=object)
+            for row in np.flatnonzero(~classified):
+                try:
+                    self.type_mapper.classify_transaction(
+                        transaction_type=types[row], transaction_date=dates[row]
+                    )
+                except ValueError as e:
+                    logger.error(f"Error processing transaction on {dates[row]}: {e}")
+
+        # Only FIFO types and income types touch the FIFO queues
+        disposal_results, failed = self._process_fifo_rows(sorted_df, type_codes)
+        recorded = classified & ~failed
+
+        # Store processed transactions
+        recorded_rows = np.flatnonzero(recorded)
+        self.processed_transactions.extend(
+            sorted_df.take(recorded_rows),
+            classifications[recorded_rows],
+            batch["tax_treatment"][recorded_rows],
+        )
 
         # Generate tax summary
         self._generate_tax_summary(disposal_results)
 
         return disposal_results
 
-    def _process_fifo_transaction(
-        self, row: pd.Series, classification: TaxClassification
-    ) -> Optional[DisposalResult]:
+    def _process_fifo_rows(
+        self, transactions_df: pd.DataFrame, type_codes: np.ndarray
+    ) -> Tuple[List[DisposalResult], np.ndarray]:
         """
-        Process a transaction that requires FIFO processing.
+        Apply date-ordered transactions to the FIFO queues, asset by asset.
+
+        Trades and spends dispose of SellCurrency at their USD value, or
+        else acquire BuyCurrency at it. Lost cryptocurrency (theft/loss) is
+        disposed of for $0 proceeds, and income events acquire BuyCurrency
+        at $0 basis. Deposit, Withdrawal, Borrow and Repay are non-taxable
+        transfers and don't require any FIFO processing. A missing currency
+        counts as none.
+
+        Acquisitions are queued per asset and added in blocks: those of an
+        asset only need to be in its queue before that asset's next
+        disposal. Adjacent same-day disposals of an asset with no
+        acquisition of it between them go through one
+        ``FIFOManager.process_disposals`` call.
 
         Args:
-            row: Transaction data row
-            classification: Tax classification for the transaction
+            transactions_df: Transactions in date order
+            type_codes: ``classify_batch`` type code of each transaction
 
         Returns:
-            DisposalResult if disposal occurred, None otherwise
+            Tuple of (disposal results in date order, mask of the
+            transactions whose FIFO step failed)
         """
-        transaction_type = row["Type"]
-        date = row["Date"]
-
-        if transaction_type in ["Trade", "Spend"]:
-            # Handle disposals (sells)
-            if row["SellAmount"] > 0 and row["SellCurrency"]:
-                disposal_result = self.fifo_manager.process_disposal(
-                    asset=row["SellCurrency"],
-                    amount=row["SellAmount"],
-                    proceeds=row["USDEquivalent"] or 0.0,
-                    disposal_date=date,
-                )
-                return disposal_result
-
-            # Handle acquisitions (buys)
-            if row["BuyAmount"] > 0 and row["BuyCurrency"]:
-                self.fifo_manager.add_acquisition(
-                    asset=row["BuyCurrency"],
-                    amount=row["BuyAmount"],
-                    basis=row["USDEquivalent"] or 0.0,
-                    acquisition_date=date,
+        supported_types = self.type_mapper.get_supported_types()
+
+        def of_type(*names: str) -> np.ndarray:
+            """Mask of the transactions whose type is one of ``names``."""
+            return np.append(np.isin(supported_types, names), False)[type_codes]
+
+        failed = np.zeros(len(transactions_df), dtype=bool)
+        touches_fifo = of_type(*DISPOSAL_TYPES, "Lost", *INCOME_TYPES)
+        if not touches_fifo.any():
+            return [], failed
+        missing = [name for name in _FIFO_COLUMNS if name not in transactions_df]
+        if missing:
+            dates = transactions_df["Date"].to_numpy(dtype=object)[touches_fifo]
+            for day in dates:
+                logger.error(
+                    f"Error processing transaction on {day}: "
+                    f"missing columns {missing}"
                 )
+            return [], touches_fifo
+
+        def amount(name: str) -> np.ndarray:
+            """Column ``name`` as float64."""
+            return transactions_df[name].to_numpy(dtype=np.float64)
+
+        dates = transactions_df["Date"].to_numpy(dtype=object)
+        date_values = _to_datetime64_array(transactions_df["Date"])
+        # Buy and sell currencies are dictionary-encoded over their shared
+        # values; a missing currency has code -1, which picks the trailing ""
+        currencies = pd.Categorical(
+            np.concatenate(
+                [
+                    transactions_df["BuyCurrency"].to_numpy(dtype=object),
+                    transactions_df["SellCurrency"].to_numpy(dtype=object),
+                ]
+            )
+        )
+        buy_code, sell_code = currencies.codes.reshape(2, -1)
+        currency_names = np.append(currencies.categories.to_numpy(dtype=object), "")
+        has_currency = currency_names.astype(bool)
+        # A zero USD value counts as $0 and a missing one stays NaN
+        usd_value = amount("USDEquivalent")
+        usd_value = np.where(usd_value == 0, 0.0, usd_value)
+
+        is_trade = of_type(*DISPOSAL_TYPES)
+        is_lost = of_type("Lost")
+        is_disposal = (
+            (is_trade | is_lost) & (amount("SellAmount") > 0) & has_currency[sell_code]
+        )
+        is_acquisition = (
+            ((is_trade & ~is_disposal) | of_type(*INCOME_TYPES))
+            & (amount("BuyAmount") > 0)
+            & has_currency[buy_code]
+        )
+        # $0 proceeds for lost cryptocurrency, $0 basis for income events
+        proceeds = np.where(is_lost, 0.0, usd_value)
+        basis = np.where(is_trade, usd_value, 0.0)
 
-        elif transaction_type == "Lost":
-            # Handle lost cryptocurrency (theft/loss)
-            if row["SellAmount"] > 0 and row["SellCurrency"]:
-                disposal_result = self.fifo_manager.process_disposal(
-                    asset=row["SellCurrency"],
-                    amount=row["SellAmount"],
-                    proceeds=0.0,  # $0 proceeds for lost cryptocurrency
-                    disposal_date=date,
-                )
-                return disposal_result
-
-        return None
+        acquisition_rows = np.flatnonzero(is_acquisition)
+        invalid = (basis[acquisition_rows] < 0) | np.isnat(
+            date_values[acquisition_rows]
+        )
+        for row in acquisition_rows[invalid]:
+            reason = (
+                f"Acquisition basis cannot be negative, got {basis[row]}"
+                if basis[row] < 0
+                else "Acquisition date cannot be missing"
+            )
+            logger.error(f"Error processing transaction on {dates[row]}: {reason}")
+        failed[acquisition_rows[invalid]] = True
+        acquisition_rows = acquisition_rows[~invalid]
+
+        # Keyed by currency code
+        pending = {
+            code: rows.to_numpy()
+            for code, rows in pd.Series(acquisition_rows).groupby(
+                buy_code[acquisition_rows], sort=False
+            )
+        }
+        added = dict.fromkeys(pending, 0)
+        buy_amount = amount("BuyAmount")
+
+        def add_pending(code: int, before_row: int) -> None:
+            """Add the asset's queued acquisitions from rows before ``before_row``."""
+            rows = pending[code]
+            start = added[code]
+            stop = start + int(np.searchsorted(rows[start:], before_row))
+            added[code] = stop
+            if stop > start:
+                block = rows[start:stop]
+                self.fifo_manager.get_or_create_queue(
+                    currency_names[code]
+                ).add_lots_bulk(buy_amount[block], basis[block], date_values[block])
 
-    def _process_non_fifo_transaction(
-        self, row: pd.Series, classification: TaxClassification
-    ) -> None:
-        """
-        Process a transaction that doesn't require FIFO processing.
+        disposal_results = []
+        disposal_rows = np.flatnonzero(is_disposal)
+        sell_amount = amount("SellAmount")
+        disposal_days = date_values[disposal_rows].astype("datetime64[D]")
+
+        def dispose(rows: np.ndarray) -> None:
+            """Process the disposals on ``rows``, one at a time."""
+            for row in rows:
+                try:
+                    disposal_results.append(
+                        self.fifo_manager.process_disposal(
+                            asset=currency_names[sell_code[row]],
+                            amount=sell_amount[row],
+                            proceeds=proceeds[row],
+                            disposal_date=dates[row],
+                        )
+                    )
+                except Exception as e:
+                    logger.error(f"Error processing transaction on {dates[row]}: {e}")
+                    failed[row] = True
+                    # Continue processing other transactions
+                    continue
+
+        position = 0
+        while position < len(disposal_rows):
+            row = disposal_rows[position]
+            code = sell_code[row]
+            next_acquisition = len(transactions_df)
+            if code in pending:
+                add_pending(code, row)
+                if added[code] < len(pending[code]):
+                    next_acquisition = pending[code][added[code]]
+
+            # Later disposals of the same asset on the same day join this one
+            # in a single FIFO match, up to the next acquisition of the asset
+            end = position + 1
+            while (
+                end < len(disposal_rows)
+                and sell_code[disposal_rows[end]] == code
+                and disposal_days[end] == disposal_days[position]
+                and disposal_rows[end] <= next_acquisition
+            ):
+                end += 1
+            batch = disposal_rows[position:end]
+            position = end
 
-        Args:
-            row: Transaction data row
-            classification: Tax classification for the transaction
-        """
-        transaction_type = row["Type"]
-        date = row["Date"]
-
-        if transaction_type in ["Income", "Staking", "Airdrop"]:
-            # Handle income events (ordinary income with $0 basis)
-            if row["BuyAmount"] > 0 and row["BuyCurrency"]:
-                self.fifo_manager.add_acquisition(
-                    asset=row["BuyCurrency"],
-                    amount=row["BuyAmount"],
-                    basis=0.0,  # $0 basis for income events
-                    acquisition_date=date,
+            if len(batch) == 1 or (proceeds[batch] < 0).any():
+                dispose(batch)
+                continue
+            try:
+                disposal_results.extend(
+                    self.fifo_manager.process_disposals(
+                        currency_names[code],
+                        sell_amount[batch],
+                        proceeds[batch],
+                        dates[batch],
+                    )
                 )
+            except ValueError:
+                # Not enough lots for all of them: find out which ones fail
+                dispose(batch)
+
+        for code in pending:
+            add_pending(code, len(transactions_df))
 
-        # Note: Deposit, Withdrawal, Borrow, Repay are non-taxable transfers
-        # and don't require any FIFO processing
+        return disposal_results, failed
 
     def _generate_tax_summary(self, disposal_results: List[DisposalResult]) -> None:
         """
@@ -369,56 +799,56 @@ class TaxProcessor:
         # Get FIFO manager summary
         fifo_summary = self.fifo_manager.get_disposal_summary()
 
-        # Calculate totals by tax treatment
-        treatment_totals = {
-            "short_term_gain": 0.0,
-            "short_term_loss": 0.0,
-            "long_term_gain": 0.0,
-            "long_term_loss": 0.0,
-            "ordinary_income": 0.0,
-        }
-
-        # Process disposal results
-        for result in disposal_results:
-            if result.short_term_gain_loss > 0:
-                treatment_totals["short_term_gain"] += result.short_term_gain_loss
-            elif result.short_term_gain_loss < 0:
-                treatment_totals["short_term_loss"] += abs(result.short_term_gain_loss)
-
-            if result.long_term_gain_loss > 0:
-                treatment_totals["long_term_gain"] += result.long_term_gain_loss
-            elif result.long_term_gain_loss < 0:
-                treatment_totals["long_term_loss"] += abs(result.long_term_gain_loss)
-
-        # Calculate ordinary income from non-FIFO transactions
-        for transaction in self.processed_transactions:
-            if (
-                transaction["classification"].tax_treatment
-                == TaxTreatment.ORDINARY_INCOME
-            ):
-                row_data = transaction["row_data"]
-                if row_data.get("USDEquivalent"):
-                    treatment_totals["ordinary_income"] += row_data["USDEquivalent"]
+        # Process disposal results: the gains and losses of each term are
+        # its positive and negative parts. They are selected without
+        # branching or compacting; the zeros put in elsewhere leave the
+        # in-order sums unchanged.
+        short_term = np.array(
+            [result.short_term_gain_loss for result in disposal_results],
+            dtype=np.float64,
+        )
+        long_term = np.array(
+            [result.long_term_gain_loss for result in disposal_results],
+            dtype=np.float64,
+        )
+        short_term_gain = _sum_in_order(np.where(short_term > 0, short_term, 0.0))
+        short_term_loss = _sum_in_order(np.where(short_term < 0, -short_term, 0.0))
+        long_term_gain = _sum_in_order(np.where(long_term > 0, long_term, 0.0))
+        long_term_loss = _sum_in_order(np.where(long_term < 0, -long_term, 0.0))
+
+        # Calculate ordinary income from non-FIFO transactions; a zero (or
+        # None) USD value adds nothing, but a NaN one makes the total NaN
+        transactions = self.processed_transactions
+        is_income = transactions.column("treatment") == (
+            _TREATMENT_CODES[TaxTreatment.ORDINARY_INCOME]
+        )
+        ordinary_income = _sum_in_order(
+            np.where(is_income, transactions.column("usd_equivalent"), 0.0)
+        )
 
         self.tax_summary = {
             "fifo_summary": fifo_summary,
-            "treatment_totals": treatment_totals,
+            "treatment_totals": {
+                "short_term_gain": short_term_gain,
+                "short_term_loss": short_term_loss,
+                "long_term_gain": long_term_gain,
+                "long_term_loss": long_term_loss,
+                "ordinary_income": ordinary_income,
+            },
             "total_transactions_processed": len(self.processed_transactions),
             "disposal_count": len(disposal_results),
-            "net_short_term_gain_loss": treatment_totals["short_term_gain"]
-            - treatment_totals["short_term_loss"],
-            "net_long_term_gain_loss": treatment_totals["long_term_gain"]
-            - treatment_totals["long_term_loss"],
-            "total_ordinary_income": treatment_totals["ordinary_income"],
+            "net_short_term_gain_loss": short_term_gain - short_term_loss,
+            "net_long_term_gain_loss": long_term_gain - long_term_loss,
+            "total_ordinary_income": ordinary_income,
         }
 
     def get_tax_summary(self) -> Dict[str, Any]:
         """Get the current tax summary."""
         return self.tax_summary.copy()
 
-    def get_processed_transactions(self) -> List[Dict[str, Any]]:
-        """Get list of all processed transactions with classifications."""
-        return self.processed_transactions.copy()
+    def get_processed_transactions(self) -> Sequence[Dict[str, Any]]:
+        """Get a snapshot of all processed transactions with classifications."""
+        return self.processed_transactions.snapshot()
 
     def reset(self) -> None:
         """Reset the processor state."""
@@ -5,9 +5,14 @@ Contains IRS rules, transaction types, validation rules, and other constants
 used throughout the tax calculation system.
 """
 
-from typing import Dict, List, Set, Any
+import re
+from typing import TYPE_CHECKING, Dict, List, Set, Any
 from enum import Enum
 
+if TYPE_CHECKING:
+    import numpy as np
+    import pandas as pd
+
 
 # IRS Constants
 class IRSConstants:
@@ -236,6 +241,10 @@ class ValidationRules:
     # Exchange name validation
     EXCHANGE_PATTERN = r"^[A-Za-z0-9\s\-_\.]{1,50}$"  # Alphanumeric, spaces, hyphens, underscores, dots
 
+    # The patterns above, compiled once
+    _CURRENCY_RE = re.compile(CURRENCY_PATTERN)
+    _EXCHANGE_RE = re.compile(EXCHANGE_PATTERN)
+
     @classmethod
     def validate_amount(cls, amount: float) -> bool:
         """Validate transaction amount."""
@@ -249,16 +258,38 @@ class ValidationRules:
     @classmethod
     def validate_currency(cls, currency: str) -> bool:
         """Validate currency symbol."""
-        import re
+        return bool(cls._CURRENCY_RE.match(currency))
 
-        return bool(re.match(cls.CURRENCY_PATTERN, currency))
+    @classmethod
+    def validate_currency_series(cls, currencies: "pd.Series") -> "np.ndarray":
+        """
+        Validate a whole column of currency symbols.
+
+        The pattern is matched once per distinct value, then gathered per row
+        by category code.
+
+        Args:
+            currencies: Currency symbol of each row
+
+        Returns:
+            Boolean array, True where the symbol is valid; missing and
+            non-string values are invalid
+        """
+        import numpy as np
+        import pandas as pd
+
+        values = pd.Categorical(currencies)
+        valid = [
+            isinstance(currency, str) and bool(cls._CURRENCY_RE.match(currency))
+            for currency in values.categories
+        ]
+        # A missing value has code -1, which picks the trailing False
+        return np.array(valid + [False], dtype=bool)[values.codes]
 
     @classmethod
     def validate_exchange(cls, exchange: str) -> bool:
         """Validate exchange name."""
-        import re
-
-        return bool(re.match(cls.EXCHANGE_PATTERN, exchange))
+        return bool(cls._EXCHANGE_RE.match(exchange))
 
 
 # Error Messages
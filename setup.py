@@ -55,6 +55,9 @@ setup(
             "sphinx>=7.0.0",
             "sphinx-rtd-theme>=1.3.0",
         ],
+        "arrow": [
+            "pyarrow>=14.0.0",
+        ],
     },
     entry_points={
         "console_scripts": [
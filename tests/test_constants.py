@@ -0,0 +1,38 @@
+"""
+Tests for the constants module.
+
+Tests the validation rules applied to transaction data.
+"""
+
+import numpy as np
+import pandas as pd
+
+from cryptotaxcalc.utils.constants import ValidationRules
+
+
+class TestValidationRules:
+    """Test validation rules for transaction data."""
+
+    def test_validate_currency(self):
+        """Test validation of a single currency symbol."""
+        assert ValidationRules.validate_currency("BTC")
+        assert not ValidationRules.validate_currency("btc")
+        assert not ValidationRules.validate_currency("")
+
+    def test_validate_currency_series(self):
+        """Test that a column validates like its values one at a time."""
+        currencies = pd.Series(["BTC", "eth", "", None, 42, "USDC", "BTC", np.nan])
+
+        valid = ValidationRules.validate_currency_series(currencies)
+
+        assert valid.dtype == bool
+        assert valid.tolist() == [True, False, False, False, False, True, True, False]
+        assert valid.tolist() == [
+            isinstance(currency, str) and ValidationRules.validate_currency(currency)
+            for currency in currencies
+        ]
+
+    def test_validate_currency_series_empty(self):
+        """Test validation of an empty column."""
+        valid = ValidationRules.validate_currency_series(pd.Series([], dtype=object))
+        assert valid.tolist() == []
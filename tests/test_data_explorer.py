@@ -157,6 +157,37 @@ class TestDataExplorer:
         assert len(explorer.missing_fmv_data) == 0
         assert len(explorer.available_fmv_data) == 2
 
+    def test_analyze_missing_fmv_reuses_cached_analysis(self, sample_data):
+        """Test repeat analysis of the same frame returns the cached result."""
+        first = DataExplorer()
+        first_analysis = first.analyze_missing_fmv(sample_data)
+
+        second = DataExplorer()
+        second_analysis = second.analyze_missing_fmv(sample_data)
+
+        assert second_analysis == first_analysis
+        assert second_analysis is not first_analysis
+        # A hit defers coercing the frame until its rows are requested
+        assert second._analyzed_data is None
+        assert len(second.missing_fmv_data) == 3
+        assert isinstance(second.missing_fmv_data["Type"].dtype, pd.CategoricalDtype)
+        assert len(second.available_fmv_data) == 3
+
+        # Mutating a returned analysis must not leak into the cache
+        second_analysis["summary"]["total_transactions"] = -1
+        third_analysis = DataExplorer().analyze_missing_fmv(sample_data)
+        assert third_analysis["summary"]["total_transactions"] == 6
+
+        # A different frame with the same shape is analyzed afresh
+        other_data = sample_data.copy()
+        other_data["USDEquivalent"] = other_data["USDEquivalent"].fillna(1.0)
+        other_data.loc[0, "USDEquivalent"] = np.nan
+        other_data.loc[1, "USDEquivalent"] = np.nan
+        other_data.loc[2, "USDEquivalent"] = np.nan
+        other_analysis = DataExplorer().analyze_missing_fmv(other_data)
+        assert other_analysis["summary"]["missing_fmv_count"] == 3
+        assert "Deposit" in other_analysis["missing_fmv_analysis"]["transaction_types"]
+
     def test_missing_patterns_analysis(self, explorer, sample_data):
         """Test missing patterns analysis."""
         explorer.analyze_missing_fmv(sample_data)
@@ -272,6 +303,16 @@ class TestDataExplorer:
             if os.path.exists(report_path):
                 os.unlink(report_path)
 
+    def test_report_save_to_file_returns_report(self, explorer, sample_data, tmp_path):
+        """Test that a report saved to file is also returned."""
+        report_path = tmp_path / "report.txt"
+        explorer.analyze_missing_fmv(sample_data)
+
+        report = explorer.generate_report(str(report_path))
+
+        assert "Missing FMV: 3 (50.0%)" in report
+        assert report_path.read_text() == report
+
     def test_save_missing_data(self, explorer, sample_data):
         """Test saving missing FMV data to CSV."""
         with tempfile.NamedTemporaryFile(mode="w", suffix=".csv", delete=False) as f:
@@ -292,6 +333,28 @@ class TestDataExplorer:
             if os.path.exists(csv_path):
                 os.unlink(csv_path)
 
+    @pytest.mark.parametrize("suffix", [".parquet", ".feather"])
+    def test_save_missing_data_arrow_formats(self, explorer, sample_data, suffix):
+        """Test saving missing FMV data in Arrow-backed formats by suffix."""
+        pytest.importorskip("pyarrow")
+        with tempfile.NamedTemporaryFile(suffix=suffix, delete=False) as f:
+            output_path = f.name
+
+        try:
+            explorer.analyze_missing_fmv(sample_data)
+            explorer.save_missing_data(output_path)
+
+            if suffix == ".parquet":
+                saved_df = pd.read_parquet(output_path)
+            else:
+                saved_df = pd.read_feather(output_path)
+            assert len(saved_df) == 3
+            assert saved_df["USDEquivalent"].isna().all()
+            assert list(saved_df.columns) == list(sample_data.columns)
+        finally:
+            if os.path.exists(output_path):
+                os.unlink(output_path)
+
     def test_save_missing_data_empty(self, explorer):
         """Test saving missing data when none exists."""
         with tempfile.NamedTemporaryFile(mode="w", suffix=".csv", delete=False) as f:
@@ -408,6 +471,23 @@ class TestAnalyzeTransactionData:
             if os.path.exists(csv_path):
                 os.unlink(csv_path)
 
+    def test_analyze_transaction_data_parquet_keeps_categories(self, sample_data):
+        """Test the saved missing data keeps the analyzer's categorical dtypes."""
+        pytest.importorskip("pyarrow")
+        with tempfile.NamedTemporaryFile(suffix=".parquet", delete=False) as f:
+            parquet_path = f.name
+
+        try:
+            analyze_transaction_data(sample_data, output_missing_data_path=parquet_path)
+
+            saved_df = pd.read_parquet(parquet_path)
+            assert len(saved_df) == 1
+            assert isinstance(saved_df["Exchange"].dtype, pd.CategoricalDtype)
+            assert not isinstance(sample_data["Exchange"].dtype, pd.CategoricalDtype)
+        finally:
+            if os.path.exists(parquet_path):
+                os.unlink(parquet_path)
+
     def test_analyze_transaction_data_no_output_files(self, sample_data):
         """Test analyze_transaction_data without output files."""
         analysis = analyze_transaction_data(sample_data)
@@ -11,13 +11,17 @@ import numpy as np
 from datetime import datetime, date, timedelta
 from typing import Dict, List, Any
 
+from cryptotaxcalc import fee_handler
 from cryptotaxcalc.fee_handler import (
     FeeType,
     FeeTreatment,
     FeeInfo,
     FeeAdjustment,
+    FeeInfoTable,
     FeeProcessor,
     FeeHandler,
+    REQUIRED_DTYPES,
+    conform_fee_columns,
     create_fee_handler,
 )
 from cryptotaxcalc.fifo_manager import FIFOManager, DisposalResult, Lot
@@ -126,6 +130,54 @@ class TestFeeAdjustment:
         assert adjustment.notes == ""
 
 
+class TestFeeInfoTable:
+    """Test column-oriented fee storage."""
+
+    def test_append_and_extend_keep_order(self):
+        """Test that single and batch additions come back in insertion order."""
+        table = FeeInfoTable()
+        first = FeeInfo(
+            amount=0.001,
+            currency="BTC",
+            usd_equivalent=45.0,
+            fee_type=FeeType.TRADING_FEE,
+            treatment=FeeTreatment.ADD_TO_BASIS,
+            transaction_date=datetime(2024, 1, 15),
+            asset="BTC",
+        )
+        table.append(first)
+        table.extend(
+            {
+                "amount": np.array([0.5]),
+                "currency": np.array(["ADA"], dtype=object),
+                "usd_equivalent": np.array([0.25]),
+                "fee_type": np.array([list(FeeType).index(FeeType.STAKING_FEE)]),
+                "treatment": np.array(
+                    [list(FeeTreatment).index(FeeTreatment.DEDUCTIBLE_EXPENSE)]
+                ),
+                "transaction_date": np.array([datetime(2024, 2, 1)], dtype=object),
+                "asset": np.array(["ADA"], dtype=object),
+            }
+        )
+
+        assert len(table) == 2
+        assert table[0] == first
+        assert table[-1].fee_type == FeeType.STAKING_FEE
+        assert table[-1].treatment == FeeTreatment.DEDUCTIBLE_EXPENSE
+        assert list(table.column("usd_equivalent")) == [45.0, 0.25]
+        assert table[:1] == [first]
+        assert table[::-1] == [table[1], table[0]]
+        assert table.total_usd_equivalent == 45.25
+        assert dict(table.asset_counts) == {"BTC": 1, "ADA": 1}
+        assert table.treatment_counts.sum() == 2
+
+        table.clear()
+        assert len(table) == 0
+        assert list(table) == []
+        assert table.total_usd_equivalent == 0.0
+        assert not table.fee_type_counts.any()
+
+
 class TestFeeProcessor:
     """Test fee processor functionality."""
 
@@ -139,6 +191,7 @@ class TestFeeProcessor:
         assert hasattr(self.processor, "processed_fees")
         assert hasattr(self.processor, "fee_statistics")
         assert len(self.processor.fee_type_mappings) > 0
+        assert FeeProcessor().fee_type_mappings is self.processor.fee_type_mappings
 
     def test_extract_fees_no_fees(self):
         """Test extracting fees when no fees are present."""
@@ -272,6 +325,26 @@ class TestFeeProcessor:
         assert fee_info.fee_type == FeeType.STAKING_FEE
         assert fee_info.treatment == FeeTreatment.DEDUCTIBLE_EXPENSE
 
+    def test_extract_fees_transaction_date(self):
+        """Test the fee date comes from the row, or the current time if absent."""
+        row = pd.Series(
+            {
+                "Type": "Trade",
+                "BuyAmount": 1.0,
+                "BuyCurrency": "BTC",
+                "FeeAmount": 10.0,
+                "FeeCurrency": "USD",
+                "Date": datetime(2024, 1, 15),
+            }
+        )
+
+        fee_info = self.processor.extract_fees_from_transaction(row)
+        assert fee_info.transaction_date == datetime(2024, 1, 15)
+
+        before = datetime.now()
+        fee_info = self.processor.extract_fees_from_transaction(row.drop("Date"))
+        assert before <= fee_info.transaction_date <= datetime.now()
+
     def test_calculate_fee_usd_equivalent_usd_currency(self):
         """Test USD equivalent calculation for USD-pegged currencies."""
         row = pd.Series({"USDEquivalent": 45000.0, "BuyAmount": 1.0, "SellAmount": 0.0})
@@ -323,6 +396,53 @@ class TestFeeProcessor:
         )
         assert usd_equivalent == 10.0  # Default 1:1 rate
 
+    def test_conform_fee_columns(self):
+        """Test that fee columns are coerced to the required dtypes."""
+        df = pd.DataFrame(
+            {
+                "Type": ["Trade", None],
+                "FeeAmount": [0.001, None],
+                "FeeCurrency": ["BTC", None],
+                "USDEquivalent": [45000.0, None],
+            }
+        )
+
+        conformed = conform_fee_columns(df)
+
+        assert list(conformed.columns) == list(REQUIRED_DTYPES)
+        assert {c: str(t) for c, t in conformed.dtypes.items()} == REQUIRED_DTYPES
+        assert conformed["FeeAmount"].tolist() == [0.001, 0.0]
+        assert conformed["FeeCurrency"].tolist() == ["BTC", ""]
+        assert conformed["BuyAmount"].tolist() == [0.0, 0.0]
+        assert conformed["SellCurrency"].tolist() == ["", ""]
+        assert pd.isna(conformed["USDEquivalent"].iloc[1])
+        assert pd.isna(conformed["Type"].iloc[1])
+
+    def test_calculate_fee_columns_chunked(self, monkeypatch):
+        """Test that chunked fee column calculation matches a single pass."""
+        df = pd.DataFrame(
+            {
+                "Type": ["Trade", "Spend", "Income", "Trade", "Withdrawal"] * 3,
+                "BuyAmount": [1.0, 0.0, 2.0, 0.0, 0.0] * 3,
+                "BuyCurrency": ["BTC", "", "ADA", "", ""] * 3,
+                "SellAmount": [0.0, 0.5, 0.0, 1.0, 0.1] * 3,
+                "SellCurrency": ["", "ETH", "", "BTC", "ETH"] * 3,
+                "FeeAmount": [0.001, 0.01, 0.0, 5.0, 0.001] * 3,
+                "FeeCurrency": ["BTC", "ETH", "", "USDT", "ETH"] * 3,
+                "USDEquivalent": [45000.0, 1500.0, 1.0, 45000.0, np.nan] * 3,
+                "Date": pd.date_range("2024-01-01", periods=15, freq="D"),
+            }
+        )
+        expected = self.processor.calculate_fee_columns(df)
+
+        monkeypatch.setattr(fee_handler, "PARALLEL_FEE_MIN_ROWS", 4)
+        monkeypatch.setattr(fee_handler, "FEE_CHUNK_ROWS", 3)
+        chunked = self.processor.calculate_fee_columns(df)
+
+        assert chunked.keys() == expected.keys()
+        for key in expected:
+            np.testing.assert_array_equal(chunked[key], expected[key])
+
     def test_calculate_fee_adjustment_add_to_basis(self):
         """Test fee adjustment calculation for adding to basis."""
         fee_info = FeeInfo(
@@ -469,6 +589,8 @@ class TestFeeProcessor:
         assert stats["treatments"] == {}
         assert stats["assets"] == {}
         assert stats["average_fee_usd"] == 0.0
+        with pytest.raises(TypeError):
+            stats["total_fees"] = 1
 
     def test_get_fee_statistics_with_fees(self):
         """Test fee statistics with processed fees."""
@@ -515,6 +637,32 @@ class TestFeeProcessor:
         assert "ETH" in stats["assets"]
         assert stats["average_fee_usd"] > 0.0
 
+    def test_processed_fees_and_statistics_are_snapshots(self):
+        """Test that returned fees and statistics are unaffected by later fees."""
+        row = pd.Series(
+            {
+                "Type": "Trade",
+                "BuyAmount": 1.0,
+                "BuyCurrency": "BTC",
+                "FeeAmount": 0.001,
+                "FeeCurrency": "BTC",
+                "USDEquivalent": 45000.0,
+                "Date": datetime(2024, 1, 15),
+            }
+        )
+        self.processor.extract_fees_from_transaction(row)
+
+        fees = self.processor.get_processed_fees()
+        stats = self.processor.get_fee_statistics()
+        self.processor.extract_fees_from_transaction(row)
+        self.processor.reset()
+
+        assert len(fees) == 1
+        assert fees[0].asset == "BTC"
+        assert stats["total_fees"] == 1
+        with pytest.raises(TypeError):
+            stats["total_fees"] = 2
+
     def test_reset_functionality(self):
         """Test that reset functionality works correctly."""
         # Process some fees
@@ -627,6 +775,108 @@ class TestFeeHandler:
         assert len(adjustments) == 2
         assert len(self.handler.fee_adjustments) == 2
 
+    def test_process_transactions_dataframe_presorted(self):
+        """Test that presorted input is processed in the given order."""
+        transactions = [
+            {
+                "Type": "Trade",
+                "BuyAmount": 1.0,
+                "BuyCurrency": "BTC",
+                "SellAmount": 0.0,
+                "SellCurrency": "",
+                "FeeAmount": 0.001,
+                "FeeCurrency": "BTC",
+                "USDEquivalent": 45000.0,
+                "Date": datetime(2024, 1, 15),
+            },
+            {
+                "Type": "Trade",
+                "BuyAmount": 0.0,
+                "BuyCurrency": "",
+                "SellAmount": 0.5,
+                "SellCurrency": "BTC",
+                "FeeAmount": 0.0005,
+                "FeeCurrency": "BTC",
+                "USDEquivalent": 22500.0,
+                "Date": datetime(2024, 1, 15),
+            },
+        ]
+        df = pd.DataFrame(transactions)
+
+        adjustments = self.handler.process_transactions_dataframe(df, presorted=True)
+
+        assert [a.adjustment_type for a in adjustments] == [
+            FeeTreatment.ADD_TO_BASIS,
+            FeeTreatment.REDUCE_PROCEEDS,
+        ]
+        assert self.fifo_manager.get_disposal_summary()["total_disposals"] == 1
+
+    def test_process_transactions_dataframe_matches_row_path(self):
+        """Test that the column-wise batch path matches per-row processing."""
+        transactions = [
+            {
+                "Type": "Trade",
+                "BuyAmount": 2.0,
+                "BuyCurrency": "ETH",
+                "SellAmount": 0.0,
+                "SellCurrency": "",
+                "FeeAmount": 5.0,
+                "FeeCurrency": "usdt",
+                "USDEquivalent": 6000.0,
+                "Date": datetime(2024, 1, 15),
+            },
+            {
+                "Type": "Spend",
+                "BuyAmount": 0.0,
+                "BuyCurrency": "",
+                "SellAmount": 0.5,
+                "SellCurrency": "ETH",
+                "FeeAmount": 0.01,
+                "FeeCurrency": "ETH",
+                "USDEquivalent": 1500.0,
+                "Date": datetime(2024, 2, 1),
+            },
+            {
+                "Type": "Withdrawal",
+                "BuyAmount": 0.0,
+                "BuyCurrency": "",
+                "SellAmount": 0.0,
+                "SellCurrency": "",
+                "FeeAmount": 0.001,
+                "FeeCurrency": "ETH",
+                "USDEquivalent": np.nan,
+                "Date": datetime(2024, 3, 1),
+            },
+            {
+                "Type": "Income",
+                "BuyAmount": 1.0,
+                "BuyCurrency": "ADA",
+                "SellAmount": 0.0,
+                "SellCurrency": "",
+                "FeeAmount": 0.0,
+                "FeeCurrency": "",
+                "USDEquivalent": 0.5,
+                "Date": datetime(2024, 4, 1),
+            },
+        ]
+        df = pd.DataFrame(transactions)
+
+        row_handler = FeeHandler()
+        for _, row in df.iterrows():
+            row_handler.process_transaction_with_fees(row)
+
+        adjustments = self.handler.process_transactions_dataframe(df)
+
+        assert adjustments == row_handler.fee_adjustments
+        assert (
+            self.handler.fee_processor.get_processed_fees()
+            == row_handler.fee_processor.get_processed_fees()
+        )
+        assert (
+            self.handler.fifo_manager.get_all_summaries()
+            == row_handler.fifo_manager.get_all_summaries()
+        )
+
     def test_get_fee_summary(self):
         """Test getting comprehensive fee summary."""
         # Process some transactions
@@ -786,6 +1036,31 @@ class TestFeeHandlerIntegration:
         # Should process successfully
         assert len(adjustments) == 1
 
+    def test_error_handling_counts_failed_transactions(self, caplog):
+        """Test that failed transactions are skipped and counted once."""
+        df = pd.DataFrame(
+            [
+                {
+                    "Type": "Trade",
+                    "BuyAmount": 0.0,
+                    "BuyCurrency": "",
+                    "SellAmount": 1.0,
+                    "SellCurrency": "BTC",
+                    "FeeAmount": 10.0,
+                    "FeeCurrency": "USD",
+                    "USDEquivalent": 45000.0,
+                    "Date": datetime(2024, 1, 15),
+                }
+            ]
+        )
+
+        with caplog.at_level("WARNING", logger="cryptotaxcalc.fee_handler"):
+            adjustments = self.handler.process_transactions_dataframe(df)
+
+        assert adjustments == []
+        assert self.handler.fee_adjustments == []
+        assert "failed for 1 of 1 transactions" in caplog.text
+
 
 if __name__ == "__main__":
     pytest.main([__file__])
@@ -2,9 +2,11 @@
 Tests for the FIFO manager module.
 """
 
+import math
 import pytest
 import pandas as pd
 from datetime import datetime, timedelta
+from cryptotaxcalc import fifo_manager
 from cryptotaxcalc.fifo_manager import (
     Lot, 
     DisposalResult, 
@@ -33,6 +35,7 @@ class TestLot:
         assert lot.asset == "ETH"
         assert lot.lot_id is not None
         assert "ETH_20240115" in lot.lot_id
+        assert not hasattr(lot, "__dict__")  # slotted
 
     def test_lot_validation_positive_amount(self):
         """Test lot validation for positive amount."""
@@ -164,6 +167,64 @@ class TestFIFOQueue:
         
         assert queue.is_empty() is False
 
+    def test_queue_grows_and_reuses_consumed_slots(self):
+        """Test that lots keep FIFO order across growth and head consumption."""
+        manager = FIFOManager()
+        start = datetime(2024, 1, 1)
+        
+        for day in range(40):
+            manager.add_acquisition(
+                "ETH", 1.0, 100.0 + day, start + timedelta(days=day)
+            )
+        manager.process_disposal("ETH", 30.5, 3050.0, start + timedelta(days=60))
+        for day in range(40, 60):
+            manager.add_acquisition(
+                "ETH", 1.0, 100.0 + day, start + timedelta(days=day)
+            )
+        
+        queue = manager.queues["ETH"]
+        assert len(queue) == len(queue.lots) == 30
+        assert queue.lots[0].amount == 0.5
+        assert queue.lots[0].basis == 65.0
+        assert queue.lots[1].acquisition_date == start + timedelta(days=31)
+        assert queue.lots[-1].basis == 159.0
+        assert queue.total_amount == 29.5
+
+    def test_add_lots_bulk(self):
+        """Test adding and validating a batch of lots."""
+        queue = FIFOQueue("ETH")
+        
+        queue.add_lots_bulk(
+            [2.0, 1.0],
+            [2000.0, 2500.0],
+            [datetime(2023, 6, 15), datetime(2023, 12, 1)],
+            ["first", "second"],
+        )
+        
+        assert len(queue) == 2
+        assert queue.total_amount == 3.0
+        assert queue.total_basis == 4500.0
+        assert queue.lots[1].acquisition_date == datetime(2023, 12, 1)
+        assert [lot.lot_id for lot in queue.lots] == ["first", "second"]
+        
+        # A block larger than the doubled capacity is allocated exactly
+        count = 5 * fifo_manager.INITIAL_LOT_CAPACITY
+        queue.add_lots_bulk(
+            [1.0] * count, [10.0] * count, [datetime(2024, 1, 1)] * count
+        )
+        assert len(queue._amount) == count + 2
+        assert len(queue) == count + 2
+        
+        with pytest.raises(ValueError, match="amount must be positive, got 0.0"):
+            queue.add_lots_bulk([1.0, 0.0], [10.0, 10.0], [datetime(2024, 1, 1)] * 2)
+        with pytest.raises(ValueError, match="basis cannot be negative, got -5.0"):
+            queue.add_lots_bulk([1.0, 1.0], [10.0, -5.0], [datetime(2024, 1, 1)] * 2)
+        with pytest.raises(ValueError, match="date cannot be missing"):
+            queue.add_lots_bulk([1.0, 1.0], [10.0, 10.0], [datetime(2024, 1, 1), None])
+        with pytest.raises(ValueError, match="same length"):
+            queue.add_lots_bulk([1.0, 1.0], [10.0], [datetime(2024, 1, 1)] * 2)
+        assert len(queue) == count + 2
+
     def test_queue_repr(self):
         """Test queue string representation."""
         queue = FIFOQueue("ETH")
@@ -234,6 +295,15 @@ class TestFIFOManager:
                 basis=-100.0,
                 acquisition_date=date
             )
+        
+        # Test missing date
+        with pytest.raises(ValueError, match="date cannot be missing"):
+            manager.add_acquisition(
+                asset="ETH",
+                amount=1.5,
+                basis=100.0,
+                acquisition_date=pd.NaT
+            )
 
     def test_process_disposal_simple(self):
         """Test simple disposal processing."""
@@ -270,6 +340,47 @@ class TestFIFOManager:
         assert queue.total_amount == 0.5
         assert queue.total_basis == 1000.0
 
+    def test_emptied_queue_totals_are_zero(self):
+        """Test that using up every lot leaves no rounding residue in the totals."""
+        manager = FIFOManager()
+        date = datetime(2024, 1, 15)
+        
+        manager.add_acquisition("ETH", 0.1, 10.0, date)
+        manager.add_acquisition("ETH", 0.2, 20.0, date)
+        manager.process_disposal("ETH", 0.1, 15.0, date)
+        manager.process_disposal("ETH", 0.2, 30.0, date)
+        
+        summary = manager.get_queue_summary("ETH")
+        assert summary["lot_count"] == 0
+        assert summary["total_amount"] == 0.0
+        assert summary["total_basis"] == 0.0
+
+    def test_queue_totals_resync(self, monkeypatch):
+        """Test that running totals are periodically recomputed from the lots."""
+        monkeypatch.setattr(fifo_manager, "TOTALS_RESYNC_INTERVAL", 2)
+        manager = FIFOManager()
+        date = datetime(2024, 1, 15)
+        
+        for _ in range(10):
+            manager.add_acquisition("ETH", 0.1, 0.1, date)
+        for _ in range(4):
+            manager.process_disposal("ETH", 0.15, 1.0, date)
+        
+        queue = manager.queues["ETH"]
+        assert queue.total_amount == math.fsum(lot.amount for lot in queue.lots)
+        assert queue._disposals_since_resync == 0
+
+    def test_default_lot_id_survives_partial_disposal(self):
+        """Test that a generated lot id still reflects the acquired amount."""
+        manager = FIFOManager()
+        
+        manager.add_acquisition("ETH", 1.5, 3000.0, datetime(2024, 1, 15, 9, 30))
+        manager.process_disposal("ETH", 0.5, 1500.0, datetime(2024, 2, 15))
+        
+        lot = manager.queues["ETH"].lots[0]
+        assert lot.amount == 1.0
+        assert lot.lot_id == "ETH_20240115_093000_1.5"
+
     def test_process_disposal_long_term(self):
         """Test disposal with long-term capital gains."""
         manager = FIFOManager()
@@ -295,6 +406,101 @@ class TestFIFOManager:
         assert result.short_term_gain_loss == 0.0
         assert result.long_term_gain_loss == 500.0  # > 365 days
 
+    def test_process_disposal_holding_period_boundary(self):
+        """Test that gains turn long-term after exactly 365 whole days."""
+        manager = FIFOManager()
+        acquisition_date = datetime(2023, 1, 15, 12, 0)
+        
+        manager.add_acquisition("ETH", 2.0, 4000.0, acquisition_date)
+        
+        result = manager.process_disposal(
+            "ETH", 1.0, 2500.0, acquisition_date + timedelta(days=365, minutes=-1)
+        )
+        assert result.short_term_gain_loss == 500.0
+        assert result.long_term_gain_loss == 0.0
+        
+        result = manager.process_disposal(
+            "ETH", 1.0, 2500.0, acquisition_date + timedelta(days=365)
+        )
+        assert result.short_term_gain_loss == 0.0
+        assert result.long_term_gain_loss == 500.0
+
+    def test_process_disposals_matches_sequential_disposals(self):
+        """Test that a batch of disposals matches the same lots as one at a time."""
+        batched = FIFOManager()
+        sequential = FIFOManager()
+        for manager in (batched, sequential):
+            manager.add_acquisition("ETH", 1.0, 1000.0, datetime(2022, 1, 1))
+            manager.add_acquisition("ETH", 0.5, 900.0, datetime(2023, 6, 1))
+            manager.add_acquisition("ETH", 2.0, 5000.0, datetime(2023, 9, 1))
+        
+        amounts = [0.25, 1.0, 0.5, 0.75]
+        proceeds = [600.0, 2500.0, 1200.0, 1800.0]
+        dates = [datetime(2024, 3, 1, hour) for hour in (9, 10, 11, 12)]
+        
+        batch_results = batched.process_disposals("ETH", amounts, proceeds, dates)
+        results = [
+            sequential.process_disposal("ETH", amount, value, date)
+            for amount, value, date in zip(amounts, proceeds, dates)
+        ]
+        
+        assert len(batch_results) == len(results)
+        for batch_result, result in zip(batch_results, results):
+            assert batch_result.disposal_date == result.disposal_date
+            assert batch_result.total_basis == pytest.approx(result.total_basis)
+            assert batch_result.short_term_gain_loss == pytest.approx(
+                result.short_term_gain_loss
+            )
+            assert batch_result.long_term_gain_loss == pytest.approx(
+                result.long_term_gain_loss
+            )
+            batch_lots = [(lot.lot_id, used) for lot, used in batch_result.matched_lots]
+            lots = [(lot.lot_id, used) for lot, used in result.matched_lots]
+            assert batch_lots == pytest.approx(lots)
+        
+        assert batched.get_queue_summary("ETH") == pytest.approx(
+            sequential.get_queue_summary("ETH")
+        )
+        assert len(batched.disposal_history) == 4
+    
+    def test_process_disposals_inexact_decimals(self):
+        """Test that decimals without an exact float form split no sliver lots."""
+        batched = FIFOManager()
+        sequential = FIFOManager()
+        for manager in (batched, sequential):
+            for amount in (0.1, 0.2, 0.3, 0.7):
+                manager.add_acquisition(
+                    "ETH", amount, 100 * amount, datetime(2023, 1, 1)
+                )
+
+        amounts = [0.1, 0.2, 0.3, 0.3]
+        proceeds = [20.0, 40.0, 60.0, 60.0]
+        dates = [datetime(2024, 3, 1)] * 4
+
+        batch_results = batched.process_disposals("ETH", amounts, proceeds, dates)
+        results = [
+            sequential.process_disposal("ETH", amount, value, date)
+            for amount, value, date in zip(amounts, proceeds, dates)
+        ]
+
+        assert [used for _, used in batch_results[0].matched_lots] == [0.1]
+        assert batch_results[0].total_basis == 10.0
+        assert batch_results == results
+        assert batched.get_queue_summary("ETH") == sequential.get_queue_summary("ETH")
+
+    def test_process_disposals_insufficient_funds(self):
+        """Test that a batch exceeding the lots available is rejected whole."""
+        manager = FIFOManager()
+        manager.add_acquisition("ETH", 1.0, 2000.0, datetime(2024, 1, 1))
+        
+        with pytest.raises(ValueError, match="Insufficient ETH"):
+            manager.process_disposals(
+                "ETH", [0.5, 0.75], [1000.0, 1500.0], [datetime(2024, 2, 1)] * 2
+            )
+        
+        assert manager.get_queue_summary("ETH")["total_amount"] == 1.0
+        assert manager.disposal_history == []
+
     def test_process_disposal_insufficient_funds(self):
         """Test disposal with insufficient funds."""
         manager = FIFOManager()
@@ -416,6 +622,55 @@ class TestFIFOManager:
         assert summary["total_gain_loss"] == 500.0
         assert "ETH" in summary["assets_disposed"]
 
+    def test_get_disposal_summary_many_disposals(self):
+        """Test disposal summary totals across a growing history."""
+        manager = FIFOManager()
+        date = datetime(2024, 1, 15)
+        
+        manager.add_acquisition("ETH", 100.0, 100000.0, date)
+        manager.add_acquisition("BTC", 1.0, 40000.0, date)
+        for _ in range(100):
+            manager.process_disposal("ETH", 1.0, 1500.0, date)
+        manager.process_disposal("BTC", 0.5, 25000.0, date)
+        
+        summary = manager.get_disposal_summary()
+        
+        assert summary["total_disposals"] == 101
+        assert summary["total_proceeds"] == 175000.0
+        assert summary["total_basis"] == 120000.0
+        assert summary["short_term_gain_loss"] == 55000.0
+        assert summary["assets_disposed"] == ["ETH", "BTC"]
+
+    def test_to_arrow(self):
+        """Test exporting the disposal history as an Arrow table."""
+        pa = pytest.importorskip("pyarrow")
+        manager = FIFOManager()
+        
+        manager.add_acquisition("ETH", 2.0, 4000.0, datetime(2023, 1, 1))
+        manager.add_acquisition("BTC", 1.0, 30000.0, datetime(2023, 1, 1))
+        for _ in range(70):
+            manager.process_disposal("BTC", 0.01, 400.0, datetime(2024, 2, 1))
+        manager.process_disposal("ETH", 1.0, 2500.0, datetime(2024, 3, 1, 12, 30))
+        
+        table = manager.to_arrow()
+        
+        assert table.column_names == [
+            "asset", "disposal_date", "proceeds", "basis",
+            "total_gain_loss", "short_term_gl", "long_term_gl",
+        ]
+        assert table.num_rows == 71
+        assert pa.types.is_dictionary(table.schema.field("asset").type)
+        assert table.column("asset").to_pylist()[-2:] == ["BTC", "ETH"]
+        last_date = table.column("disposal_date").to_pylist()[-1]
+        assert last_date == datetime(2024, 3, 1, 12, 30)
+        assert table.column("basis").to_pylist()[-1] == 2000.0
+        assert table.column("long_term_gl").to_pylist()[-1] == 500.0
+        assert pa.compute.sum(table.column("proceeds")).as_py() == pytest.approx(
+            manager.get_disposal_summary()["total_proceeds"]
+        )
+        
+        assert FIFOManager().to_arrow().num_rows == 0
+
     def test_import_2023_year_end_data(self):
         """Test importing 2023 year-end data."""
         manager = FIFOManager()
@@ -444,6 +699,29 @@ class TestFIFOManager:
         assert btc_summary["total_basis"] == 3000.0
         assert btc_summary["lot_count"] == 1
 
+    def test_import_2023_year_end_data_shared_dates(self):
+        """Test year-end lots sharing a date across assets and empty assets."""
+        manager = FIFOManager()
+
+        holdings_data = {
+            "ETH": [
+                {"date": "2023-06-15", "qty": 2.0, "basis": 2000.0},
+                {"date": "2023-12-01", "qty": 1.0, "basis": 2500.0},
+            ],
+            "SOL": [],
+            "BTC": [
+                {"date": "2023-12-01", "qty": 0.1, "basis": 3000.0},
+            ],
+        }
+
+        manager.import_2023_year_end_data(holdings_data)
+
+        assert manager.queues["ETH"].lots[0].lot_id == "2023_ye_ETH_20230615"
+        assert manager.queues["ETH"].lots[1].acquisition_date == datetime(2023, 12, 1)
+        assert manager.queues["BTC"].lots[0].lot_id == "2023_ye_BTC_20231201"
+        assert manager.get_queue_summary("BTC")["total_basis"] == 3000.0
+        assert "SOL" not in manager.queues
+
     def test_process_transactions(self):
         """Test processing transactions from DataFrame."""
         manager = FIFOManager()
@@ -495,6 +773,124 @@ class TestFIFOManager:
         assert usdc_summary["total_amount"] == 100.0
         assert usdc_summary["total_basis"] == 0.0  # Income has $0 basis
 
+    def test_process_transactions_chronological_matching(self):
+        """Test disposals only match earlier lots and failed rows are skipped."""
+        manager = FIFOManager()
+        
+        transactions_data = [
+            {
+                "Type": "Trade",
+                "BuyAmount": 1.0,
+                "BuyCurrency": "ETH",
+                "SellAmount": 0,
+                "SellCurrency": "",
+                "USDEquivalent": 2000.0,
+                "Date": datetime(2024, 1, 15),
+            },
+            {
+                # Sells more ETH than held so far: fails, and its BTC buy with it
+                "Type": "Trade",
+                "BuyAmount": 0.1,
+                "BuyCurrency": "BTC",
+                "SellAmount": 2.0,
+                "SellCurrency": "ETH",
+                "USDEquivalent": 4000.0,
+                "Date": datetime(2024, 2, 15),
+            },
+            {
+                "Type": "Staking",
+                "BuyAmount": 1.0,
+                "BuyCurrency": "ETH",
+                "SellAmount": 0,
+                "SellCurrency": "",
+                "USDEquivalent": 2500.0,
+                "Date": datetime(2024, 3, 15),
+            },
+            {
+                "Type": "Spend",
+                "BuyAmount": 0,
+                "BuyCurrency": "",
+                "SellAmount": 1.5,
+                "SellCurrency": "ETH",
+                "USDEquivalent": 4500.0,
+                "Date": datetime(2024, 4, 15),
+            },
+        ]
+        
+        # Out of order on purpose: processing follows the dates
+        df = pd.DataFrame(transactions_data[::-1])
+        disposal_results = manager.process_transactions(df)
+        
+        assert len(disposal_results) == 1
+        assert disposal_results[0].total_basis == 2000.0  # 1.0 @ 2000 + 0.5 @ $0
+        assert manager.get_queue_summary("BTC")["lot_count"] == 0
+        
+        eth_summary = manager.get_queue_summary("ETH")
+        assert eth_summary["total_amount"] == 0.5
+        assert eth_summary["total_basis"] == 0.0
+
+    def test_process_transactions_same_time_keeps_input_order(self):
+        """Test that transactions with equal dates are processed in input order."""
+        manager = FIFOManager()
+        date = datetime(2024, 1, 15, 12, 0)
+        
+        transactions_data = [
+            {
+                "Type": "Trade",
+                "BuyAmount": 1.0,
+                "BuyCurrency": "ETH",
+                "SellAmount": 0,
+                "SellCurrency": "",
+                "USDEquivalent": 2000.0,
+                "Date": date,
+            },
+            {
+                "Type": "Trade",
+                "BuyAmount": 0,
+                "BuyCurrency": "",
+                "SellAmount": 1.0,
+                "SellCurrency": "ETH",
+                "USDEquivalent": 2100.0,
+                "Date": date,
+            },
+        ] * 20
+        
+        df = pd.DataFrame(transactions_data)
+        disposal_results = manager.process_transactions(df)
+        
+        assert len(disposal_results) == 20
+        assert all(result.total_gain_loss == 100.0 for result in disposal_results)
+        assert manager.get_queue_summary("ETH")["lot_count"] == 0
+
+    def test_process_transactions_missing_currency_is_skipped(self):
+        """Test that a missing currency counts as none, like an empty one."""
+        manager = FIFOManager()
+        
+        df = pd.DataFrame([
+            {
+                "Type": "Trade",
+                "BuyAmount": 1.0,
+                "BuyCurrency": "ETH",
+                "SellAmount": 0,
+                "SellCurrency": "",
+                "USDEquivalent": 2000.0,
+                "Date": datetime(2024, 1, 15),
+            },
+            {
+                "Type": "Trade",
+                "BuyAmount": 1.0,
+                "BuyCurrency": None,
+                "SellAmount": 0.5,
+                "SellCurrency": None,
+                "USDEquivalent": 1000.0,
+                "Date": datetime(2024, 2, 15),
+            },
+        ])
+        
+        assert manager.process_transactions(df) == []
+        assert list(manager.queues) == ["ETH"]
+        assert manager.get_queue_summary("ETH")["total_amount"] == 1.0
+
 
 class TestFIFOManagerIntegration:
     """Integration tests for FIFO manager."""
@@ -521,6 +917,26 @@ class TestFIFOManagerIntegration:
         assert abs(eth_summary["total_amount"] - 0.6) < 0.001  # 1.8 - 1.2
         assert eth_summary["lot_count"] == 2  # 0.3 remaining from lot 2 + lot 3
 
+    def test_disposal_using_up_lots_exactly(self):
+        """Test disposal that ends exactly on a lot boundary."""
+        manager = FIFOManager()
+        
+        manager.add_acquisition("ETH", 1.0, 2000.0, datetime(2023, 1, 15))
+        manager.add_acquisition("ETH", 0.5, 1500.0, datetime(2024, 2, 15))
+        manager.add_acquisition("ETH", 0.3, 1200.0, datetime(2024, 3, 15))
+        
+        result = manager.process_disposal("ETH", 1.5, 4000.0, datetime(2024, 4, 15))
+        
+        assert [used for _, used in result.matched_lots] == [1.0, 0.5]
+        assert result.remaining_amount == 0.0
+        assert result.total_basis == 3500.0
+        assert result.long_term_gain_loss == 4000.0 * (1.0 / 1.5) - 2000.0
+        assert result.short_term_gain_loss == 4000.0 * (0.5 / 1.5) - 1500.0
+        
+        eth_summary = manager.get_queue_summary("ETH")
+        assert eth_summary["lot_count"] == 1
+        assert eth_summary["total_basis"] == 1200.0
+
     def test_income_event_processing(self):
         """Test processing income events with $0 basis."""
         manager = FIFOManager()
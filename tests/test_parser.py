@@ -4,6 +4,7 @@ Tests for the transaction parser module.
 
 import pytest
 import pandas as pd
+from cryptotaxcalc import parser as parser_module
 from cryptotaxcalc.parser import TransactionParser, parse_transaction_file
 
 
@@ -64,6 +65,83 @@ class TestTransactionParser:
             "Repay",
         }
         assert VALID_TRANSACTION_TYPES == expected_types
+        # Immutable, so it can be shared as a module constant
+        assert isinstance(VALID_TRANSACTION_TYPES, frozenset)
+
+    def test_to_numeric(self):
+        """Test numeric conversion of parsed and text amount columns."""
+        from cryptotaxcalc.parser import _to_numeric
+
+        parsed = pd.Series([1.5, None, 3.0])
+        assert _to_numeric(parsed) is parsed
+
+        text = pd.Series(["$1,234.50", "2", "abc", None])
+        result = _to_numeric(text)
+        assert result.dtype == "float64"
+        assert result.tolist()[:2] == [1234.5, 2.0]
+        assert result.isna().tolist()[2:] == [True, True]
+
+    def test_to_datetime(self):
+        """Test parsing of ISO 8601 dates of mixed precision and time zone."""
+        from cryptotaxcalc.parser import _to_datetime
+
+        dates = _to_datetime(pd.Series(["2024-01-15", "2024-01-16 12:30:00", "x"]))
+        assert dates.tolist()[:2] == [
+            pd.Timestamp("2024-01-15"),
+            pd.Timestamp("2024-01-16 12:30:00"),
+        ]
+        assert pd.isna(dates.iloc[2])
+
+        # Naive dates among offset-aware ones are read as UTC
+        dates = _to_datetime(pd.Series(["2024-01-15", "2024-01-16T12:30:00+02:00"]))
+        assert str(dates.dt.tz) == "UTC"
+        assert dates.tolist() == [
+            pd.Timestamp("2024-01-15", tz="UTC"),
+            pd.Timestamp("2024-01-16 10:30:00", tz="UTC"),
+        ]
+
+        # ... also when they follow an offset-aware date
+        dates = _to_datetime(
+            pd.Series(["2024-01-15T10:30:00+02:00", "2024-06-01 00:00:00", None])
+        )
+        assert dates.tolist()[:2] == [
+            pd.Timestamp("2024-01-15 08:30:00", tz="UTC"),
+            pd.Timestamp("2024-06-01", tz="UTC"),
+        ]
+        assert pd.isna(dates.iloc[2])
+
+    def test_in_year(self):
+        """Test the calendar year mask for naive and time zone aware dates."""
+        from cryptotaxcalc.parser import _in_year
+
+        naive = pd.Series(
+            pd.to_datetime(
+                ["2023-12-31 23:59:59", "2024-01-01", "2025-01-01", None],
+                format="ISO8601",
+            )
+        )
+        assert _in_year(naive, 2024).tolist() == [False, True, False, False]
+
+        # Local wall time decides the year, as with dt.year
+        aware = pd.Series(
+            pd.to_datetime(["2023-12-31T23:30:00-05:00", "2024-12-31T23:30:00-05:00"])
+        )
+        assert _in_year(aware, 2024).tolist() == [False, True]
+
+    def test_count_values(self):
+        """Test value counts for text and categorical columns."""
+        from cryptotaxcalc.parser import _count_values
+
+        values = pd.Series(["ETH", "BTC", None, "ETH", "USDC", "BTC", "ETH"])
+        expected = {"ETH": 3, "BTC": 2, "USDC": 1}
+        assert _count_values(values) == expected
+        # Equal counts keep category (sorted) order
+        assert _count_values(values.head(2), 1) == {"BTC": 1}
+
+        # Unobserved categories are not reported
+        categorical = values.astype(pd.CategoricalDtype(["ADA", "BTC", "ETH", "USDC"]))
+        assert _count_values(categorical) == expected
+        assert list(_count_values(categorical, 2)) == ["ETH", "BTC"]
 
     def test_parse_transaction_file_function_exists(self):
         """Test that the convenience function exists and is callable."""
@@ -116,6 +194,130 @@ class TestParserWithSampleData:
                     "missing required columns" in error_msg or
                     "failed to load csv" in error_msg)
 
+    @pytest.mark.parametrize("engine", ["c", "pyarrow"])
+    def test_load_csv_engines(self, engine, sample_csv_data, tmp_path, monkeypatch):
+        """Test that both CSV engines load the same cleaned data."""
+        if engine == "pyarrow":
+            pytest.importorskip("pyarrow")
+        monkeypatch.setattr(parser_module, "CSV_ENGINE", engine)
+        csv_path = tmp_path / "transactions.csv"
+        # Blank comment and a date with a time among plain dates
+        csv_path.write_text(
+            sample_csv_data.replace(",comment4,2024-04-05,", ",,2024-04-05 10:30:00,")
+        )
+
+        df = TransactionParser(enable_2024_filter=False).load_csv(str(csv_path))
+
+        assert len(df) == 4
+        assert df["BuyAmount"].tolist() == [1.5, 0.0, 100.0, 200.0]
+        assert df["Comment"].tolist() == ["comment1", "comment2", "comment3", ""]
+        assert df["Date"].dt.month.tolist() == [1, 2, 3, 4]
+        assert df["Date"].iloc[3] == pd.Timestamp("2024-04-05 10:30:00")
+
+    def test_load_csv_selects_expected_columns(self, sample_csv_data, tmp_path):
+        """Test that extra columns are skipped and columns come out in order."""
+        from cryptotaxcalc.parser import EXPECTED_COLUMNS
+
+        lines = sample_csv_data.splitlines()
+        # Move Type to the end and append an extra column
+        csv_path = tmp_path / "transactions.csv"
+        csv_path.write_text(
+            "\n".join(
+                ",".join(line.split(",")[1:] + [line.split(",")[0], "extra"])
+                for line in lines
+            )
+        )
+
+        df = TransactionParser(enable_2024_filter=False).load_csv(str(csv_path))
+
+        assert list(df.columns) == EXPECTED_COLUMNS
+        assert df["Type"].tolist() == ["Trade", "Trade", "Income", "Trade"]
+
+        csv_path.write_text("\n".join(",".join(line.split(",")[1:]) for line in lines))
+        with pytest.raises(ValueError, match="Missing required columns"):
+            TransactionParser(enable_2024_filter=False).load_csv(str(csv_path))
+
+    def test_categorical_columns(self, temp_csv_file):
+        """Test that low-cardinality columns are categorical after loading."""
+        from cryptotaxcalc.parser import CATEGORICAL_COLUMNS
+
+        parser = TransactionParser(enable_2024_filter=False, dust_threshold=150.0)
+        df = parser.load_csv(temp_csv_file)
+
+        for column in CATEGORICAL_COLUMNS:
+            assert isinstance(df[column].dtype, pd.CategoricalDtype)
+        # The Income row was filtered out as dust and is not counted
+        summary = parser.get_transaction_summary(df)
+        assert summary["transaction_types"] == {"Trade": 3}
+        # ... nor kept as a category, or value_counts() would report it
+        assert list(df["Type"].cat.categories) == ["Trade"]
+
+    def test_load_csv_in_chunks(self, sample_csv_data, tmp_path):
+        """Test that a chunked load matches loading the whole file."""
+        from cryptotaxcalc.parser import CATEGORICAL_COLUMNS
+
+        csv_path = tmp_path / "transactions.csv"
+        csv_path.write_text(
+            sample_csv_data
+            + "\nBogus,1,BTC,0,USD,0,USD,other,tx005,group1,import1,,2024-05-01,500.00,"
+            + "\nBogus,1,BTC,0,USD,0,USD,other,tx006,group1,import1,,2024-05-02,500.00,"
+        )
+
+        whole = TransactionParser(enable_2024_filter=False, dust_threshold=150.0)
+        chunked = TransactionParser(
+            enable_2024_filter=False, dust_threshold=150.0, chunk_size=2
+        )
+        expected = whole.load_csv(str(csv_path))
+        df = chunked.load_csv(str(csv_path))
+
+        pd.testing.assert_frame_equal(df, expected, check_categorical=False)
+        for column in CATEGORICAL_COLUMNS:
+            assert isinstance(df[column].dtype, pd.CategoricalDtype)
+        # The invalid type is reported once for the whole file
+        assert chunked.validation_warnings == whole.validation_warnings
+        assert len(chunked.validation_warnings) == 1
+
+        # With UTC offsets the 2024 filter sees the same (UTC) dates, whatever
+        # the chunk size: the first added row is 2025-01-01 04:30 UTC
+        csv_path.write_text(
+            sample_csv_data
+            + "\nTrade,1,BTC,0,USD,0,USD,test,tx007,group1,import1,,"
+            + "2024-12-31T23:30:00-05:00,500.00,"
+            + "\nTrade,1,BTC,0,USD,0,USD,test,tx008,group1,import1,,"
+            + "2024-06-01T10:00:00+02:00,500.00,"
+            + "\nTrade,1,BTC,0,USD,0,USD,test,tx009,group1,import1,,"
+            + "2024-12-31,500.00,"
+        )
+        expected = TransactionParser().load_csv(str(csv_path))
+        assert expected["ExchangeId"].tolist()[-2:] == ["tx008", "tx009"]
+        assert expected["Date"].tolist()[-2:] == [
+            pd.Timestamp("2024-06-01 08:00:00", tz="UTC"),
+            pd.Timestamp("2024-12-31", tz="UTC"),
+        ]
+        for chunk_size in (1, 2, 3):
+            df = TransactionParser(chunk_size=chunk_size).load_csv(str(csv_path))
+            pd.testing.assert_frame_equal(df, expected, check_categorical=False)
+
+    @pytest.mark.parametrize("suffix", [".csv", ".parquet", ".feather"])
+    def test_save_processed_data(self, suffix, temp_csv_file, tmp_path):
+        """Test that processed data is saved in the format of the file suffix."""
+        parser = TransactionParser(enable_2024_filter=False, dust_threshold=150.0)
+        df = parser.load_csv(temp_csv_file)
+        output_path = tmp_path / f"processed{suffix}"
+
+        if suffix != ".csv":
+            pytest.importorskip("pyarrow")
+        parser.save_processed_data(df, str(output_path))
+
+        if suffix == ".csv":
+            saved_df = pd.read_csv(output_path)
+            assert saved_df["Type"].tolist() == df["Type"].tolist()
+        else:
+            read = pd.read_parquet if suffix == ".parquet" else pd.read_feather
+            saved_df = read(output_path)
+            # Typed formats keep categoricals and dates
+            pd.testing.assert_frame_equal(saved_df, df.reset_index(drop=True))
+
     def test_transaction_summary_structure(self, temp_csv_file):
         """Test that transaction summary has expected structure."""
         parser = TransactionParser(enable_2024_filter=False)
@@ -164,6 +366,51 @@ class TestParserIntegration:
         assert "error" in summary
         assert summary["error"] == "No transactions to analyze"
 
+    def test_summary_date_range(self):
+        """Test that missing dates are skipped and an all-missing range is None."""
+        parser = TransactionParser()
+        df = pd.DataFrame(
+            {
+                "Type": ["Trade", "Trade", "Income"],
+                "Exchange": ["test", "test", "test"],
+                "BuyCurrency": ["BTC", "ETH", "USDC"],
+                "SellCurrency": ["USD", "USD", ""],
+                "Date": pd.to_datetime([None, "2024-03-01", "2024-01-15"], utc=True),
+                "USDEquivalent": [None, None, None],
+            }
+        )
+
+        summary = parser.get_transaction_summary(df)
+        assert summary["date_range"] == {"start": "2024-01-15", "end": "2024-03-01"}
+        assert summary["value_stats"]["total_usd_equivalent"] == 0
+        assert summary["value_stats"]["missing_usd_count"] == 3
+
+        df["Date"] = pd.NaT
+        summary = parser.get_transaction_summary(df)
+        assert summary["date_range"] == {"start": None, "end": None}
+
+    @pytest.mark.parametrize("type_dtype", ["object", "category"])
+    def test_apply_filters(self, type_dtype):
+        """Test that year, dust and type filters combine into one selection."""
+        parser = TransactionParser(dust_threshold=1.0)
+        df = pd.DataFrame(
+            {
+                "Type": ["Trade", "Bogus", "Trade", "Unknown", "Income"],
+                "Date": pd.to_datetime(
+                    ["2024-01-01", "2023-06-01", "2024-02-01", "2024-03-01", None]
+                ),
+                "USDEquivalent": [100.0, 100.0, 0.5, None, 100.0],
+            }
+        ).astype({"Type": type_dtype})
+
+        filtered = parser._apply_filters(df)
+
+        assert filtered.index.tolist() == [0]
+        # Only types of rows passing the other filters are reported
+        assert parser.validation_warnings == [
+            "Invalid transaction types found: ['Unknown']"
+        ]
+
     def test_parser_validation_error_handling(self):
         """Test that parser properly handles validation errors."""
         parser = TransactionParser()
@@ -192,3 +439,30 @@ class TestParserIntegration:
         # This should trigger validation errors
         with pytest.raises(ValueError, match="validation errors"):
             parser._validate_data_quality(invalid_data)
+
+    def test_validation_error_counts(self):
+        """Test that every failed check is reported with its row count."""
+        parser = TransactionParser()
+        invalid_data = pd.DataFrame(
+            {
+                "Type": ["Trade", "", None],
+                "BuyAmount": [-1.0, -2.0, 0.0],
+                "SellAmount": [0.0, 0.0, 0.0],
+                "FeeAmount": [0.0, 0.0, -0.5],
+                "Date": pd.to_datetime(["2024-01-01", None, "2024-01-03"]),
+                "USDEquivalent": [1000.0, None, 10.0],
+            }
+        )
+
+        with pytest.raises(ValueError, match="validation errors"):
+            parser._validate_data_quality(invalid_data)
+
+        assert parser.validation_errors == [
+            "Found 2 transactions with negative BuyAmount",
+            "Found 1 transactions with negative FeeAmount",
+            "Found 1 transactions with missing dates",
+            "Found 2 transactions with missing type",
+        ]
+        assert parser.validation_warnings == [
+            "Found 1 transactions with missing USDEquivalent"
+        ]
@@ -16,6 +16,7 @@ from cryptotaxcalc.tax_logic import (
     TransactionCategory,
     TaxClassification,
     TransactionTypeMapper,
+    ProcessedTransactionTable,
     TaxProcessor,
     create_tax_processor,
 )
@@ -82,6 +83,18 @@ class TestTaxClassification:
         assert classification.basis_adjustment == 0.0
         assert classification.notes == ""
 
+    def test_tax_classification_is_frozen(self):
+        """Test that a tax classification cannot be modified."""
+        classification = TaxClassification(
+            transaction_type="Trade",
+            tax_treatment=TaxTreatment.SHORT_TERM_GAIN,
+            category=TransactionCategory.ACQUISITION,
+            requires_fifo_processing=True,
+        )
+
+        with pytest.raises(AttributeError):
+            classification.tax_treatment = TaxTreatment.LONG_TERM_GAIN
+
 
 class TestTransactionTypeMapper:
     """Test transaction type mapper functionality."""
@@ -94,6 +107,17 @@ class TestTransactionTypeMapper:
         """Test that mapper initializes correctly."""
         assert hasattr(self.mapper, "transaction_mappings")
         assert len(self.mapper.transaction_mappings) > 0
+        assert (
+            TransactionTypeMapper().transaction_mappings
+            is self.mapper.transaction_mappings
+        )
+
+    def test_transaction_mappings_are_read_only(self):
+        """Test that the shared mappings cannot be modified."""
+        with pytest.raises(TypeError):
+            self.mapper.transaction_mappings["Gift"] = {}
+        with pytest.raises(TypeError):
+            self.mapper.transaction_mappings["Trade"]["requires_fifo"] = False
 
     def test_supported_transaction_types(self):
         """Test that all expected transaction types are supported."""
@@ -265,6 +289,60 @@ class TestTransactionTypeMapper:
 
         assert classification.tax_treatment == TaxTreatment.LONG_TERM_LOSS
 
+    def test_classify_batch_holding_period(self):
+        """Test the holding period adjustment in batch classification."""
+        types = ["Trade", "Trade", "Lost", "Lost", "Income", "Spend"]
+        transaction_dates = [datetime(2024, 6, 1)] * 6
+        acquisition_dates = [
+            datetime(2023, 6, 2),  # 365 days
+            datetime(2023, 6, 3),  # 364 days
+            datetime(2022, 1, 1),
+            datetime(2024, 1, 1),
+            datetime(2020, 1, 1),
+            None,
+        ]
+
+        batch = self.mapper.classify_batch(types, transaction_dates, acquisition_dates)
+
+        treatments = [list(TaxTreatment)[code] for code in batch["tax_treatment"]]
+        assert treatments == [
+            TaxTreatment.LONG_TERM_GAIN,
+            TaxTreatment.SHORT_TERM_GAIN,
+            TaxTreatment.LONG_TERM_LOSS,
+            TaxTreatment.SHORT_TERM_LOSS,
+            TaxTreatment.ORDINARY_INCOME,
+            TaxTreatment.SHORT_TERM_GAIN,
+        ]
+        for row, transaction_type in enumerate(types):
+            classification = self.mapper.classify_transaction(
+                transaction_type=transaction_type,
+                transaction_date=transaction_dates[row],
+                acquisition_date=acquisition_dates[row],
+            )
+            assert classification.tax_treatment == treatments[row]
+
+    def test_classifications_are_shared(self):
+        """Test that equal classifications are the same instance."""
+        first = self.mapper.classify_transaction(
+            transaction_type="Trade", transaction_date=datetime(2024, 1, 15)
+        )
+        second = self.mapper.classify_transaction(
+            transaction_type="Trade", transaction_date=datetime(2024, 6, 1)
+        )
+        long_term = self.mapper.classify_transaction(
+            transaction_type="Trade",
+            transaction_date=datetime(2024, 6, 1),
+            acquisition_date=datetime(2020, 1, 1),
+        )
+
+        assert first is second
+        assert long_term.tax_treatment == TaxTreatment.LONG_TERM_GAIN
+        assert long_term is self.mapper.classify_transaction(
+            transaction_type="Trade",
+            transaction_date=datetime(2025, 6, 1),
+            acquisition_date=datetime(2021, 1, 1),
+        )
+
     def test_unsupported_transaction_type(self):
         """Test that unsupported transaction types raise ValueError."""
         with pytest.raises(ValueError, match="Unsupported transaction type"):
@@ -278,6 +356,94 @@ class TestTransactionTypeMapper:
         assert self.mapper.is_supported("Income") is True
         assert self.mapper.is_supported("InvalidType") is False
 
+    def test_classify_batch(self):
+        """Test that batch classification matches per-type classification."""
+        types = pd.Series(["Lost", "Trade", "InvalidType", None, "Staking", "Trade"])
+
+        batch = self.mapper.classify_batch(types)
+
+        assert list(batch["type_code"] >= 0) == [True, True, False, False, True, True]
+        for row, transaction_type in enumerate(types):
+            if not self.mapper.is_supported(transaction_type):
+                assert batch["tax_treatment"][row] == -1
+                assert batch["category"][row] == -1
+                assert not batch["requires_fifo"][row]
+                continue
+            classification = self.mapper.classify_transaction(
+                transaction_type=transaction_type, transaction_date=None
+            )
+            supported_types = self.mapper.get_supported_types()
+            assert supported_types[batch["type_code"][row]] == transaction_type
+            assert list(TaxTreatment)[batch["tax_treatment"][row]] == (
+                classification.tax_treatment
+            )
+            assert list(TransactionCategory)[batch["category"][row]] == (
+                classification.category
+            )
+            assert batch["requires_fifo"][row] == (
+                classification.requires_fifo_processing
+            )
+
+
+class TestProcessedTransactionTable:
+    """Test column-oriented processed transaction storage."""
+
+    def test_extend_keeps_order(self):
+        """Test that batches come back as transaction dicts in insertion order."""
+        mapper = TransactionTypeMapper()
+        table = ProcessedTransactionTable()
+        first = pd.DataFrame(
+            {
+                "Type": ["Income", "Deposit"],
+                "Date": [datetime(2024, 1, 1), datetime(2024, 1, 2)],
+                "USDEquivalent": [10.0, 20.0],
+            },
+            index=[7, 3],
+        )
+        second = pd.DataFrame(
+            {
+                "Type": ["Staking"],
+                "Date": [datetime(2024, 2, 1)],
+                "USDEquivalent": [5.0],
+            }
+        )
+        for frame in (first, second):
+            table.extend(
+                frame,
+                [
+                    mapper.classify_transaction(
+                        transaction_type=t, transaction_date=None
+                    )
+                    for t in frame["Type"]
+                ],
+            )
+
+        assert len(table) == 3
+        assert table[0]["index"] == 7
+        assert table[0]["row_data"] == {
+            "Type": "Income",
+            "Date": pd.Timestamp(2024, 1, 1),
+            "USDEquivalent": 10.0,
+        }
+        assert table[-1]["transaction_type"] == "Staking"
+        assert table[-1]["classification"].tax_treatment == (
+            TaxTreatment.ORDINARY_INCOME
+        )
+        assert [t["date"] for t in table] == list(
+            pd.to_datetime(["2024-01-01", "2024-01-02", "2024-02-01"])
+        )
+        assert list(table.column("usd_equivalent")) == [10.0, 20.0, 5.0]
+        assert table[1:] == [table[1], table[2]]
+        assert [t["index"] for t in table[::-2]] == [0, 7]
+        assert table[5:] == []
+
+        snapshot = table.snapshot()
+        table.clear()
+        assert len(table) == 0
+        assert list(table) == []
+        assert len(snapshot) == 3
+        assert snapshot[1]["transaction_type"] == "Deposit"
+
 
 class TestTaxProcessor:
     """Test tax processor functionality."""
@@ -522,6 +688,88 @@ class TestTaxProcessor:
         assert disposal.total_basis == 20000.0  # Half of original basis
         assert disposal.total_gain_loss == -20000.0  # 0 - 20000 = loss
 
+    def test_process_mixed_transactions(self):
+        """Test that each row is classified by its type, in date order."""
+        base = {
+            "BuyAmount": 0.0,
+            "BuyCurrency": "",
+            "SellAmount": 0.0,
+            "SellCurrency": "",
+            "USDEquivalent": 0.0,
+        }
+        transactions = [
+            {**base, "Type": "Trade", "SellAmount": 0.5, "SellCurrency": "BTC"},
+            {**base, "Type": "Deposit"},
+            {**base, "Type": "Unknown"},
+            {**base, "Type": "Staking", "BuyAmount": 1.0, "BuyCurrency": "BTC"},
+            {**base, "Type": "Deposit"},
+        ]
+        dates = [datetime(2024, 3, 1), datetime(2024, 1, 1), datetime(2024, 2, 1)]
+        dates += [datetime(2024, 2, 15), datetime(2024, 4, 1)]
+        df = pd.DataFrame(transactions).assign(Date=dates)
+        df.index = [10, 11, 12, 13, 14]
+
+        disposal_results = self.processor.process_transactions(df)
+
+        # The staking reward is in the FIFO queue before the later sale
+        assert len(disposal_results) == 1
+        assert disposal_results[0].total_basis == 0.0
+
+        # The unsupported type is skipped
+        processed = self.processor.processed_transactions
+        assert [p["index"] for p in processed] == [11, 13, 10, 14]
+        assert [p["transaction_type"] for p in processed] == [
+            "Deposit",
+            "Staking",
+            "Trade",
+            "Deposit",
+        ]
+        treatments = [p["classification"].tax_treatment for p in processed]
+        assert treatments == [
+            TaxTreatment.NON_TAXABLE,
+            TaxTreatment.ORDINARY_INCOME,
+            TaxTreatment.SHORT_TERM_GAIN,
+            TaxTreatment.NON_TAXABLE,
+        ]
+        assert processed[2]["row_data"]["SellCurrency"] == "BTC"
+
+    def test_process_same_date_transactions_in_input_order(self):
+        """Test that transactions with the same date keep their input order."""
+        dates = [datetime(2024, 1, 1 + i % 3) for i in range(60)]
+        df = pd.DataFrame({"Type": "Deposit", "Date": dates, "USDEquivalent": 0.0})
+
+        self.processor.process_transactions(df)
+
+        processed = [p["index"] for p in self.processor.processed_transactions]
+        assert processed == sorted(range(60), key=lambda i: i % 3)
+
+    def test_process_same_day_disposals(self):
+        """Test same-day disposals around an acquisition and a failed one."""
+        transactions = [
+            ("Trade", 1.0, "BTC", 0.0, "", datetime(2024, 1, 1), 100.0),
+            ("Trade", 0.0, "", 0.5, "BTC", datetime(2024, 6, 1), 80.0),
+            ("Spend", 0.0, "", 0.25, "BTC", datetime(2024, 6, 1), 50.0),
+            ("Staking", 1.0, "BTC", 0.0, "", datetime(2024, 6, 1), 70.0),
+            ("Trade", 0.0, "", 1.0, "BTC", datetime(2024, 6, 1), 300.0),
+            ("Lost", 0.0, "", 5.0, "BTC", datetime(2024, 6, 2), 0.0),
+        ]
+        columns = ["Type", "BuyAmount", "BuyCurrency", "SellAmount", "SellCurrency"]
+        df = pd.DataFrame(transactions, columns=columns + ["Date", "USDEquivalent"])
+
+        disposal_results = self.processor.process_transactions(df)
+
+        # The last sale uses the rest of the bought lot, then the staking lot
+        assert [r.total_basis for r in disposal_results] == [50.0, 25.0, 25.0]
+        assert [r.total_proceeds for r in disposal_results] == [80.0, 50.0, 300.0]
+        assert [len(r.matched_lots) for r in disposal_results] == [1, 1, 2]
+
+        # The loss of more BTC than is held fails and is not recorded
+        processed = self.processor.processed_transactions
+        assert [p["index"] for p in processed] == [0, 1, 2, 3, 4]
+        assert self.processor.fifo_manager.queues["BTC"].get_available_amount() == (
+            pytest.approx(0.25)
+        )
+
     def test_tax_summary_generation(self):
         """Test that tax summary is generated correctly."""
         # Add some acquisitions
@@ -569,6 +817,51 @@ class TestTaxProcessor:
         assert summary["disposal_count"] == 1
         assert summary["net_short_term_gain_loss"] == 5000.0  # 25000 - 20000
 
+    def test_tax_summary_treatment_totals(self):
+        """Test that gains, losses and income are totalled separately."""
+        transactions = [
+            {"Type": "Income", "BuyAmount": 1.0, "USDEquivalent": 100.0},
+            {"Type": "Airdrop", "BuyAmount": 2.0, "USDEquivalent": 0.0},
+            {"Type": "Deposit", "BuyAmount": 1.0, "USDEquivalent": 50.0},
+        ]
+        df = pd.DataFrame(transactions).assign(
+            BuyCurrency="ETH",
+            SellAmount=0.0,
+            SellCurrency="",
+            Date=datetime(2024, 1, 1),
+        )
+        self.processor.process_transactions(df)
+
+        def disposal(short_term: float, long_term: float) -> DisposalResult:
+            return DisposalResult(
+                disposal_amount=1.0,
+                disposal_date=datetime(2024, 6, 1),
+                asset="BTC",
+                matched_lots=[],
+                total_proceeds=0.0,
+                total_basis=0.0,
+                total_gain_loss=short_term + long_term,
+                short_term_gain_loss=short_term,
+                long_term_gain_loss=long_term,
+                remaining_amount=0.0,
+            )
+
+        self.processor._generate_tax_summary(
+            [disposal(100.0, -40.0), disposal(-25.0, 0.0), disposal(0.0, 300.0)]
+        )
+        summary = self.processor.get_tax_summary()
+
+        assert summary["treatment_totals"] == {
+            "short_term_gain": 100.0,
+            "short_term_loss": 25.0,
+            "long_term_gain": 300.0,
+            "long_term_loss": 40.0,
+            "ordinary_income": 100.0,
+        }
+        assert summary["net_short_term_gain_loss"] == 75.0
+        assert summary["net_long_term_gain_loss"] == 260.0
+        assert summary["total_ordinary_income"] == 100.0
+
     def test_reset_functionality(self):
         """Test that reset functionality works correctly."""
         # Add some data